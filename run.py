@@ -1,10 +1,12 @@
 from src import create_app, db
 from src.models import Category, Product, Supplier, Client, Role, User, Payment, Sale, SaleDetail
+from src.utils.schema import upgrade_schema
 
 app = create_app()
 
 with app.app_context():
-    db.create_all()
+    # Crea las tablas que faltan y agrega los índices nuevos a una base existente
+    upgrade_schema()
 
 if __name__ == "__main__":
     app.run(debug=True)
@@ -0,0 +1,234 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import tempfile
+import time
+from sqlalchemy import event
+from src import create_app, db
+from generate_data import PASSWORD, FIRST_NAMES, LAST_NAMES, PRODUCE, generate_database
+
+API = '/fruteria/v1'
+
+def build_scenarios(counts, token):
+    """
+    Define las peticiones de cada escenario. Cada escenario es una función que recibe
+    el número de iteración y un random.Random y devuelve (método, url, cuerpo JSON).
+
+    Returns:
+        list: Tuplas (nombre, estado esperado, función)
+    """
+    auth = {'Authorization': f'Bearer {token}'}
+
+    def pick(rng, key):
+        return rng.randint(1, counts[key])
+
+    def update_client(i, rng):
+        # La ruta exige los campos obligatorios; se reenvía el mismo número de identidad
+        client_id = pick(rng, 'clients')
+        return ('PATCH', f'/clients/{client_id}', {
+            'name': rng.choice(FIRST_NAMES), 'last_name': rng.choice(LAST_NAMES),
+            'identity_card': str(10000000 + client_id), 'phone': '3200000001'})
+
+    return [
+        ('categories.list', 200, lambda i, rng: ('GET', '/categories', None)),
+        ('categories.get', 200, lambda i, rng: ('GET', f'/categories/{pick(rng, "categories")}', None)),
+        ('products.list', 200, lambda i, rng: ('GET', f'/products?limit=50&after={pick(rng, "products") - 1}', None)),
+        ('products.list_fields', 200,
+         lambda i, rng: ('GET', f'/products?limit=50&fields=id,name,price,stock&after={pick(rng, "products") - 1}', None)),
+        ('products.by_category', 200, lambda i, rng: ('GET', f'/products/category/{pick(rng, "categories")}?limit=50', None)),
+        ('products.get', 200, lambda i, rng: ('GET', f'/products/{pick(rng, "products")}', None)),
+        ('products.suggest', 200, lambda i, rng: ('GET', f'/products/suggest?q={rng.choice(PRODUCE)[:3]}&limit=10', None)),
+        ('products.create', 201, lambda i, rng: ('POST', '/products', {
+            'name': f'Producto bench {i}', 'price': 1.5, 'stock': 100,
+            'category_id': pick(rng, 'categories'), 'supplier_id': pick(rng, 'suppliers')})),
+        ('products.update', 200, lambda i, rng: ('PATCH', f'/products/{pick(rng, "products")}',
+                                                 {'price': rng.randint(50, 2500) / 100})),
+        ('products.stock', 200, lambda i, rng: ('PUT', f'/products/{pick(rng, "products")}/stock', {'stock': 1000000})),
+        ('clients.list', 200, lambda i, rng: ('GET', f'/clients?limit=50&after={pick(rng, "clients") - 1}', None)),
+        ('clients.get', 200, lambda i, rng: ('GET', f'/clients/{pick(rng, "clients")}', None)),
+        ('clients.search', 200, lambda i, rng: ('GET', f'/clients/search?q={rng.choice(FIRST_NAMES)[:3]}&limit=10', None)),
+        ('clients.create', 201, lambda i, rng: ('POST', '/clients', {
+            'name': 'Cliente', 'last_name': 'Bench', 'identity_card': str(90000000 + i), 'phone': '3200000000'})),
+        ('clients.update', 200, update_client),
+        ('suppliers.list', 200, lambda i, rng: ('GET', '/suppliers?limit=50', None)),
+        ('suppliers.get', 200, lambda i, rng: ('GET', f'/suppliers/{pick(rng, "suppliers")}', None)),
+        ('suppliers.by_nit', 200, lambda i, rng: ('GET', f'/suppliers/nit/{9000000000 + pick(rng, "suppliers")}', None)),
+        ('suppliers.update', 200, lambda i, rng: ('PATCH', f'/suppliers/{pick(rng, "suppliers")}', {
+            'phone': str(3000000000 + rng.randint(0, 999))})),
+        ('sales.list', 200, lambda i, rng: ('GET', '/sales?limit=50', None)),
+        ('sales.get', 200, lambda i, rng: ('GET', f'/sales/{pick(rng, "sales")}', None)),
+        ('sales.by_client', 200, lambda i, rng: ('GET', f'/clients/{pick(rng, "clients")}/sales', None)),
+        ('sales.create', 201, lambda i, rng: ('POST', '/sales', {
+            'client_id': pick(rng, 'clients'), 'user_id': pick(rng, 'users'), 'payment_id': rng.randint(1, 3),
+            'items': [{'product_id': pick(rng, 'products'), 'quantity': rng.randint(1, 3)} for _ in range(3)]})),
+        ('reports.daily', 200, lambda i, rng: ('GET', '/reports/sales/daily', None)),
+        ('reports.payments', 200, lambda i, rng: ('GET', '/reports/sales/payments', None)),
+        ('reports.sellers', 200, lambda i, rng: ('GET', '/reports/sales/sellers', None)),
+        ('reports.top_products', 200, lambda i, rng: ('GET', '/reports/products/top?limit=10', None)),
+        ('reports.category_revenue', 200, lambda i, rng: ('GET', '/reports/categories/revenue', None)),
+        ('auth.login', 200, lambda i, rng: ('POST', '/auth/login', {'username': 'usuario1', 'password': PASSWORD})),
+        ('auth.me', 200, lambda i, rng: ('GET', '/auth/me', None, auth)),
+    ]
+
+def percentile(sorted_values, fraction):
+    # Percentil por el método del rango más cercano
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def run_scenario(client, statements, build_request, expected_status, requests, warmup, rng):
+    """
+    Ejecuta un escenario y mide latencia y sentencias SQL por petición.
+
+    Returns:
+        dict: Resultados del escenario
+    """
+    latencies = []
+    sql_counts = []
+    errors = 0
+    status_codes = {}
+    for i in range(warmup + requests):
+        spec = build_request(i, rng)
+        method, path, body = spec[:3]
+        headers = spec[3] if len(spec) > 3 else None
+        before = statements[0]
+        start = time.perf_counter()
+        response = client.open(API + path, method=method, json=body, headers=headers)
+        elapsed = time.perf_counter() - start
+        if i < warmup:
+            continue
+        latencies.append(elapsed)
+        sql_counts.append(statements[0] - before)
+        status_codes[response.status_code] = status_codes.get(response.status_code, 0) + 1
+        if response.status_code != expected_status:
+            errors += 1
+
+    latencies.sort()
+    total = sum(latencies)
+    return {
+        'requests': requests,
+        'errors': errors,
+        'status_codes': {str(code): count for code, count in sorted(status_codes.items())},
+        'throughput_rps': requests / total if total else None,
+        'mean_ms': statistics.fmean(latencies) * 1000,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'max_ms': latencies[-1] * 1000,
+        'sql_per_request': statistics.fmean(sql_counts),
+    }
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_results(results, baseline=None):
+    print(f"\n{'escenario':<26}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'SQL/req':>9}{'errores':>9}")
+    for name, result in results['scenarios'].items():
+        line = (f"{name:<26}{result['throughput_rps']:>9.0f}{result['p50_ms']:>9.2f}{result['p95_ms']:>9.2f}"
+                f"{result['p99_ms']:>9.2f}{result['sql_per_request']:>9.1f}{result['errors']:>9}")
+        previous = (baseline or {}).get('scenarios', {}).get(name)
+        if previous:
+            change = (result['p50_ms'] - previous['p50_ms']) / previous['p50_ms'] * 100
+            line += f"   p50 {change:+.0f}%  SQL {result['sql_per_request'] - previous['sql_per_request']:+.1f}"
+        print(line)
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de los endpoints sobre una base SQLite sembrada')
+    parser.add_argument('--categories', type=int, default=20)
+    parser.add_argument('--suppliers', type=int, default=100)
+    parser.add_argument('--products', type=int, default=5000)
+    parser.add_argument('--clients', type=int, default=50000)
+    parser.add_argument('--users', type=int, default=10)
+    parser.add_argument('--years', type=float, default=1, help='Años de historial de ventas')
+    parser.add_argument('--sales-per-day', type=float, default=140)
+    parser.add_argument('--requests', type=int, default=200, help='Peticiones medidas por escenario')
+    parser.add_argument('--warmup', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--only', action='append', help='Ejecuta solo los escenarios con este prefijo (se puede repetir)')
+    parser.add_argument('--hash-method', default='pbkdf2:sha256:1000',
+                        help='Hashing de contraseñas; barato por defecto para medir la API y no el KDF')
+    parser.add_argument('--output', help='Archivo JSON donde guardar los resultados')
+    parser.add_argument('--compare', help='Archivo JSON de una ejecución anterior para comparar')
+    parser.add_argument('--keep', action='store_true', help='No borrar la base de datos temporal')
+    args = parser.parse_args()
+
+    counts = {key: getattr(args, key) for key in ('categories', 'suppliers', 'products', 'clients', 'users')}
+    workdir = tempfile.mkdtemp(prefix='fruteria-bench-')
+    database = os.path.join(workdir, 'bench.db')
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{database}',
+        'PASSWORD_HASH_METHOD': args.hash_method,
+    })
+
+    try:
+        with app.app_context():
+            start = time.perf_counter()
+            inserted = generate_database(counts, args.years, args.sales_per_day, args.seed,
+                                         hash_method=args.hash_method, log=lambda message: None)
+            counts['sales'] = inserted['sales']
+            seed_seconds = time.perf_counter() - start
+        # En modo WAL parte de los datos puede estar todavía en el archivo -wal
+        size = sum(os.path.getsize(path) for path in (database, database + '-wal') if os.path.exists(path))
+        print(f"Base sembrada en {seed_seconds:.1f} s ({size / 1e6:.1f} MB): {database}")
+
+        statements = [0]
+
+        def count_statement(*_):
+            statements[0] += 1
+
+        with app.app_context():
+            event.listen(db.engine, 'before_cursor_execute', count_statement)
+
+        client = app.test_client()
+        login = client.post(f'{API}/auth/login', json={'username': 'usuario1', 'password': PASSWORD})
+        token = login.get_json()['token']
+
+        rng = random.Random(args.seed)
+        scenarios = {}
+        for name, expected_status, build_request in build_scenarios(counts, token):
+            if args.only and not any(name.startswith(prefix) for prefix in args.only):
+                continue
+            scenarios[name] = run_scenario(client, statements, build_request, expected_status,
+                                           args.requests, args.warmup, rng)
+
+        results = {
+            'created_at': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'git_revision': git_revision(),
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'json_provider': app.json.backend,
+            'counts': counts,
+            'seed': args.seed,
+            'seed_seconds': seed_seconds,
+            'requests_per_scenario': args.requests,
+            'scenarios': scenarios,
+        }
+
+        baseline = None
+        if args.compare:
+            with open(args.compare, encoding='utf-8') as file:
+                baseline = json.load(file)
+        print_results(results, baseline)
+
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as file:
+                json.dump(results, file, indent=2)
+            print(f"\nResultados guardados en {args.output}")
+    finally:
+        with app.app_context():
+            db.engine.dispose()
+        if not args.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+import argparse
+import datetime
+import time
+from decimal import Decimal
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from src.utils.json_provider import FastJSONProvider, orjson
+
+def make_catalog(count):
+    """
+    Genera productos como los devuelve Product.to_dict() (precio Decimal).
+    """
+    return [
+        {
+            'id': i,
+            'name': f'Producto {i}',
+            'price': Decimal(f'{i % 997}.{i % 100:02d}'),
+            'stock': i % 500,
+            'category_id': i % 12 + 1,
+            'supplier_id': i % 40 + 1
+        }
+        for i in range(1, count + 1)
+    ]
+
+def make_sales(count, details_per_sale=4):
+    """
+    Genera ventas como las devuelve Sale.to_dict() (fecha datetime, montos Decimal).
+    """
+    start = datetime.datetime(2024, 1, 1, 8, 0, 0)
+    sales = []
+    for i in range(1, count + 1):
+        details = [
+            {
+                'sale_id': i,
+                'product_id': (i * 7 + j) % 1000 + 1,
+                'quantity': j + 1,
+                'price': Decimal('2.50'),
+                'subtotal': Decimal('2.50') * (j + 1)
+            }
+            for j in range(details_per_sale)
+        ]
+        sales.append({
+            'id': i,
+            'date': start + datetime.timedelta(minutes=i),
+            'total': sum(detail['subtotal'] for detail in details),
+            'status': 'completed',
+            'client_id': i % 300 + 1,
+            'user_id': i % 5 + 1,
+            'payment_id': i % 3 + 1,
+            'details': details
+        })
+    return sales
+
+def legacy(value):
+    # Lo que hacían antes los to_dict(): float() para montos e isoformat() para fechas
+    if isinstance(value, dict):
+        return {key: legacy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [legacy(item) for item in value]
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    return value
+
+def main():
+    parser = argparse.ArgumentParser(description='Micro-benchmark de serialización JSON de respuestas')
+    parser.add_argument('--products', type=int, default=20000)
+    parser.add_argument('--sales', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=7)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    default = DefaultJSONProvider(app)
+    encoders = [
+        ('flask default (float/isoformat)', lambda payload: default.dumps(legacy(payload)).encode('utf-8')),
+        ('FastJSONProvider stdlib', FastJSONProvider(app, 'stdlib').dumps_bytes),
+    ]
+    if orjson is not None:
+        encoders.append(('FastJSONProvider orjson', FastJSONProvider(app, 'orjson').dumps_bytes))
+    else:
+        print("orjson no está instalado; se omite")
+
+    payloads = [
+        (f'{args.products} productos', {'data': make_catalog(args.products), 'next_cursor': None}),
+        (f'{args.sales} ventas', {'data': make_sales(args.sales), 'next_cursor': None}),
+    ]
+
+    print(f"{'respuesta':<18}{'codificador':<34}{'ms':>9}{'MB/s':>9}{'vs default':>12}")
+    for payload_label, payload in payloads:
+        # Rondas alternadas; se toma el mejor tiempo de cada codificador
+        best = {}
+        size = {}
+        for _ in range(args.repeat):
+            for label, encode in encoders:
+                start = time.perf_counter()
+                body = encode(payload)
+                elapsed = time.perf_counter() - start
+                best[label] = min(elapsed, best.get(label, elapsed))
+                size[label] = len(body)
+        baseline = best[encoders[0][0]]
+        for label, _ in encoders:
+            print(f"{payload_label:<18}{label:<34}{best[label] * 1000:>9.1f}"
+                  f"{size[label] / best[label] / 1e6:>9.1f}{baseline / best[label]:>11.2f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from werkzeug.security import generate_password_hash, check_password_hash
+
+DEFAULT_METHODS = ['scrypt', 'scrypt:16384:8:1', 'pbkdf2:sha256:600000', 'pbkdf2:sha256:260000']
+
+def bench_method(method, rounds, workers):
+    """
+    Mide la verificación de contraseñas (lo que cuesta un login) para un método.
+    
+    Returns:
+        dict: Tiempo por verificación, logins por segundo por núcleo y con todos los hilos
+    """
+    password = 'Fruteria2024'
+    stored_hash = generate_password_hash(password, method=method)
+    
+    start = time.perf_counter()
+    for _ in range(rounds):
+        check_password_hash(stored_hash, password)
+    single = (time.perf_counter() - start) / rounds
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        start = time.perf_counter()
+        list(executor.map(lambda _: check_password_hash(stored_hash, password), range(rounds * workers)))
+        parallel = (time.perf_counter() - start) / (rounds * workers)
+    
+    return {
+        'method': stored_hash.split('$', 1)[0],
+        'ms_per_login': single * 1000,
+        'logins_per_sec_per_core': 1 / single,
+        'logins_per_sec_total': 1 / parallel,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Micro-benchmark de hashing de contraseñas')
+    parser.add_argument('--rounds', type=int, default=20)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2)
+    parser.add_argument('--method', action='append', help='Método de werkzeug (se puede repetir)')
+    args = parser.parse_args()
+    
+    print(f"{'method':<28}{'ms/login':>10}{'login/s/core':>14}{'login/s (' + str(args.workers) + ' hilos)':>20}")
+    for method in args.method or DEFAULT_METHODS:
+        result = bench_method(method, args.rounds, args.workers)
+        print(f"{result['method']:<28}{result['ms_per_login']:>10.1f}"
+              f"{result['logins_per_sec_per_core']:>14.1f}{result['logins_per_sec_total']:>20.1f}")
+
+if __name__ == '__main__':
+    main()
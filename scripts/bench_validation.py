@@ -0,0 +1,97 @@
+import argparse
+import time
+from werkzeug.exceptions import BadRequest
+from src.utils.validations import (
+    CLIENT_SCHEMA,
+    validate_string_field,
+    validate_phone,
+    validate_email,
+    validate_identity_card,
+    validate_address
+)
+
+def make_records(count, invalid_every):
+    """
+    Genera clientes de prueba; uno de cada invalid_every tiene dos campos inválidos.
+
+    Returns:
+        list: Registros como los recibe la importación
+    """
+    records = []
+    for i in range(count):
+        record = {
+            'name': f'Cliente {i}',
+            'last_name': 'Pérez',
+            'identity_card': str(10000000 + i),
+            'phone': str(3000000000 + i)[:10],
+            'email': f'cliente{i}@fruteria.com',
+            'address': f'Calle {i % 200} # {i % 50}-10'
+        }
+        if invalid_every and i % invalid_every == 0:
+            record['phone'] = 'sin telefono'
+            record['email'] = 'sin-arroba'
+        records.append(record)
+    return records
+
+def validate_with_functions(record):
+    # Cadena de validaciones campo por campo, como la usaban los servicios
+    validate_string_field(record.get('name'), 'Name')
+    validate_string_field(record.get('last_name'), 'Last name')
+    validate_phone(record.get('phone'))
+    validate_identity_card(record.get('identity_card'))
+    validate_email(record.get('email'), required=False)
+    validate_address(record.get('address'), required=False)
+
+def run_functions(records):
+    invalid = 0
+    for record in records:
+        try:
+            validate_with_functions(record)
+        except BadRequest:
+            invalid += 1
+    return invalid
+
+def run_schema(records):
+    invalid = 0
+    for record in records:
+        try:
+            CLIENT_SCHEMA.validate(record)
+        except BadRequest:
+            invalid += 1
+    return invalid
+
+def run_schema_many(records):
+    return len(CLIENT_SCHEMA.validate_many(records))
+
+def main():
+    parser = argparse.ArgumentParser(description='Micro-benchmark de validación de clientes')
+    parser.add_argument('--records', type=int, default=100000)
+    parser.add_argument('--invalid-every', type=int, default=20, help='0 para que todos sean válidos')
+    parser.add_argument('--repeat', type=int, default=7)
+    args = parser.parse_args()
+
+    records = make_records(args.records, args.invalid_every)
+    runners = [
+        ('validate_* campo por campo', run_functions),
+        ('CLIENT_SCHEMA.validate', run_schema),
+        ('CLIENT_SCHEMA.validate_many', run_schema_many),
+    ]
+    # Se alternan los validadores en cada ronda y se toma el mejor tiempo de cada uno,
+    # para que el ruido de la máquina afecte a todos por igual
+    best = {}
+    invalid = {}
+    for _ in range(args.repeat):
+        for label, function in runners:
+            start = time.perf_counter()
+            invalid[label] = function(records)
+            elapsed = time.perf_counter() - start
+            best[label] = min(elapsed, best.get(label, elapsed))
+
+    print(f"{'validador':<34}{'ms':>10}{'ns/reg':>12}{'inválidos':>10}{'vs funciones':>14}")
+    baseline = best[runners[0][0]]
+    for label, _ in runners:
+        print(f"{label:<34}{best[label] * 1000:>10.1f}{best[label] * 1e9 / len(records):>12.0f}"
+              f"{invalid[label]:>10}{baseline / best[label]:>13.2f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,409 @@
+import argparse
+import bisect
+import datetime
+import itertools
+import os
+import random
+import time
+import unicodedata
+from decimal import Decimal
+from sqlalchemy import func, select, text
+from werkzeug.security import generate_password_hash
+from src import create_app, db
+from src.models import Category, Supplier, Product, Client, Role, User, Payment, Sale, SaleDetail
+from src.utils.schema import upgrade_schema, drop_client_search
+from src.services.report_service import rebuild_daily_sales_summary
+
+PASSWORD = 'Fruteria2024'
+INSERT_BATCH_SIZE = 5000              # Filas por executemany
+TRANSACTION_ROWS = 500000             # Filas por transacción en las tablas grandes
+
+ROLES = [
+    {'name': 'admin', 'description': 'Administrador del sistema'},
+    {'name': 'seller', 'description': 'Vendedor'},
+]
+PAYMENTS = [
+    {'name': 'Efectivo', 'description': 'Pago en efectivo'},
+    {'name': 'Tarjeta', 'description': 'Pago con tarjeta de crédito/débito'},
+    {'name': 'Transferencia', 'description': 'Transferencia bancaria'},
+]
+# Peso relativo de cada medio de pago en las ventas generadas
+PAYMENT_WEIGHTS = [55, 30, 15]
+CATEGORIES = ['Frutas', 'Verduras', 'Tuberculos', 'Legumbres', 'Hortalizas de hoja', 'Hierbas aromáticas',
+              'Frutos secos', 'Granos', 'Lácteos', 'Huevos', 'Orgánicos', 'Importados']
+
+FIRST_NAMES = ['Juan', 'María', 'José', 'Ana', 'Luis', 'Carmen', 'Carlos', 'Lucía', 'Andrés', 'Sofía',
+               'Pedro', 'Camila', 'Jorge', 'Valentina', 'Diego', 'Daniela', 'Miguel', 'Laura']
+LAST_NAMES = ['Pérez', 'Gómez', 'Rodríguez', 'López', 'Martínez', 'García', 'Díaz', 'Torres',
+              'Ramírez', 'Vargas', 'Castro', 'Moreno', 'Rojas', 'Ortiz']
+PRODUCE = ['Manzana', 'Pera', 'Banano', 'Mango', 'Fresa', 'Uva', 'Naranja', 'Limón', 'Papaya', 'Piña',
+           'Tomate', 'Cebolla', 'Papa', 'Zanahoria', 'Lechuga', 'Aguacate', 'Maracuyá', 'Guayaba']
+VARIETIES = ['roja', 'verde', 'criolla', 'orgánica', 'premium', 'de temporada', 'importada', 'pequeña']
+SUPPLIER_KINDS = ['Distribuidora', 'Agrícola', 'Cultivos', 'Granja', 'Comercializadora', 'Cosechas']
+STREETS = ['Calle', 'Carrera', 'Avenida', 'Transversal', 'Diagonal']
+
+# Afluencia relativa por día de la semana (lunes = 0) y por mes (enero = 1)
+WEEKDAY_FACTORS = [0.85, 0.8, 0.9, 0.95, 1.15, 1.45, 0.9]
+MONTH_FACTORS = [0.9, 0.85, 0.95, 1.0, 1.0, 1.05, 1.05, 1.0, 0.95, 1.0, 1.1, 1.3]
+# Horas de atención (7:00 a 19:59) con más ventas a media mañana y al final de la tarde
+HOURS = list(range(7, 20))
+HOUR_WEIGHTS = [3, 6, 9, 10, 8, 6, 5, 5, 6, 8, 9, 7, 4]
+CANCELLED_RATE = 0.02
+
+DEFAULT_COUNTS = {
+    'categories': len(CATEGORIES),
+    'suppliers': 200,
+    'products': 5000,
+    'clients': 100000,
+    'users': 25,
+}
+
+def _ascii(value):
+    # Los correos se generan sin tildes a partir de los nombres
+    return unicodedata.normalize('NFKD', value).encode('ascii', 'ignore').decode('ascii').lower()
+
+def _address(rng):
+    return (f'{rng.choice(STREETS)} {rng.randint(1, 180)} # {rng.randint(1, 99)}-{rng.randint(1, 99)}')
+
+def insert_rows(engine, table, rows, batch_size=INSERT_BATCH_SIZE, transaction_rows=TRANSACTION_ROWS):
+    """
+    Inserta filas con executemany por lotes, confirmando cada transaction_rows filas.
+
+    Las filas se consumen de forma perezosa, así que pueden venir de un generador sin
+    tener toda la tabla en memoria.
+
+    Args:
+        engine: Engine de SQLAlchemy
+        table: Tabla (Model.__table__)
+        rows: Iterable de diccionarios columna -> valor
+        batch_size: Filas por sentencia executemany
+        transaction_rows: Filas por transacción
+
+    Returns:
+        int: Cantidad de filas insertadas
+    """
+    statement = table.insert()
+    rows = iter(rows)
+    total = 0
+    while True:
+        inserted = 0
+        with engine.begin() as connection:
+            while inserted < transaction_rows:
+                batch = list(itertools.islice(rows, batch_size))
+                if not batch:
+                    break
+                connection.execute(statement, batch)
+                inserted += len(batch)
+        total += inserted
+        if inserted < transaction_rows:
+            return total
+
+def insert_reference_data(engine, categories):
+    """
+    Inserta roles, medios de pago y categorías.
+
+    Args:
+        engine: Engine de SQLAlchemy
+        categories: Cantidad de categorías; las primeras usan los nombres de CATEGORIES
+    """
+    names = CATEGORIES[:categories] + [f'Categoría {i}' for i in range(len(CATEGORIES) + 1, categories + 1)]
+    with engine.begin() as connection:
+        connection.execute(Role.__table__.insert(), ROLES)
+        connection.execute(Payment.__table__.insert(), PAYMENTS)
+        connection.execute(Category.__table__.insert(), [{'name': name} for name in names])
+
+def generate_suppliers(rng, count):
+    """
+    Genera proveedores con nombre y NIT únicos (el NIT es 9000000000 + id).
+    """
+    for i in range(1, count + 1):
+        kind = rng.choice(SUPPLIER_KINDS)
+        owner = rng.choice(LAST_NAMES)
+        yield {
+            'name': f'{kind} {owner} {i}',
+            'phone': str(3000000000 + i),
+            'email': f'ventas{i}@{_ascii(kind)}{_ascii(owner)}.com',
+            'address': _address(rng),
+            'nit': str(9000000000 + i),
+        }
+
+def generate_products(rng, count, categories, suppliers, prices):
+    """
+    Genera productos con nombre único y precio entre 0.50 y 60.00.
+
+    Args:
+        prices: Diccionario que se llena con {product_id: precio} para generar las ventas
+    """
+    for i in range(1, count + 1):
+        # Distribución log-uniforme: muchos productos baratos y pocos caros
+        price = Decimal(round(50 * 120 ** rng.random())) / 100
+        prices[i] = price
+        yield {
+            'name': f'{rng.choice(PRODUCE)} {rng.choice(VARIETIES)} {i}',
+            'price': price,
+            'stock': rng.randint(0, 500),
+            'category_id': rng.randint(1, categories),
+            'supplier_id': rng.randint(1, suppliers),
+        }
+
+def generate_clients(rng, count, start, end):
+    """
+    Genera clientes; la cédula es 10000000 + id y el teléfono 3100000000 + id.
+
+    Args:
+        start: Fecha de registro más antigua
+        end: Fecha de registro más reciente
+    """
+    span = max(1, int((end - start).total_seconds()))
+    # Fechas de registro crecientes con el id, como en una base real
+    step = span / max(1, count)
+    for i in range(1, count + 1):
+        name = rng.choice(FIRST_NAMES)
+        last_name = rng.choice(LAST_NAMES)
+        yield {
+            'name': name,
+            'last_name': f'{last_name} {rng.choice(LAST_NAMES)}',
+            'identity_card': str(10000000 + i),
+            'phone': str(3100000000 + i),
+            'email': f'{_ascii(name)}.{_ascii(last_name)}{i}@correo.com',
+            'address': _address(rng),
+            'registration_date': start + datetime.timedelta(seconds=int((i - 1) * step + rng.random() * step)),
+        }
+
+def generate_users(count, password_hash):
+    """
+    Genera usuarios usuario1..usuarioN con la misma contraseña; usuario1 es administrador.
+    """
+    for i in range(1, count + 1):
+        yield {
+            'username': f'usuario{i}',
+            'password': password_hash,
+            'name': FIRST_NAMES[i % len(FIRST_NAMES)],
+            'last_name': LAST_NAMES[i % len(LAST_NAMES)],
+            'email': f'usuario{i}@fruteria.com',
+            'is_active': True,
+            'role_id': 1 if i == 1 else 2,
+        }
+
+def insert_sales(engine, rng, prices, clients, users, start, end, sales_per_day,
+                 batch_size=INSERT_BATCH_SIZE, transaction_rows=TRANSACTION_ROWS):
+    """
+    Genera e inserta las ventas día por día entre start y end, con sus detalles.
+
+    La cantidad de ventas de cada día depende del día de la semana y del mes. Los
+    productos se eligen con una distribución de Zipf (pocos productos concentran la
+    mayoría de las ventas) y los ids de venta crecen con la fecha.
+
+    Args:
+        engine: Engine de SQLAlchemy
+        rng: random.Random con semilla fija
+        prices: {product_id: precio}
+        clients: Cantidad de clientes
+        users: Cantidad de usuarios (vendedores)
+        start: Primer día (date)
+        end: Último día (date), incluido
+        sales_per_day: Promedio de ventas por día
+
+    Returns:
+        tuple: (ventas insertadas, detalles insertados)
+    """
+    product_ids = list(prices)
+    rng.shuffle(product_ids)
+    # Pesos acumulados de Zipf sobre un orden aleatorio de productos
+    product_weights = list(itertools.accumulate(1 / rank for rank in range(1, len(product_ids) + 1)))
+    payment_weights = list(itertools.accumulate(PAYMENT_WEIGHTS))
+    hour_weights = list(itertools.accumulate(HOUR_WEIGHTS))
+    sales_statement = Sale.__table__.insert()
+    details_statement = SaleDetail.__table__.insert()
+    # En el bucle interno se usa rng.random() directamente: randint() y choices()
+    # cuestan varias veces más y son la mayor parte del tiempo de generación
+    uniform = rng.random
+    last_index = len(product_ids) - 1
+
+    sale_id = 0
+    total_details = 0
+    sales = []
+    details = []
+    connection = engine.connect()
+    transaction = connection.begin()
+    pending = 0
+    try:
+        day = start
+        while day <= end:
+            expected = sales_per_day * WEEKDAY_FACTORS[day.weekday()] * MONTH_FACTORS[day.month - 1]
+            count = max(0, round(rng.gauss(expected, expected * 0.1)))
+            hours = rng.choices(HOURS, cum_weights=hour_weights, k=count)
+            moments = sorted(hour * 3600 + int(uniform() * 3600) for hour in hours)
+            midnight = datetime.datetime.combine(day, datetime.time())
+            for second in moments:
+                sale_id += 1
+                total = Decimal('0')
+                # Un producto repetido se suma a la misma línea (la clave es venta + producto)
+                quantities = {}
+                for _ in range(int(uniform() * 6) + 1):
+                    index = bisect.bisect(product_weights, uniform() * product_weights[-1])
+                    product_id = product_ids[min(index, last_index)]
+                    quantities[product_id] = quantities.get(product_id, 0) + int(uniform() * 5) + 1
+                for product_id, quantity in quantities.items():
+                    price = prices[product_id]
+                    subtotal = price * quantity
+                    total += subtotal
+                    details.append({'sale_id': sale_id, 'product_id': product_id, 'quantity': quantity,
+                                    'price': price, 'subtotal': subtotal})
+                sales.append({
+                    'sale_id': sale_id,
+                    'date': midnight + datetime.timedelta(seconds=second),
+                    'total': total,
+                    'status': 'cancelled' if uniform() < CANCELLED_RATE else 'completed',
+                    'client_id': int(uniform() * clients) + 1,
+                    'user_id': int(uniform() * users) + 1,
+                    'payment_id': bisect.bisect(payment_weights, uniform() * payment_weights[-1]) + 1,
+                })
+                if len(sales) >= batch_size:
+                    connection.execute(sales_statement, sales)
+                    connection.execute(details_statement, details)
+                    pending += len(sales) + len(details)
+                    total_details += len(details)
+                    sales, details = [], []
+                    if pending >= transaction_rows:
+                        transaction.commit()
+                        transaction = connection.begin()
+                        pending = 0
+            day += datetime.timedelta(days=1)
+        if sales:
+            connection.execute(sales_statement, sales)
+            connection.execute(details_statement, details)
+            total_details += len(details)
+        transaction.commit()
+    except Exception:
+        transaction.rollback()
+        raise
+    finally:
+        connection.close()
+    return sale_id, total_details
+
+def generate_database(counts, years, sales_per_day, seed, end_date=None, password=PASSWORD,
+                      hash_method='scrypt', log=print):
+    """
+    Llena la base de datos configurada, que debe estar vacía, con datos sintéticos.
+
+    Con la misma semilla, las mismas cantidades y la misma fecha final se obtiene
+    exactamente la misma base. Las tablas se crean con db.create_all(); los índices
+    adicionales y el índice de búsqueda de clientes se crean al final con
+    upgrade_schema(), que es más rápido que mantenerlos durante la carga.
+
+    Debe llamarse dentro de un contexto de aplicación.
+
+    Args:
+        counts: Diccionario con categories, suppliers, products, clients y users
+        years: Años de historial de ventas
+        sales_per_day: Promedio de ventas por día
+        seed: Semilla del generador aleatorio
+        end_date: Último día con ventas (date); por defecto hoy
+        password: Contraseña de los usuarios generados
+        hash_method: Método de hashing de la contraseña
+        log: Función que recibe los mensajes de avance
+
+    Returns:
+        dict: Filas insertadas por tabla
+    """
+    rng = random.Random(seed)
+    end = end_date or datetime.date.today()
+    start = end - datetime.timedelta(days=round(years * 365) - 1)
+    engine = db.engine
+    inserted = {}
+
+    db.create_all()
+    with engine.connect() as connection:
+        if connection.execute(select(func.count()).select_from(Sale.__table__)).scalar() or \
+                connection.execute(select(func.count()).select_from(Client.__table__)).scalar():
+            raise RuntimeError("The database already has data; generate into an empty database")
+    # El índice de búsqueda de clientes se crea al final, en una sola pasada
+    with engine.begin() as connection:
+        drop_client_search(connection)
+
+    def step(name, function, *args):
+        began = time.perf_counter()
+        result = function(*args)
+        log(f"{name}: {result} en {time.perf_counter() - began:.1f} s")
+        return result
+
+    insert_reference_data(engine, counts['categories'])
+    inserted['suppliers'] = step('Proveedores', insert_rows, engine, Supplier.__table__,
+                                 generate_suppliers(rng, counts['suppliers']))
+    prices = {}
+    inserted['products'] = step('Productos', insert_rows, engine, Product.__table__,
+                                generate_products(rng, counts['products'], counts['categories'],
+                                                  counts['suppliers'], prices))
+    password_hash = generate_password_hash(password, method=hash_method)
+    inserted['users'] = step('Usuarios', insert_rows, engine, User.__table__,
+                             generate_users(counts['users'], password_hash))
+    # Los clientes se registran desde un año antes de la primera venta
+    registered_from = datetime.datetime.combine(start - datetime.timedelta(days=365), datetime.time())
+    inserted['clients'] = step('Clientes', insert_rows, engine, Client.__table__,
+                               generate_clients(rng, counts['clients'], registered_from,
+                                                datetime.datetime.combine(end, datetime.time())))
+    inserted['sales'], inserted['sale_details'] = step(
+        'Ventas y detalles', insert_sales, engine, rng, prices, counts['clients'], counts['users'],
+        start, end, sales_per_day)
+
+    step('Resumen diario', rebuild_daily_sales_summary)
+    step('Índices y búsqueda', upgrade_schema, True)
+    return inserted
+
+def database_path(app):
+    uri = app.config['SQLALCHEMY_DATABASE_URI']
+    return uri[len('sqlite:///'):] if uri.startswith('sqlite:///') else None
+
+def main():
+    parser = argparse.ArgumentParser(description='Genera una base de datos con datos sintéticos reproducibles')
+    parser.add_argument('--database', help='Archivo SQLite de destino (por defecto el configurado)')
+    parser.add_argument('--overwrite', action='store_true', help='Borra el archivo de destino si ya existe')
+    parser.add_argument('--categories', type=int, default=DEFAULT_COUNTS['categories'])
+    parser.add_argument('--suppliers', type=int, default=DEFAULT_COUNTS['suppliers'])
+    parser.add_argument('--products', type=int, default=DEFAULT_COUNTS['products'])
+    parser.add_argument('--clients', type=int, default=DEFAULT_COUNTS['clients'])
+    parser.add_argument('--users', type=int, default=DEFAULT_COUNTS['users'])
+    parser.add_argument('--years', type=float, default=3, help='Años de historial de ventas')
+    parser.add_argument('--sales-per-day', type=float, default=300)
+    parser.add_argument('--end-date', type=datetime.date.fromisoformat,
+                        help='Último día con ventas (AAAA-MM-DD); por defecto hoy')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--password', default=PASSWORD, help='Contraseña de usuario1..usuarioN')
+    parser.add_argument('--hash-method', default=None,
+                        help='Hashing de contraseñas; por defecto PASSWORD_HASH_METHOD de la configuración')
+    args = parser.parse_args()
+
+    overrides = {
+        # La base se regenera desde cero si la carga se interrumpe, así que no hace
+        # falta esperar al disco en cada confirmación
+        'SQLITE_SYNCHRONOUS': 'OFF',
+        # Los lotes de la carga superan cualquier umbral razonable de sentencia lenta
+        'SLOW_QUERY_THRESHOLD_MS': 0,
+    }
+    if args.database:
+        overrides['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{os.path.abspath(args.database)}'
+    app = create_app(overrides)
+    path = database_path(app)
+    if path and os.path.exists(path):
+        if not args.overwrite:
+            parser.error(f"{path} already exists; use --overwrite to replace it")
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+    counts = {key: getattr(args, key) for key in DEFAULT_COUNTS}
+    start = time.perf_counter()
+    with app.app_context():
+        inserted = generate_database(counts, args.years, args.sales_per_day, args.seed, args.end_date,
+                                     args.password, args.hash_method or app.config['PASSWORD_HASH_METHOD'])
+        with db.engine.connect() as connection:
+            connection.execute(text('PRAGMA wal_checkpoint(TRUNCATE)'))
+        db.engine.dispose()
+
+    size = os.path.getsize(path) / 1e6 if path else 0
+    print(f"Listo en {time.perf_counter() - start:.1f} s ({size:.1f} MB): "
+          + ", ".join(f"{table}={rows}" for table, rows in inserted.items()))
+
+if __name__ == '__main__':
+    main()
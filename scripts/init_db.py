@@ -1,69 +1,51 @@
+from werkzeug.security import generate_password_hash
 from src import create_app, db
-from src.models import Category, Product, Supplier, Role, User, Payment
-from datetime import datetime
+from src.models import Supplier, User
+from src.utils.schema import upgrade_schema
+from generate_data import insert_reference_data, CATEGORIES
 
 def init_db():
     app = create_app()
-    
+
     with app.app_context():
         db.drop_all()
         db.create_all()
-        # Crear roles
-        admin_role = Role(name='admin', description='Administrador del sistema')
-        seller_role = Role(name='seller', description='Vendedor')
-        db.session.add_all([admin_role, seller_role])
-        
-        # Crear usuario administrador
-        admin = User(
-            username='admin',
-            password='admin123',  # En producción, esto debería estar hasheado
-            name='Admin',
-            last_name='System',
-            email='admin@fruteria.com',
-            role=admin_role
-        )
-        db.session.add(admin)
-        
-        # Crear categorías
-        categories = [
-            Category(name='Frutas'),
-            Category(name='Verduras'),
-            Category(name='Tuberculos'),
-            Category(name='Legumbres')
-        ]
-        db.session.add_all(categories)
-        
-        # Crear proveedores
-        suppliers = [
-            Supplier(
-                name='Proveedor A',
-                contact_name='Juan Pérez',
-                phone='1234567890',
-                email='juan@proveedora.com',
-                address='Calle 1 #2-3'
-            ),
-            Supplier(
-                name='Proveedor B',
-                contact_name='María López',
-                phone='0987654321',
-                email='maria@proveedorb.com',
-                address='Calle 4 #5-6'
-            )
-        ]
-        db.session.add_all(suppliers)
-        
-        # Crear métodos de pago
-        payments = [
-            Payment(name='Efectivo', description='Pago en efectivo'),
-            Payment(name='Tarjeta', description='Pago con tarjeta de crédito/débito'),
-            Payment(name='Transferencia', description='Transferencia bancaria')
-        ]
-        db.session.add_all(payments)
-        
-        # Guardar todos los cambios
-        db.session.commit()
-        
+        # Roles, medios de pago y categorías
+        insert_reference_data(db.engine, len(CATEGORIES))
+
+        with db.engine.begin() as connection:
+            # Usuario administrador (rol 1); la contraseña se guarda con el hash configurado
+            connection.execute(User.__table__.insert(), {
+                'username': 'admin',
+                'password': generate_password_hash('admin123', method=app.config['PASSWORD_HASH_METHOD']),
+                'name': 'Admin',
+                'last_name': 'System',
+                'email': 'admin@fruteria.com',
+                'role_id': 1
+            })
+
+            connection.execute(Supplier.__table__.insert(), [
+                {
+                    'name': 'Proveedor A',
+                    'phone': '1234567890',
+                    'email': 'juan@proveedora.com',
+                    'address': 'Calle 1 #2-3',
+                    'nit': '9001234567'
+                },
+                {
+                    'name': 'Proveedor B',
+                    'phone': '0987654321',
+                    'email': 'maria@proveedorb.com',
+                    'address': 'Calle 4 #5-6',
+                    'nit': '9007654321'
+                }
+            ])
+
+        # Índices adicionales y búsqueda de clientes
+        upgrade_schema()
+
         print("Base de datos inicializada con éxito!")
+        print("Para cargar datos de prueba masivos use scripts/generate_data.py")
 
 if __name__ == '__main__':
-    init_db() 
\ No newline at end of file
+    init_db()
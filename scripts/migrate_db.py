@@ -0,0 +1,29 @@
+import sys
+from src import create_app, db
+from src.utils.schema import upgrade_schema, check_lookup_plans
+
+def migrate_db(check=True):
+    app = create_app()
+    
+    with app.app_context():
+        # Crea tablas e índices nuevos sin borrar los datos existentes y actualiza las
+        # estadísticas del planificador
+        created = upgrade_schema(analyze=True)
+        if created:
+            print("Indices creados: " + ", ".join(created))
+        else:
+            print("No hay indices nuevos")
+        
+        if not check:
+            return True
+        
+        ok = True
+        with db.engine.connect() as connection:
+            for description, index_name, plan, uses_index in check_lookup_plans(connection):
+                status = 'OK' if uses_index else 'FALLA'
+                print(f"[{status}] {description}: {' | '.join(plan)}")
+                ok = ok and uses_index
+        return ok
+
+if __name__ == '__main__':
+    sys.exit(0 if migrate_db(check='--no-check' not in sys.argv) else 1)
@@ -0,0 +1,15 @@
+from src import create_app
+from src.utils.schema import upgrade_schema
+from src.services.report_service import rebuild_daily_sales_summary
+
+def rebuild_sales_summary():
+    app = create_app()
+    
+    with app.app_context():
+        # La tabla de resumen puede no existir en bases creadas antes de los reportes
+        upgrade_schema()
+        rows = rebuild_daily_sales_summary()
+        print(f"Resumen diario reconstruido: {rows} filas")
+
+if __name__ == '__main__':
+    rebuild_sales_summary()
@@ -8,4 +8,8 @@ setup(
         'flask',
         'flask-sqlalchemy',
     ],
+    extras_require={
+        # Serialización JSON más rápida; sin él se usa el módulo json estándar
+        'fast-json': ['orjson'],
+    },
 ) 
\ No newline at end of file
@@ -1,24 +1,53 @@
 import os
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
+from src.config import load_config, configure_engine
+from src.utils.json_provider import FastJSONProvider
+from src.utils.metrics import init_metrics, instrument_engine
+from src.utils.slow_queries import init_slow_query_log
+from src.utils.lazy_loads import init_lazy_load_detector
 
 db = SQLAlchemy()
 
-def create_app():
+def create_app(config=None):
     app = Flask(__name__)
     basedir = os.path.abspath(os.path.dirname(__file__))
     
     db_folder = os.path.join(basedir, 'database')
     os.makedirs(db_folder, exist_ok= True)
-    db_path = os.path.join(db_folder, 'Fruteria.db')
     
-    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
-    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    # Valores por defecto, luego variables FRUTERIA_* y por último el diccionario config
+    load_config(app, config)
+    # Decimal y datetime se codifican directamente, sin convertirlos antes en to_dict()
+    app.json = FastJSONProvider(app, app.config['JSON_PROVIDER'])
+    # Latencia, SQL, filas y bytes por endpoint, expuestos en /metrics
+    if app.config['METRICS_ENABLED']:
+        init_metrics(app)
     
     db.init_app(app)
+    with app.app_context():
+        configure_engine(db.engine, app.config)
+        if app.config['METRICS_ENABLED']:
+            instrument_engine(db.engine)
+        # Sentencias lentas con la función que las ejecutó y su EXPLAIN QUERY PLAN
+        init_slow_query_log(app, db.engine)
+    init_lazy_load_detector(app, db.session)
     #Se registran los endponit para ya quedar habilitados
     from src.routes.category_routes import category_bp
     from src.routes.product_routes import product_bp
+    from src.routes.client_routes import client_bp
+    from src.routes.supplier_routes import supplier_bp
+    from src.routes.sale_routes import sale_bp
+    from src.routes.report_routes import report_bp
+    from src.routes.auth_routes import auth_bp
+    from src.routes.metrics_routes import metrics_bp
     app.register_blueprint(category_bp, url_prefix='/fruteria/v1')
     app.register_blueprint(product_bp, url_prefix='/fruteria/v1')
+    app.register_blueprint(client_bp, url_prefix='/fruteria/v1')
+    app.register_blueprint(supplier_bp, url_prefix='/fruteria/v1')
+    app.register_blueprint(sale_bp, url_prefix='/fruteria/v1')
+    app.register_blueprint(report_bp, url_prefix='/fruteria/v1')
+    app.register_blueprint(auth_bp, url_prefix='/fruteria/v1')
+    # Fuera del prefijo de la API, en la ruta que espera Prometheus
+    app.register_blueprint(metrics_bp)
     return app
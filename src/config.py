@@ -0,0 +1,152 @@
+import logging
+import os
+import secrets
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+basedir = os.path.abspath(os.path.dirname(__file__))
+ENV_PREFIX = 'FRUTERIA_'
+
+DEFAULT_CONFIG = {
+    'SQLALCHEMY_DATABASE_URI': f"sqlite:///{os.path.join(basedir, 'database', 'Fruteria.db')}",
+    'SQLALCHEMY_TRACK_MODIFICATIONS': False,
+    # Perfil de SQLite: WAL permite lectores concurrentes mientras una caja escribe
+    'SQLITE_JOURNAL_MODE': 'WAL',
+    'SQLITE_SYNCHRONOUS': 'NORMAL',
+    'SQLITE_CACHE_SIZE': -64000,          # Negativo = KiB (64 MB)
+    'SQLITE_MMAP_SIZE': 268435456,        # 256 MB
+    'SQLITE_TEMP_STORE': 'MEMORY',
+    'SQLITE_BUSY_TIMEOUT': 5000,          # Milisegundos esperando un bloqueo antes de fallar
+    # Segundos que se conservan en memoria las tablas de referencia (categorías, roles, pagos)
+    'REFERENCE_CACHE_TTL': 300,
+    # Filas por lote (y por transacción) en las importaciones masivas
+    'IMPORT_BATCH_SIZE': 1000,
+    # Hashing de contraseñas: método de werkzeug, hilos dedicados y límite de operaciones en espera
+    'PASSWORD_HASH_METHOD': 'scrypt',
+    'PASSWORD_HASH_WORKERS': max(1, (os.cpu_count() or 2) // 2),
+    'PASSWORD_HASH_MAX_PENDING': 64,
+    'PASSWORD_HASH_TIMEOUT': 10,
+    # Sesiones: sin FRUTERIA_SECRET_KEY se usa una clave aleatoria (con un aviso en el log) y
+    # los tokens no sobreviven a un reinicio ni valen entre procesos
+    'SECRET_KEY': None,
+    'AUTH_TOKEN_MAX_AGE': 12 * 3600,
+    'AUTH_CACHE_SIZE': 1024,
+    'AUTH_CACHE_TTL': 60,
+    # Pool de conexiones: cada conexión aplica los PRAGMA una sola vez al abrirse
+    'DB_POOL_SIZE': 10,
+    'DB_MAX_OVERFLOW': 20,
+    'DB_POOL_TIMEOUT': 30,
+    'DB_POOL_RECYCLE': 3600,
+    # Serialización JSON: 'auto' usa orjson si está instalado, 'orjson' lo exige, 'stdlib' usa json
+    'JSON_PROVIDER': 'auto',
+    # Métricas por endpoint en /metrics (formato de texto de Prometheus)
+    'METRICS_ENABLED': True,
+    # Sentencias que tardan más que esto (ms) se registran con su plan; 0 lo desactiva
+    'SLOW_QUERY_THRESHOLD_MS': 100,
+    'SLOW_QUERY_EXPLAIN': True,
+    # Detector de N+1: 'off', 'warn' o 'raise' si una relación se carga de forma perezosa
+    # más de LAZY_LOAD_THRESHOLD veces en una petición (para desarrollo y pruebas)
+    'LAZY_LOAD_MODE': 'off',
+    'LAZY_LOAD_THRESHOLD': 10,
+}
+
+def _coerce(value, default):
+    """
+    Convierte el texto de una variable de entorno al tipo del valor por defecto.
+
+    Args:
+        value: Texto leído del entorno
+        default: Valor por defecto del que se toma el tipo
+
+    Returns:
+        Valor convertido
+    """
+    if isinstance(default, bool):
+        return value.strip().lower() in ('1', 'true', 'yes', 'on')
+    if isinstance(default, int):
+        return int(value)
+    return value
+
+def load_config(app, overrides=None):
+    """
+    Carga la configuración de la aplicación.
+
+    El orden de prioridad es: valores por defecto, variables de entorno con prefijo
+    FRUTERIA_ (por ejemplo FRUTERIA_SQLITE_BUSY_TIMEOUT=10000) y por último el
+    diccionario overrides que recibe create_app.
+
+    Args:
+        app: Aplicación Flask
+        overrides: Diccionario con valores que reemplazan a los demás (opcional)
+    """
+    for key, default in DEFAULT_CONFIG.items():
+        env_value = os.environ.get(ENV_PREFIX + key)
+        app.config[key] = default if env_value is None else _coerce(env_value, default)
+    if overrides:
+        app.config.update(overrides)
+    if not app.config['SECRET_KEY']:
+        logger.warning("FRUTERIA_SECRET_KEY is not set: using a random key, so auth tokens stop working "
+                       "on restart and are not shared between processes")
+        app.config['SECRET_KEY'] = secrets.token_hex(32)
+
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {})
+    if _is_file_sqlite(app.config['SQLALCHEMY_DATABASE_URI']):
+        for option, key in (('pool_size', 'DB_POOL_SIZE'), ('max_overflow', 'DB_MAX_OVERFLOW'),
+                            ('pool_timeout', 'DB_POOL_TIMEOUT'), ('pool_recycle', 'DB_POOL_RECYCLE')):
+            app.config['SQLALCHEMY_ENGINE_OPTIONS'].setdefault(option, app.config[key])
+
+def _is_sqlite(uri):
+    return uri.startswith('sqlite')
+
+def _is_file_sqlite(uri):
+    return _is_sqlite(uri) and ':memory:' not in uri and uri.rstrip('/') not in ('sqlite:', 'sqlite:/')
+
+def _pragma_word(value, name):
+    if not str(value).isalpha():
+        raise ValueError(f"Invalid value for {name}: {value}")
+    return str(value).upper()
+
+def sqlite_pragmas(config):
+    """
+    Construye la lista de PRAGMA que se aplican a cada conexión nueva.
+
+    Args:
+        config: Configuración de la aplicación
+
+    Returns:
+        list: Sentencias PRAGMA a ejecutar
+    """
+    pragmas = []
+    if _is_file_sqlite(config['SQLALCHEMY_DATABASE_URI']) and config.get('SQLITE_JOURNAL_MODE'):
+        pragmas.append(f"PRAGMA journal_mode={_pragma_word(config['SQLITE_JOURNAL_MODE'], 'SQLITE_JOURNAL_MODE')}")
+    if config.get('SQLITE_SYNCHRONOUS'):
+        pragmas.append(f"PRAGMA synchronous={_pragma_word(config['SQLITE_SYNCHRONOUS'], 'SQLITE_SYNCHRONOUS')}")
+    if config.get('SQLITE_TEMP_STORE'):
+        pragmas.append(f"PRAGMA temp_store={_pragma_word(config['SQLITE_TEMP_STORE'], 'SQLITE_TEMP_STORE')}")
+    for pragma, key in (('cache_size', 'SQLITE_CACHE_SIZE'), ('mmap_size', 'SQLITE_MMAP_SIZE'),
+                        ('busy_timeout', 'SQLITE_BUSY_TIMEOUT')):
+        if config.get(key) is not None:
+            pragmas.append(f"PRAGMA {pragma}={int(config[key])}")
+    return pragmas
+
+def configure_engine(engine, config):
+    """
+    Registra en el engine el evento que aplica los PRAGMA de SQLite a cada conexión nueva.
+
+    Args:
+        engine: Engine de SQLAlchemy
+        config: Configuración de la aplicación
+    """
+    if not _is_sqlite(str(engine.url)):
+        return
+    pragmas = sqlite_pragmas(config)
+
+    @event.listens_for(engine, 'connect')
+    def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
@@ -7,6 +7,8 @@ from .user import User
 from .payment import Payment
 from .sale import Sale
 from .sale_detail import SaleDetail
+from .daily_sales_summary import DailySalesSummary
+from .catalog_version import CatalogVersion
 
 __all__ = [
     'Category',
@@ -17,5 +19,7 @@ __all__ = [
     'User',
     'Payment',
     'Sale',
-    'SaleDetail'
+    'SaleDetail',
+    'DailySalesSummary',
+    'CatalogVersion'
 ] 
\ No newline at end of file
@@ -0,0 +1,23 @@
+import uuid
+from sqlalchemy import event
+from src import db
+
+CATALOG_ROW_ID = 1
+
+class CatalogVersion(db.Model):
+    __tablename__ = 'catalog_version'
+    
+    # Una sola fila compartida por todos los procesos: cada escritura en productos, su
+    # stock o sus categorías suma 1 a version en la misma transacción
+    catalog_id = db.Column(db.Integer, primary_key=True)
+    # Distingue una base recreada de la anterior, así un ETag viejo nunca vuelve a coincidir
+    token = db.Column(db.String(12), nullable=False)
+    version = db.Column(db.Integer, nullable=False, default=1)
+    
+    def __repr__(self):
+        return f'<CatalogVersion {self.token}-{self.version}>'
+
+@event.listens_for(CatalogVersion.__table__, 'after_create')
+def _insert_catalog_row(table, connection, **kwargs):
+    # La fila existe desde que se crea la tabla, con create_all() o con upgrade_schema()
+    connection.execute(table.insert().values(catalog_id=CATALOG_ROW_ID, token=uuid.uuid4().hex[:12], version=1))
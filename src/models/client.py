@@ -1,5 +1,42 @@
+from sqlalchemy import DDL, event
 from src import db
 
+# Índice de texto completo de clientes (FTS5, tabla de contenido externo sobre clients).
+# prefix='2 3' guarda también los prefijos cortos, que son los que se escriben al buscar.
+CLIENT_SEARCH_TABLE = 'clients_fts'
+CLIENT_SEARCH_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS clients_fts USING fts5(
+        name, last_name, identity_card, phone, email,
+        content='clients', content_rowid='client_id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    """,
+    # Los triggers mantienen el índice sincronizado con cualquier escritura en clients,
+    # incluidas las inserciones masivas de la importación
+    """
+    CREATE TRIGGER IF NOT EXISTS clients_fts_insert AFTER INSERT ON clients BEGIN
+        INSERT INTO clients_fts(rowid, name, last_name, identity_card, phone, email)
+        VALUES (new.client_id, new.name, new.last_name, new.identity_card, new.phone, new.email);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS clients_fts_delete AFTER DELETE ON clients BEGIN
+        INSERT INTO clients_fts(clients_fts, rowid, name, last_name, identity_card, phone, email)
+        VALUES ('delete', old.client_id, old.name, old.last_name, old.identity_card, old.phone, old.email);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS clients_fts_update
+    AFTER UPDATE OF name, last_name, identity_card, phone, email ON clients BEGIN
+        INSERT INTO clients_fts(clients_fts, rowid, name, last_name, identity_card, phone, email)
+        VALUES ('delete', old.client_id, old.name, old.last_name, old.identity_card, old.phone, old.email);
+        INSERT INTO clients_fts(rowid, name, last_name, identity_card, phone, email)
+        VALUES (new.client_id, new.name, new.last_name, new.identity_card, new.phone, new.email);
+    END
+    """,
+]
+
 class Client(db.Model):
     __tablename__ = 'clients'
     
@@ -27,5 +64,12 @@ class Client(db.Model):
             'phone': self.phone,
             'email': self.email,
             'address': self.address,
-            'registration_date': self.registration_date.isoformat() if self.registration_date else None
-        } 
\ No newline at end of file
+            'registration_date': self.registration_date
+        }
+
+# create_all() crea también el índice de búsqueda y sus triggers, y drop_all() lo borra
+# junto con clients; en bases existentes lo agrega upgrade_schema()
+for _statement in CLIENT_SEARCH_DDL:
+    event.listen(Client.__table__, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
+event.listen(Client.__table__, 'after_drop',
+             DDL(f'DROP TABLE IF EXISTS {CLIENT_SEARCH_TABLE}').execute_if(dialect='sqlite'))
@@ -0,0 +1,24 @@
+from src import db
+
+class DailySalesSummary(db.Model):
+    __tablename__ = 'daily_sales_summary'
+    
+    # Una fila por día, método de pago y vendedor; se actualiza junto con cada venta
+    day = db.Column(db.Date, primary_key=True)
+    payment_id = db.Column(db.Integer, db.ForeignKey('payments.payment_id'), primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.user_id'), primary_key=True)
+    
+    sales_count = db.Column(db.Integer, nullable=False, default=0)
+    revenue = db.Column(db.Numeric(12, 2), nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<DailySalesSummary {self.day} - {self.payment_id} - {self.user_id}>'
+    
+    def to_dict(self):
+        return {
+            'day': self.day,
+            'payment_id': self.payment_id,
+            'user_id': self.user_id,
+            'sales_count': self.sales_count,
+            'revenue': self.revenue
+        }
@@ -3,6 +3,10 @@ from decimal import Decimal
 
 class Product(db.Model):
     __tablename__ = 'products'
+    __table_args__ = (
+        # Índice único con nombre para poder crearlo en bases existentes (ver upgrade_schema)
+        db.Index('uq_products_name', 'name', unique=True),
+    )
     
     product_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     name = db.Column(db.String(50), nullable=False)
@@ -10,8 +14,8 @@ class Product(db.Model):
     stock = db.Column(db.Integer, nullable=False, default=0)
     
     # Claves foráneas
-    category_id = db.Column(db.Integer, db.ForeignKey('categories.category_id'), nullable=False)
-    supplier_id = db.Column(db.Integer, db.ForeignKey('suppliers.supplier_id'), nullable=False)
+    category_id = db.Column(db.Integer, db.ForeignKey('categories.category_id'), nullable=False, index=True)
+    supplier_id = db.Column(db.Integer, db.ForeignKey('suppliers.supplier_id'), nullable=False, index=True)
     
     def __repr__(self):
         return f'<Product {self.name}>'
@@ -20,7 +24,7 @@ class Product(db.Model):
         return {
             'id': self.product_id,
             'name': self.name,
-            'price': float(self.price),
+            'price': self.price,
             'stock': self.stock,
             'category_id': self.category_id,
             'supplier_id': self.supplier_id
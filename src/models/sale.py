@@ -4,13 +4,13 @@ class Sale(db.Model):
     __tablename__ = 'sales'
     
     sale_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
-    date = db.Column(db.DateTime, nullable=False, default=db.func.current_timestamp())
+    date = db.Column(db.DateTime, nullable=False, default=db.func.current_timestamp(), index=True)
     total = db.Column(db.Numeric(10, 2), nullable=False, default=0)
     status = db.Column(db.String(20), nullable=False, default='completed')  # completed, cancelled, pending
     
     # Claves foráneas
-    client_id = db.Column(db.Integer, db.ForeignKey('clients.client_id'), nullable=False)
-    user_id = db.Column(db.Integer, db.ForeignKey('users.user_id'), nullable=False)
+    client_id = db.Column(db.Integer, db.ForeignKey('clients.client_id'), nullable=False, index=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.user_id'), nullable=False, index=True)
     payment_id = db.Column(db.Integer, db.ForeignKey('payments.payment_id'), nullable=False)
     
     # Relaciones
@@ -22,8 +22,8 @@ class Sale(db.Model):
     def to_dict(self):
         return {
             'id': self.sale_id,
-            'date': self.date.isoformat() if self.date else None,
-            'total': float(self.total),
+            'date': self.date,
+            'total': self.total,
             'status': self.status,
             'client_id': self.client_id,
             'user_id': self.user_id,
@@ -5,7 +5,7 @@ class SaleDetail(db.Model):
     
     # Claves primarias compuestas
     sale_id = db.Column(db.Integer, db.ForeignKey('sales.sale_id'), primary_key=True)
-    product_id = db.Column(db.Integer, db.ForeignKey('products.product_id'), primary_key=True)
+    product_id = db.Column(db.Integer, db.ForeignKey('products.product_id'), primary_key=True, index=True)
     
     # Campos adicionales
     quantity = db.Column(db.Integer, nullable=False)
@@ -20,6 +20,6 @@ class SaleDetail(db.Model):
             'sale_id': self.sale_id,
             'product_id': self.product_id,
             'quantity': self.quantity,
-            'price': float(self.price),
-            'subtotal': float(self.subtotal)
+            'price': self.price,
+            'subtotal': self.subtotal
         } 
\ No newline at end of file
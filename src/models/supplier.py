@@ -2,6 +2,11 @@ from src import db
 
 class Supplier(db.Model):
     __tablename__ = 'suppliers'
+    __table_args__ = (
+        # Índices únicos con nombre para poder crearlos en bases existentes (ver upgrade_schema)
+        db.Index('uq_suppliers_name', 'name', unique=True),
+        db.Index('uq_suppliers_nit', 'nit', unique=True),
+    )
     
     supplier_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     name = db.Column(db.String(50), nullable=False)
@@ -0,0 +1,27 @@
+from flask import Blueprint, g, jsonify, request
+from src.services.user_service import authenticate_user
+from src.services.auth_service import issue_token
+from src.utils.auth import token_required
+from werkzeug.exceptions import HTTPException
+
+auth_bp = Blueprint('auth', __name__)
+
+@auth_bp.route('/auth/login', methods=['POST'])
+def login_route():
+    data = request.get_json()
+    if not data or 'username' not in data or 'password' not in data:
+        return jsonify({'error': 'Username and password are required'}), 400
+    try:
+        user = authenticate_user(data['username'], data['password'])
+        if not user.is_active:
+            return jsonify({'error': 'User is inactive'}), 403
+        return jsonify({'token': issue_token(user), 'user': user.to_dict()})
+    except HTTPException as e:
+        return jsonify({'error': str(e)}), e.code
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@auth_bp.route('/auth/me', methods=['GET'])
+@token_required()
+def me_route():
+    return jsonify(g.current_user._asdict())
@@ -1,5 +1,8 @@
 from flask import Blueprint, jsonify, request
 from src.services.category_service import get_all_categories, get_category_by_id, create_category, update_category, delete_category
+from src.utils.pagination import get_pagination_args, page_response
+from src.utils.fields import get_fields_arg, serializer
+from src.models import Category
 from werkzeug.exceptions import HTTPException
 
 category_bp = Blueprint('category', __name__)
@@ -7,16 +10,21 @@ category_bp = Blueprint('category', __name__)
 @category_bp.route('/categories', methods=['GET'])
 def get_categories():
     try:
-        categories = get_all_categories()
-        return jsonify([category.to_dict() for category in categories])
+        fields = get_fields_arg(Category)
+        limit, after = get_pagination_args()
+        categories, next_cursor = get_all_categories(limit, after, fields)
+        return jsonify(page_response(categories, next_cursor, serializer(Category, fields)))
+    except HTTPException as e:
+        return jsonify({'error': str(e)}), e.code
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @category_bp.route('/categories/<int:category_id>', methods=['GET'])
 def get_category(category_id):
     try:
-        category = get_category_by_id(category_id)
-        return jsonify(category.to_dict())
+        fields = get_fields_arg(Category)
+        category = get_category_by_id(category_id, fields)
+        return jsonify(serializer(Category, fields)(category))
     except HTTPException as e:
         return jsonify({'error': str(e)}), e.code
     except Exception as e:
@@ -41,7 +49,7 @@ def modify_category(category_id):
     if not data or 'name' not in data:
         return jsonify({'error': 'Name is required'}), 400
     try:
-        category = update_category(category_id, data['name'])
+        category = update_category(category_id, name=data['name'])
         return jsonify(category.to_dict())
     except HTTPException as e:
         return jsonify({'error': str(e)}), e.code
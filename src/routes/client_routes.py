@@ -1,5 +1,11 @@
-from flask import Blueprint, jsonify, request
-from src.services.client_service import (get_all_clients, get_client_by_id, create_client,update_client, delete_client, search_clients)
+from flask import Blueprint, current_app, jsonify, request
+from src.services.client_service import (get_all_clients, get_client_by_id, create_client,update_client, delete_client, search_clients, get_client_by_identity_card, iter_all_clients)
+from src.utils.pagination import get_pagination_args, page_response
+from src.utils.streaming import wants_stream, stream_response
+from src.utils.search import get_search_args
+from src.utils.fields import get_fields_arg, serializer
+from src.models import Client
+from src.services.import_service import import_clients
 from werkzeug.exceptions import HTTPException
 
 client_bp = Blueprint('client', __name__)
@@ -7,8 +13,13 @@ client_bp = Blueprint('client', __name__)
 @client_bp.route('/clients', methods=['GET'])
 def get_clients():
     try:
-        clients = get_all_clients()
-        return jsonify([client.to_dict() for client in clients])
+        fields = get_fields_arg(Client)
+        serialize = serializer(Client, fields)
+        if wants_stream():
+            return stream_response(iter_all_clients(fields=fields), serialize)
+        limit, after = get_pagination_args()
+        clients, next_cursor = get_all_clients(limit, after, fields)
+        return jsonify(page_response(clients, next_cursor, serialize))
     except HTTPException as e:
         return jsonify({'error': str(e)}), e.code
     except Exception as e:
@@ -17,8 +28,9 @@ def get_clients():
 @client_bp.route('/clients/<int:client_id>', methods=['GET'])
 def get_client(client_id):
     try:
-        client = get_client_by_id(client_id)
-        return jsonify(client.to_dict())
+        fields = get_fields_arg(Client)
+        client = get_client_by_id(client_id, fields)
+        return jsonify(serializer(Client, fields)(client))
     except HTTPException as e:
         return jsonify({'error': str(e)}), e.code
     except Exception as e:
@@ -41,6 +53,16 @@ def create_client_route():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
     
+@client_bp.route('/clients/import', methods=['POST'])
+def import_clients_route():
+    try:
+        report = import_clients(request.stream, request.mimetype)
+        return jsonify(report.to_dict())
+    except HTTPException as e:
+        return jsonify({'error': str(e)}), e.code
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    
 @client_bp.route('/clients/<int:client_id>', methods=['PATCH'])
 def update_client_route(client_id):
     data = request.get_json()
@@ -70,20 +92,21 @@ def delete_client_route(client_id):
     
 @client_bp.route('/clients/search', methods=['GET'])
 def search_clients_route():
-    data = request.get_json()
-    if not data:
-        return jsonify({'error': 'No data provided'}), 400
-    
-    required_fields = ['identity_card']
-    if not all(field in data for field in required_fields):
-        return jsonify({'error': 'Missing required fields'}), 400
     try:
-        identity_card = data['identity_card']
-        client = search_clients(identity_card)
-        return jsonify(client.to_dict())
+        # ?identity_card= busca un cliente exacto; ?q= busca por prefijo en nombre, apellido, teléfono, email o identidad
+        identity_card = request.args.get('identity_card')
+        if identity_card:
+            client = get_client_by_identity_card(identity_card)
+            return jsonify(client.to_dict())
+        q, limit = get_search_args()
+        fields = get_fields_arg(Client)
+        serialize = serializer(Client, fields)
+        clients = search_clients(q, limit, fields)
+        return jsonify({'data': [serialize(client) for client in clients]})
     except HTTPException as e:
         return jsonify({'error': str(e)}), e.code
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    except Exception:
+        # El texto de un error de SQLite incluye la consulta; se deja solo en el log
+        current_app.logger.exception('Client search failed')
+        return jsonify({'error': 'Internal server error'}), 500
     
-    
\ No newline at end of file
@@ -0,0 +1,11 @@
+from flask import Blueprint, Response, current_app
+from src.utils.metrics import PROMETHEUS_MIMETYPE
+
+metrics_bp = Blueprint('metrics', __name__)
+
+@metrics_bp.route('/metrics', methods=['GET'])
+def get_metrics():
+    metrics = current_app.extensions.get('metrics')
+    if metrics is None:
+        return Response('Metrics are disabled\n', status=404, mimetype='text/plain')
+    return Response(metrics.render(), mimetype=PROMETHEUS_MIMETYPE)
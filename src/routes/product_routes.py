@@ -1,33 +1,75 @@
 from flask import Blueprint, jsonify, request
 from src.services.product_service import(get_all_products, get_product_by_id, create_product, 
-    update_product, update_stock, delete_product, get_all_products_by_category)
+    update_product, update_stock, delete_product, get_all_products_by_category, iter_all_products, suggest_products)
+from src.utils.pagination import get_pagination_args, page_response
+from src.utils.streaming import wants_stream, stream_response
+from src.utils.http_cache import not_modified_response, add_cache_headers
+from src.services.catalog_service import get_catalog_etag
+from src.services.category_service import get_category_ref
+from src.services.import_service import import_products
+from src.utils.search import get_search_args
+from src.utils.fields import get_fields_arg, serializer
+from src.models import Product
 from werkzeug.exceptions import HTTPException
 
 product_bp = Blueprint('product', __name__)
 
 @product_bp.route('/products', methods=['GET'])
 def get_products():
+    etag = get_catalog_etag()
+    not_modified = not_modified_response(etag)
+    if not_modified:
+        return not_modified
     try:
-        products = get_all_products()
-        return jsonify([product.to_dict() for product in products])
+        fields = get_fields_arg(Product)
+        serialize = serializer(Product, fields)
+        if wants_stream():
+            return add_cache_headers(stream_response(iter_all_products(fields=fields), serialize), etag)
+        limit, after = get_pagination_args()
+        products, next_cursor = get_all_products(limit, after, fields)
+        return add_cache_headers(jsonify(page_response(products, next_cursor, serialize)), etag)
+    except HTTPException as e:
+        return jsonify({'error': str(e)}), e.code
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @product_bp.route('/products/category/<int:category_id>', methods=['GET'])
 def get_products_by_category(category_id):
     try:
-        products = get_all_products_by_category(category_id)
-        return jsonify([product.to_dict() for product in products])
+        # La categoría se valida antes del 304: una categoría inexistente es 404 con o sin If-None-Match
+        get_category_ref(category_id)
+        etag = get_catalog_etag()
+        not_modified = not_modified_response(etag)
+        if not_modified:
+            return not_modified
+        fields = get_fields_arg(Product)
+        serialize = serializer(Product, fields)
+        if wants_stream():
+            return add_cache_headers(stream_response(iter_all_products(category_id, fields=fields), serialize), etag)
+        limit, after = get_pagination_args()
+        products, next_cursor = get_all_products_by_category(category_id, limit, after, fields)
+        return add_cache_headers(jsonify(page_response(products, next_cursor, serialize)), etag)
     except HTTPException as e:
         return jsonify({'error': str(e)}), e.code
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@product_bp.route('/products/suggest', methods=['GET'])
+def suggest_products_route():
+    try:
+        q, limit = get_search_args()
+        return jsonify({'data': suggest_products(q, limit)})
+    except HTTPException as e:
+        return jsonify({'error': str(e)}), e.code
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    
 @product_bp.route('/products/<int:product_id>', methods=['GET'])
 def get_product(product_id):
     try:
-        product = get_product_by_id(product_id)
-        return jsonify(product.to_dict())
+        fields = get_fields_arg(Product)
+        product = get_product_by_id(product_id, fields)
+        return jsonify(serializer(Product, fields)(product))
     except HTTPException as e:
         return jsonify({'error': str(e)}), e.code
     except Exception as e:
@@ -39,7 +81,7 @@ def add_product():
     if not data:
         return jsonify({'error': 'No data provided'}), 400
     
-    required_fields = ['name', 'price', 'category_id', 'stock']
+    required_fields = ['name', 'price', 'category_id', 'supplier_id', 'stock']
     if not all(field in data for field in required_fields):
         return jsonify({'error': 'Missing required fields'}), 400
     
@@ -47,8 +89,9 @@ def add_product():
         product = create_product(
             name=data['name'],
             price=data['price'],
+            stock=data['stock'],
             category_id=data['category_id'],
-            stock=data['stock']
+            supplier_id=data['supplier_id']
         )
         return jsonify(product.to_dict()), 201
     except HTTPException as e:
@@ -56,6 +99,16 @@ def add_product():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
     
+@product_bp.route('/products/import', methods=['POST'])
+def import_products_route():
+    try:
+        report = import_products(request.stream, request.mimetype)
+        return jsonify(report.to_dict())
+    except HTTPException as e:
+        return jsonify({'error': str(e)}), e.code
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    
 @product_bp.route('/products/<int:product_id>', methods=['PATCH'])
 def update_product_route(product_id):
     data = request.get_json()
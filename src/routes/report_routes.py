@@ -0,0 +1,61 @@
+from flask import Blueprint, jsonify, request
+from src.services.report_service import (get_daily_sales, get_sales_by_payment, get_sales_by_seller,
+    get_top_products, get_revenue_by_category)
+from src.utils.dates import get_date_range_args
+from werkzeug.exceptions import HTTPException, BadRequest
+
+report_bp = Blueprint('report', __name__)
+
+@report_bp.route('/reports/sales/daily', methods=['GET'])
+def daily_sales_report():
+    try:
+        date_from, date_to = get_date_range_args()
+        return jsonify(get_daily_sales(date_from, date_to))
+    except HTTPException as e:
+        return jsonify({'error': str(e)}), e.code
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@report_bp.route('/reports/sales/payments', methods=['GET'])
+def sales_by_payment_report():
+    try:
+        date_from, date_to = get_date_range_args()
+        return jsonify(get_sales_by_payment(date_from, date_to))
+    except HTTPException as e:
+        return jsonify({'error': str(e)}), e.code
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@report_bp.route('/reports/sales/sellers', methods=['GET'])
+def sales_by_seller_report():
+    try:
+        date_from, date_to = get_date_range_args()
+        return jsonify(get_sales_by_seller(date_from, date_to))
+    except HTTPException as e:
+        return jsonify({'error': str(e)}), e.code
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@report_bp.route('/reports/products/top', methods=['GET'])
+def top_products_report():
+    try:
+        date_from, date_to = get_date_range_args()
+        limit = request.args.get('limit', '10')
+        if not limit.isdigit() or not (1 <= int(limit) <= 100):
+            raise BadRequest("Limit must be an integer between 1 and 100")
+        order_by = request.args.get('by', 'units')
+        return jsonify(get_top_products(date_from, date_to, int(limit), order_by))
+    except HTTPException as e:
+        return jsonify({'error': str(e)}), e.code
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@report_bp.route('/reports/categories/revenue', methods=['GET'])
+def category_revenue_report():
+    try:
+        date_from, date_to = get_date_range_args()
+        return jsonify(get_revenue_by_category(date_from, date_to))
+    except HTTPException as e:
+        return jsonify({'error': str(e)}), e.code
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
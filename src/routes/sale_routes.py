@@ -0,0 +1,73 @@
+from flask import Blueprint, jsonify, request
+from src.services.sale_service import create_sale, get_all_sales, get_sale_by_id, get_sales_by_client, cancel_sale
+from src.utils.pagination import get_pagination_args, page_response
+from src.utils.dates import get_date_range_args
+from werkzeug.exceptions import HTTPException, BadRequest
+
+sale_bp = Blueprint('sale', __name__)
+
+@sale_bp.route('/sales', methods=['GET'])
+def get_sales():
+    try:
+        limit, after = get_pagination_args()
+        date_from, date_to = get_date_range_args()
+        client_id = request.args.get('client_id')
+        if client_id is not None:
+            if not client_id.isdigit():
+                raise BadRequest("Client ID must be an integer")
+            client_id = int(client_id)
+        sales, next_cursor = get_all_sales(limit, after, client_id, date_from, date_to)
+        return jsonify(page_response(sales, next_cursor))
+    except HTTPException as e:
+        return jsonify({'error': str(e)}), e.code
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@sale_bp.route('/sales/<int:sale_id>', methods=['GET'])
+def get_sale(sale_id):
+    try:
+        sale = get_sale_by_id(sale_id)
+        return jsonify(sale.to_dict())
+    except HTTPException as e:
+        return jsonify({'error': str(e)}), e.code
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@sale_bp.route('/clients/<int:client_id>/sales', methods=['GET'])
+def get_client_sales(client_id):
+    try:
+        limit, after = get_pagination_args()
+        date_from, date_to = get_date_range_args()
+        sales, next_cursor = get_sales_by_client(client_id, limit, after, date_from, date_to)
+        return jsonify(page_response(sales, next_cursor))
+    except HTTPException as e:
+        return jsonify({'error': str(e)}), e.code
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@sale_bp.route('/sales', methods=['POST'])
+def create_sale_route():
+    data = request.get_json()
+    if not data:
+        return jsonify({'error': 'No data provided'}), 400
+    
+    required_fields = ['client_id', 'user_id', 'payment_id', 'items']
+    if not all(field in data for field in required_fields):
+        return jsonify({'error': 'Missing required fields'}), 400
+    try:
+        sale = create_sale(data['client_id'], data['user_id'], data['payment_id'], data['items'])
+        return jsonify(sale.to_dict()), 201
+    except HTTPException as e:
+        return jsonify({'error': str(e)}), e.code
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@sale_bp.route('/sales/<int:sale_id>/cancel', methods=['POST'])
+def cancel_sale_route(sale_id):
+    try:
+        sale = cancel_sale(sale_id)
+        return jsonify(sale.to_dict())
+    except HTTPException as e:
+        return jsonify({'error': str(e)}), e.code
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -1,6 +1,9 @@
 from flask import Blueprint, jsonify, request
 from src.services.supplier_service import ( get_all_suppliers, get_supplier_by_id, get_supplier_by_nit, 
 create_supplier, update_supplier, delete_supplier )
+from src.utils.pagination import get_pagination_args, page_response
+from src.utils.fields import get_fields_arg, serializer
+from src.models import Supplier
 from werkzeug.exceptions import HTTPException
 
 supplier_bp = Blueprint('supplier', __name__)
@@ -8,8 +11,10 @@ supplier_bp = Blueprint('supplier', __name__)
 @supplier_bp.route('/suppliers', methods=['GET'])
 def get_suppliers():
     try:
-        suppliers = get_all_suppliers()
-        return jsonify([supplier.to_dict() for supplier in suppliers])
+        fields = get_fields_arg(Supplier)
+        limit, after = get_pagination_args()
+        suppliers, next_cursor = get_all_suppliers(limit, after, fields)
+        return jsonify(page_response(suppliers, next_cursor, serializer(Supplier, fields)))
     except HTTPException as e:
         return jsonify({'error': str(e)}), e.code
     except Exception as e:
@@ -18,8 +23,9 @@ def get_suppliers():
 @supplier_bp.route('/suppliers/<int:supplier_id>', methods=['GET'])
 def get_supplier(supplier_id):
     try:
-        supplier = get_supplier_by_id(supplier_id)
-        return jsonify(supplier.to_dict())
+        fields = get_fields_arg(Supplier)
+        supplier = get_supplier_by_id(supplier_id, fields)
+        return jsonify(serializer(Supplier, fields)(supplier))
     except HTTPException as e:
         return jsonify({'error': str(e)}), e.code
     except Exception as e:
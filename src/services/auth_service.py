@@ -0,0 +1,92 @@
+from collections import namedtuple
+from flask import current_app
+from itsdangerous import URLSafeTimedSerializer, BadSignature, SignatureExpired
+from src import db
+from src.models import User
+from src.services.role_service import get_role_ref
+from src.utils.cache import LRUCache
+from werkzeug.exceptions import Unauthorized
+
+TOKEN_SALT = 'fruteria-auth'
+
+# Datos mínimos para autorizar una petición; se guardan en caché por user_id
+AuthenticatedUser = namedtuple('AuthenticatedUser', ['user_id', 'username', 'role', 'is_active'])
+
+_session_cache = LRUCache()
+
+def _serializer():
+    return URLSafeTimedSerializer(current_app.config['SECRET_KEY'], salt=TOKEN_SALT)
+
+def _configure_cache():
+    _session_cache.max_entries = current_app.config.get('AUTH_CACHE_SIZE', _session_cache.max_entries)
+    _session_cache.ttl = current_app.config.get('AUTH_CACHE_TTL', _session_cache.ttl)
+
+def issue_token(user):
+    """
+    Genera un token firmado para un usuario.
+    
+    Args:
+        user: Usuario autenticado
+    
+    Returns:
+        str: Token para el encabezado Authorization: Bearer
+    """
+    return _serializer().dumps({'uid': user.user_id})
+
+def _load_session(user_id):
+    row = db.session.query(User.user_id, User.username, User.role_id, User.is_active).filter(
+        User.user_id == user_id
+    ).first()
+    if row is None:
+        return None
+    return AuthenticatedUser(row.user_id, row.username, get_role_ref(row.role_id)['name'], row.is_active)
+
+def resolve_token(token):
+    """
+    Valida un token y devuelve el usuario al que pertenece.
+    
+    La firma se verifica en memoria y los datos del usuario (rol, activo) se toman de
+    una caché LRU con TTL, así una petición autorizada no ejecuta SQL adicional.
+    
+    Args:
+        token: Token recibido en el encabezado Authorization
+    
+    Returns:
+        AuthenticatedUser: Usuario, rol y estado
+    
+    Raises:
+        Unauthorized: Si el token es inválido, venció o el usuario no existe o está inactivo
+    """
+    try:
+        payload = _serializer().loads(token, max_age=current_app.config['AUTH_TOKEN_MAX_AGE'])
+    except SignatureExpired:
+        raise Unauthorized('Token expired')
+    except BadSignature:
+        raise Unauthorized('Invalid token')
+    
+    user_id = payload.get('uid') if isinstance(payload, dict) else None
+    if not isinstance(user_id, int):
+        raise Unauthorized('Invalid token')
+    
+    _configure_cache()
+    key = (id(current_app._get_current_object()), user_id)
+    session = _session_cache.get(key)
+    if session is None:
+        session = _load_session(user_id)
+        if session is None:
+            raise Unauthorized('User not found')
+        _session_cache.set(key, session)
+    
+    if not session.is_active:
+        raise Unauthorized('User is inactive')
+    return session
+
+def invalidate_user_session(user_id):
+    """
+    Descarta los datos de sesión en caché de un usuario. Se debe llamar después de
+    modificar o eliminar el usuario.
+    
+    Args:
+        user_id: ID del usuario
+    """
+    _session_cache.delete((id(current_app._get_current_object()), user_id))
@@ -0,0 +1,61 @@
+import uuid
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert
+from src import db
+from src.models import CatalogVersion
+from src.models.catalog_version import CATALOG_ROW_ID
+
+def _version_row():
+    return db.session.execute(
+        select(CatalogVersion.token, CatalogVersion.version).where(CatalogVersion.catalog_id == CATALOG_ROW_ID)
+    ).one()
+
+def catalog_version_column():
+    """
+    Get a scalar subquery with the current catalog version, to read it in the same
+    SELECT as the products it describes.
+
+    Returns:
+        Label: Column labeled catalog_version
+    """
+    return select(CatalogVersion.version).where(
+        CatalogVersion.catalog_id == CATALOG_ROW_ID
+    ).scalar_subquery().label('catalog_version')
+
+def get_catalog_version():
+    """
+    Get the current catalog version, shared by every process using the database.
+
+    Returns:
+        int: Version number, increased on every change to products or their stock
+    """
+    return _version_row().version
+
+def bump_catalog_version():
+    """
+    Mark the catalog as changed in the current transaction. Must be called before
+    committing any change to products, their stock or their categories, so the new
+    version becomes visible to other processes together with the change.
+
+    Returns:
+        int: The new catalog version
+    """
+    statement = insert(CatalogVersion).values(
+        catalog_id=CATALOG_ROW_ID, token=uuid.uuid4().hex[:12], version=1
+    ).on_conflict_do_update(
+        index_elements=[CatalogVersion.catalog_id],
+        set_={'version': CatalogVersion.version + 1}
+    ).returning(CatalogVersion.version)
+    # Pending changes are flushed by the caller's commit, where conflicts are reported
+    with db.session.no_autoflush:
+        return db.session.execute(statement).scalar_one()
+
+def get_catalog_etag():
+    """
+    Get the entity tag that identifies the current catalog state.
+
+    Returns:
+        str: ETag value (without quotes)
+    """
+    row = _version_row()
+    return f"catalog-{row.token}-{row.version}"
@@ -1,14 +1,66 @@
 from src import db
 from src.models import Category
-from werkzeug.exceptions import NotFound, Conflict, BadRequest
+from werkzeug.exceptions import NotFound, BadRequest
+from src.utils.pagination import paginate_by_key, DEFAULT_PAGE_SIZE
+from src.utils.fields import load_only_options
 from src.utils.validations import validate_string_field
+from src.utils.cache import ReferenceCache
+from src.utils.persistence import save, commit_or_conflict
+from src.services.catalog_service import bump_catalog_version
+from src.services.report_service import invalidate_sales_reports
 
-def validate_category(category_id):
+_category_cache = ReferenceCache(
+    lambda: {category.category_id: category.to_dict() for category in Category.query.all()}
+)
+
+def get_category_ref(category_id):
+    """
+    Get a category from the in-process reference cache, without querying the database.
+    
+    Args:
+        category_id (int): The ID of the category
+        
+    Returns:
+        dict: The category data
+        
+    Raises:
+        BadRequest: If category_id is not an integer
+        NotFound: If category is not found
+    """
+    if not isinstance(category_id, int):
+        raise BadRequest("Category ID must be an integer")
+    
+    category = _category_cache.get(category_id)
+    if not category:
+        raise NotFound(f"Category not found: {category_id}")
+    return category
+
+def find_category_ref(category_id):
+    """
+    Get a category from the in-process reference cache, or None if it does not exist.
+    For bulk paths that report errors per row instead of raising.
+    
+    Args:
+        category_id (int): The ID of the category
+        
+    Returns:
+        dict: The category data, or None
+    """
+    return _category_cache.get(category_id)
+
+def invalidate_category_cache():
+    """
+    Discard the cached categories. Must be called after any write to the categories table.
+    """
+    _category_cache.invalidate()
+
+def validate_category(category_id, fields=None):
     """
     Validate if a category exists.
     
     Args:
         category_id (int): The ID of the category to validate
+        fields (tuple, optional): Only load these fields (see src/utils/fields.py)
         
     Returns:
         Category: The validated category instance
@@ -20,7 +72,7 @@ def validate_category(category_id):
     if not isinstance(category_id, int):
         raise BadRequest("Category ID must be an integer")
     
-    category = Category.query.get(category_id)
+    category = Category.query.options(*load_only_options(Category, fields)).get(category_id)
     if not category:
         raise NotFound(f"Category not found: {category_id}")
     return category
@@ -37,58 +89,62 @@ def validate_category_fields(**kwargs):
         
     Raises:
         BadRequest: If any validation fails
-        Conflict: If category name already exists
     """
     validate_string_field(kwargs.get('name'), 'Name')
-    
-    if 'name' in kwargs:
-        existing_category = Category.query.filter_by(name=kwargs['name']).first()
-        if existing_category:
-            raise Conflict(f"Category already exists: {kwargs['name']}")
-    
     return True
 
-def get_all_categories():
+def _category_conflicts(name):
+    return {Category.name: f"Category already exists: {name}"}
+
+def get_all_categories(limit=DEFAULT_PAGE_SIZE, after=None, fields=None):
     """
-    Get all categories.
+    Get a page of categories ordered by ID.
+    
+    Args:
+        limit (int, optional): Maximum number of categories to return
+        after (int, optional): Return categories with an ID greater than this cursor
+        fields (tuple, optional): Only load these fields
     
     Returns:
-        list: List of all categories
+        tuple: (list of categories, next cursor or None)
     """
-    return Category.query.all()
+    query = Category.query.options(*load_only_options(Category, fields))
+    return paginate_by_key(query, Category.category_id, limit, after)
 
-def get_category_by_id(category_id):
+def get_category_by_id(category_id, fields=None):
     """
     Get a category by its ID.
     
     Args:
         category_id (int): The ID of the category to get
+        fields (tuple, optional): Only load these fields
         
     Returns:
         Category: The requested category
     """
-    return validate_category(category_id)
+    return validate_category(category_id, fields)
 
-def create_category(name, description=None):
+def create_category(name):
     """
     Create a new category.
     
     Args:
         name (str): Category name
-        description (str, optional): Category description. Defaults to None.
     
     Returns:
         Category: The created category instance
+        
+    Raises:
+        BadRequest: If any validation fails
+        Conflict: If category name already exists
     """
     validate_category_fields(name=name)
     
-    category = Category(
-        name=name,
-        description=description
-    )
-    
-    db.session.add(category)
-    db.session.commit()
+    category = Category(name=name)
+    # Product listings by category depend on categories
+    bump_catalog_version()
+    save(category, _category_conflicts(name))
+    invalidate_category_cache()
     return category
 
 def update_category(category_id, **kwargs):
@@ -101,16 +157,21 @@ def update_category(category_id, **kwargs):
         
     Returns:
         Category: The updated category instance
+        
+    Raises:
+        Conflict: If the new category name already exists
     """
     category = validate_category(category_id)
     validate_category_fields(**kwargs)
     
     if 'name' in kwargs:
         category.name = kwargs['name']
-    if 'description' in kwargs:
-        category.description = kwargs['description']
     
-    db.session.commit()
+    bump_catalog_version()
+    commit_or_conflict(_category_conflicts(kwargs.get('name')))
+    invalidate_category_cache()
+    # The memoized sales reports carry the category name
+    invalidate_sales_reports()
     return category
 
 def delete_category(category_id):
@@ -125,5 +186,8 @@ def delete_category(category_id):
     """
     category = validate_category(category_id)
     db.session.delete(category)
+    bump_catalog_version()
     db.session.commit()
+    invalidate_category_cache()
+    invalidate_sales_reports()
     return True 
\ No newline at end of file
@@ -1,20 +1,21 @@
+from sqlalchemy import text
 from src import db 
 from src.models import Client
-from werkzeug.exceptions import NotFound, Conflict, BadRequest
-from src.utils.validations import (
-    validate_string_field,
-    validate_phone,
-    validate_email,
-    validate_identity_card,
-    validate_address
-)
+from werkzeug.exceptions import NotFound, BadRequest
+from src.utils.pagination import paginate_by_key, DEFAULT_PAGE_SIZE
+from src.utils.fields import load_only_options
+from src.utils.streaming import STREAM_BATCH_SIZE
+from src.utils.persistence import save, commit_or_conflict
+from src.utils.search import build_prefix_match, DEFAULT_SEARCH_LIMIT
+from src.utils.validations import CLIENT_SCHEMA
 
-def validate_client(client_id):
+def validate_client(client_id, fields=None):
     """
     Valida que el ID de cliente sea válido y que el cliente exista.
     
     Args:
         client_id: ID del cliente a validar
+        fields: Solo se cargan estos campos (opcional, ver src/utils/fields.py)
     
     Returns:
         Client: Objeto cliente si existe
@@ -26,55 +27,68 @@ def validate_client(client_id):
     if not isinstance(client_id, int):
         raise BadRequest("Client ID must be an integer")
     
-    client = Client.query.get(client_id)
+    client = Client.query.options(*load_only_options(Client, fields)).get(client_id)
     if not client:
         raise NotFound(f"Client not found: {client_id}")
     return client
 
-def validate_client_fields(**kwargs):
+def validate_client_fields(partial=False, **kwargs):
     """
-    Valida todos los campos de un cliente.
+    Valida todos los campos de un cliente con CLIENT_SCHEMA.
     
     Args:
+        partial: Si es True, solo se validan los campos presentes (actualizaciones)
         **kwargs: Diccionario con los campos a validar (name, last_name, phone, identity_card, email, address)
     
     Returns:
         bool: True si todas las validaciones son exitosas
     
     Raises:
-        BadRequest: Si algún campo no cumple con las validaciones
-        Conflict: Si el número de identidad ya existe
+        ValidationError: Con todos los campos que no cumplen con las validaciones
     """
-    validate_string_field(kwargs.get('name'), 'Name')
-    validate_string_field(kwargs.get('last_name'), 'Last name')
-    validate_phone(kwargs.get('phone'))
-    validate_identity_card(kwargs.get('identity_card'))
-    validate_email(kwargs.get('email'), required=False)
-    validate_address(kwargs.get('address'), required=False)
+    CLIENT_SCHEMA.validate(kwargs, partial)
+    return True
+
+def _client_conflicts(identity_card):
+    # La unicidad del número de identidad la garantiza la restricción UNIQUE de la tabla
+    return {Client.identity_card: f"Client already exists: {identity_card}"}
+
+def get_all_clients(limit=DEFAULT_PAGE_SIZE, after=None, fields=None):
+    """
+    Obtiene una página de clientes ordenados por ID.
     
-    # Validar duplicados
-    if 'identity_card' in kwargs:
-        existing_client = Client.query.filter_by(identity_card=kwargs['identity_card']).first()
-        if existing_client:
-            raise Conflict(f"Client already exists: {kwargs['identity_card']}")
+    Args:
+        limit: Cantidad máxima de clientes a devolver
+        after: Cursor; se devuelven clientes con ID mayor a este valor
+        fields: Solo se cargan estos campos (opcional)
     
-    return True
+    Returns:
+        tuple: (lista de clientes, cursor siguiente o None)
+    """
+    query = Client.query.options(*load_only_options(Client, fields))
+    return paginate_by_key(query, Client.client_id, limit, after)
 
-def get_all_clients():
+def iter_all_clients(batch_size=STREAM_BATCH_SIZE, fields=None):
     """
-    Obtiene todos los clientes del sistema.
+    Recorre todos los clientes ordenados por ID, leyéndolos por lotes.
+    
+    Args:
+        batch_size: Cantidad de filas que se leen de la base de datos por lote
+        fields: Solo se cargan estos campos (opcional)
     
     Returns:
-        List[Client]: Lista de todos los clientes
+        Query: Consulta que entrega los clientes sin cargar toda la tabla en memoria
     """
-    return Client.query.all()
+    query = Client.query.options(*load_only_options(Client, fields))
+    return query.order_by(Client.client_id).yield_per(batch_size)
 
-def get_client_by_id(client_id):
+def get_client_by_id(client_id, fields=None):
     """
     Obtiene un cliente por su ID.
     
     Args:
         client_id: ID del cliente a buscar
+        fields: Solo se cargan estos campos (opcional)
     
     Returns:
         Client: Cliente encontrado
@@ -83,11 +97,11 @@ def get_client_by_id(client_id):
         BadRequest: Si el ID no es un entero
         NotFound: Si el cliente no existe
     """
-    return validate_client(client_id)
+    return validate_client(client_id, fields)
 
-def search_clients(identity_card):
+def get_client_by_identity_card(identity_card):
     """
-    Busca un cliente por su número de identidad.
+    Busca un cliente por su número de identidad exacto.
     
     Args:
         identity_card: Número de identidad del cliente a buscar
@@ -103,6 +117,43 @@ def search_clients(identity_card):
         raise NotFound(f"Client not found: {identity_card}")
     return client
 
+def search_clients(q, limit=DEFAULT_SEARCH_LIMIT, fields=None):
+    """
+    Busca clientes por prefijo de nombre, apellido, número de identidad, teléfono o email.
+    
+    La búsqueda usa el índice FTS5 clients_fts, así que su costo no depende de la
+    cantidad de clientes. Los resultados se ordenan por relevancia (bm25), dando más
+    peso a nombre, apellido y número de identidad que a teléfono y email.
+    
+    Args:
+        q: Texto de búsqueda; cada palabra se busca como prefijo y todas deben coincidir
+        limit: Cantidad máxima de resultados
+        fields: Solo se cargan estos campos (opcional)
+    
+    Returns:
+        list: Clientes encontrados, del más al menos relevante
+    
+    Raises:
+        BadRequest: Si el texto no contiene palabras
+    """
+    match = build_prefix_match(q)
+    if match is None:
+        raise BadRequest("Search query must contain letters or digits")
+    
+    client_ids = db.session.execute(
+        text(
+            "SELECT rowid FROM clients_fts WHERE clients_fts MATCH :match "
+            "ORDER BY bm25(clients_fts, 10.0, 10.0, 5.0, 2.0, 1.0), rowid LIMIT :limit"
+        ),
+        {'match': match, 'limit': limit}
+    ).scalars().all()
+    if not client_ids:
+        return []
+    
+    query = Client.query.options(*load_only_options(Client, fields)).filter(Client.client_id.in_(client_ids))
+    clients = {client.client_id: client for client in query}
+    return [clients[client_id] for client_id in client_ids if client_id in clients]
+
 def create_client(name, last_name, identity_card, phone, email=None, address=None):
     """
     Crea un nuevo cliente en el sistema.
@@ -140,9 +191,7 @@ def create_client(name, last_name, identity_card, phone, email=None, address=Non
         address=address
     )
     
-    db.session.add(client)
-    db.session.commit()
-    return client
+    return save(client, _client_conflicts(identity_card))
 
 def update_client(client_id, **kwargs):
     """
@@ -161,7 +210,7 @@ def update_client(client_id, **kwargs):
         Conflict: Si el nuevo número de identidad ya existe
     """
     client = validate_client(client_id)
-    validate_client_fields(**kwargs)
+    validate_client_fields(partial=True, **kwargs)
     
     if 'name' in kwargs:
         client.name = kwargs['name']
@@ -176,7 +225,7 @@ def update_client(client_id, **kwargs):
     if 'address' in kwargs:
         client.address = kwargs['address']
     
-    db.session.commit()
+    commit_or_conflict(_client_conflicts(kwargs.get('identity_card')))
     return client
 
 def delete_client(client_id):
@@ -0,0 +1,194 @@
+from decimal import Decimal
+from flask import current_app
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from src import db
+from src.models import Product, Supplier, Client
+from src.services.category_service import find_category_ref
+from src.services.catalog_service import bump_catalog_version
+from src.services.product_service import invalidate_product_suggestions
+from src.utils.bulk_import import (
+    iter_records,
+    iter_batches,
+    to_int,
+    to_number,
+    ImportReport,
+    DEFAULT_IMPORT_BATCH_SIZE
+)
+from src.utils.validations import PRODUCT_SCHEMA, CLIENT_SCHEMA
+
+def _run_import(records, schema, prepare_row, filter_batch, model, report, before_commit=None):
+    """
+    Valida e inserta registros por lotes, cada lote en su propia transacción.
+
+    Cada lote se valida con una sola llamada a schema.validate_many(), así una fila
+    inválida no cuesta una excepción. Los lotes confirmados quedan guardados aunque un
+    lote posterior falle; report lleva la cuenta de lo insertado hasta ese momento.
+
+    Args:
+        records: Iterable de (número de fila, registro, error) producido por iter_records
+        schema: Esquema con el que se validan los valores de cada fila
+        prepare_row: Función que convierte un registro en los valores a insertar
+        filter_batch: Función que descarta, con consultas por lote, las filas en conflicto
+        model: Modelo en el que se insertan las filas
+        report: ImportReport en el que se registran las filas insertadas y los errores
+        before_commit: Función sin argumentos que se ejecuta en la transacción de cada lote (opcional)
+
+    Returns:
+        ImportReport: El mismo report
+    """
+    batch_size = current_app.config.get('IMPORT_BATCH_SIZE', DEFAULT_IMPORT_BATCH_SIZE)
+
+    for batch in iter_batches(records, batch_size):
+        rows = []
+        for row_number, record, error in batch:
+            if error:
+                report.add_error(row_number, error)
+                continue
+            rows.append((row_number, prepare_row(record)))
+
+        invalid = schema.validate_many(values for _, values in rows)
+        if invalid:
+            for position, errors in invalid.items():
+                report.add_error(rows[position][0], '; '.join(errors.values()))
+            rows = [row for position, row in enumerate(rows) if position not in invalid]
+
+        rows = filter_batch(rows, report)
+        if not rows:
+            continue
+        try:
+            # executemany: una sola sentencia para todo el lote
+            db.session.execute(insert(model), [values for _, values in rows])
+            if before_commit is not None:
+                before_commit()
+            db.session.commit()
+            report.inserted += len(rows)
+        except IntegrityError:
+            # Otra petición insertó un duplicado entre la validación y el insert
+            db.session.rollback()
+            for row_number, _ in rows:
+                report.add_error(row_number, "Row conflicts with existing data")
+    return report
+
+def _is_id(value):
+    return value.__class__ is int
+
+def _prepare_product(record):
+    # Solo convierte los valores de CSV; la validación se hace por lote
+    return {
+        'name': record.get('name'),
+        'price': to_number(record.get('price')),
+        'stock': to_int(record.get('stock')),
+        'category_id': to_int(record.get('category_id')),
+        'supplier_id': to_int(record.get('supplier_id'))
+    }
+
+def _filter_products(rows, report):
+    if not rows:
+        return rows
+    names = {values['name'] for _, values in rows}
+    supplier_ids = {values['supplier_id'] for _, values in rows if _is_id(values['supplier_id'])}
+    existing_names = {name for (name,) in db.session.query(Product.name).filter(Product.name.in_(names))}
+    known_suppliers = {
+        supplier_id for (supplier_id,) in
+        db.session.query(Supplier.supplier_id).filter(Supplier.supplier_id.in_(supplier_ids))
+    }
+
+    accepted = []
+    for row_number, values in rows:
+        category_id, supplier_id = values['category_id'], values['supplier_id']
+        if not _is_id(category_id):
+            report.add_error(row_number, "Category ID must be an integer")
+        elif find_category_ref(category_id) is None:
+            report.add_error(row_number, f"Category not found: {category_id}")
+        elif not _is_id(supplier_id):
+            report.add_error(row_number, "Supplier ID must be an integer")
+        elif values['name'] in existing_names:
+            report.add_error(row_number, f"Product already exists: {values['name']}")
+        elif supplier_id not in known_suppliers:
+            report.add_error(row_number, f"Supplier not found: {supplier_id}")
+        else:
+            # Los repetidos dentro del mismo archivo también son conflicto
+            existing_names.add(values['name'])
+            values['price'] = Decimal(str(values['price']))
+            accepted.append((row_number, values))
+    return accepted
+
+def import_products(stream, mimetype):
+    """
+    Import products from a CSV or NDJSON stream.
+
+    Rows are validated and inserted in batches: uniqueness and supplier checks run one
+    query per batch and each batch is inserted with a single executemany in its own
+    transaction. Invalid rows are reported and skipped.
+
+    Args:
+        stream: Binary stream with the rows (name, price, stock, category_id, supplier_id)
+        mimetype (str): text/csv or application/x-ndjson
+
+    Returns:
+        ImportReport: Inserted row count and per-row errors
+
+    Raises:
+        UnsupportedMediaType: If the content type is not CSV or NDJSON
+    """
+    report = ImportReport()
+    try:
+        # Each batch bumps the catalog version in its own transaction
+        _run_import(iter_records(stream, mimetype), PRODUCT_SCHEMA, _prepare_product, _filter_products,
+                    Product, report, bump_catalog_version)
+    finally:
+        # Committed batches stay even if a later batch failed
+        if report.inserted:
+            invalidate_product_suggestions()
+    return report
+
+def _prepare_client(record):
+    get = record.get
+    return {
+        'name': get('name'),
+        'last_name': get('last_name'),
+        'identity_card': get('identity_card'),
+        'phone': get('phone'),
+        'email': get('email'),
+        'address': get('address')
+    }
+
+def _filter_clients(rows, report):
+    if not rows:
+        return rows
+    cards = {values['identity_card'] for _, values in rows}
+    existing_cards = {
+        card for (card,) in
+        db.session.query(Client.identity_card).filter(Client.identity_card.in_(cards))
+    }
+
+    accepted = []
+    for row_number, values in rows:
+        if values['identity_card'] in existing_cards:
+            report.add_error(row_number, f"Client already exists: {values['identity_card']}")
+        else:
+            existing_cards.add(values['identity_card'])
+            accepted.append((row_number, values))
+    return accepted
+
+def import_clients(stream, mimetype):
+    """
+    Importa clientes desde un flujo CSV o NDJSON.
+
+    Las filas se validan e insertan por lotes: la unicidad del número de identidad se
+    comprueba con una consulta por lote y cada lote se inserta con un solo executemany
+    en su propia transacción. Las filas inválidas se reportan y se omiten.
+
+    Args:
+        stream: Flujo binario con las filas (name, last_name, identity_card, phone, email, address)
+        mimetype: text/csv o application/x-ndjson
+
+    Returns:
+        ImportReport: Cantidad de filas insertadas y errores por fila
+
+    Raises:
+        UnsupportedMediaType: Si el tipo de contenido no es CSV ni NDJSON
+    """
+    return _run_import(iter_records(stream, mimetype), CLIENT_SCHEMA, _prepare_client, _filter_clients, Client,
+                       ImportReport())
@@ -0,0 +1,139 @@
+import os
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import lru_cache
+from flask import current_app
+from werkzeug.exceptions import ServiceUnavailable
+from werkzeug.security import generate_password_hash, check_password_hash
+
+DEFAULT_HASH_METHOD = 'scrypt'
+# La mitad de los núcleos: el resto queda libre para las peticiones que no hacen hashing
+DEFAULT_HASH_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+
+_executor = None
+_pending = None
+_executor_lock = threading.Lock()
+
+def _config(key, default):
+    return current_app.config.get(key, default)
+
+def _get_executor():
+    """
+    Obtiene el pool de hilos dedicado al hashing, creándolo la primera vez.
+
+    El pool limita cuántos hashes se calculan a la vez (PASSWORD_HASH_WORKERS) y el
+    semáforo limita cuántos pueden esperar (PASSWORD_HASH_MAX_PENDING), así una ráfaga
+    de logins no ocupa todos los núcleos que atienden el resto de la API.
+
+    Returns:
+        tuple: (ThreadPoolExecutor, BoundedSemaphore)
+    """
+    global _executor, _pending
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                workers = _config('PASSWORD_HASH_WORKERS', DEFAULT_HASH_WORKERS)
+                max_pending = _config('PASSWORD_HASH_MAX_PENDING', workers * 8)
+                _pending = threading.BoundedSemaphore(max_pending)
+                _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password-hash')
+    return _executor, _pending
+
+def _run(function, *args):
+    """
+    Ejecuta una función de hashing en el pool y espera el resultado.
+
+    hashlib libera el GIL durante scrypt y pbkdf2, así que los hilos del pool
+    trabajan en paralelo mientras el hilo de la petición espera.
+
+    Raises:
+        ServiceUnavailable: Si hay demasiadas operaciones pendientes o el resultado tarda demasiado
+    """
+    executor, pending = _get_executor()
+    timeout = _config('PASSWORD_HASH_TIMEOUT', 10)
+    if not pending.acquire(timeout=timeout):
+        raise ServiceUnavailable("Too many concurrent password operations, try again")
+    try:
+        future = executor.submit(function, *args)
+    except BaseException:
+        pending.release()
+        raise
+    # El cupo se libera cuando la tarea termina y no cuando deja de esperarse: cancel()
+    # no detiene un hash que ya está en ejecución, y liberarlo antes rompería el límite
+    future.add_done_callback(lambda _: pending.release())
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeoutError:
+        future.cancel()
+        raise ServiceUnavailable("Password operation timed out, try again")
+
+def get_hash_method():
+    """
+    Obtiene el método de hashing configurado (PASSWORD_HASH_METHOD), por ejemplo
+    'scrypt', 'scrypt:65536:8:1' o 'pbkdf2:sha256:600000'.
+
+    Returns:
+        str: Método en el formato de werkzeug
+    """
+    return _config('PASSWORD_HASH_METHOD', DEFAULT_HASH_METHOD)
+
+@lru_cache(maxsize=8)
+def _hash_prefix(method):
+    # werkzeug completa los parámetros por defecto (p. ej. 'scrypt' -> 'scrypt:32768:8:1');
+    # se calcula una vez por método para comparar con los hashes guardados
+    return generate_password_hash('', method=method).split('$', 1)[0]
+
+def hash_password(password):
+    """
+    Calcula el hash de una contraseña con el método configurado, fuera del hilo de la petición.
+
+    Args:
+        password: Contraseña en texto plano
+
+    Returns:
+        str: Hash en el formato de werkzeug (método$sal$hash)
+    """
+    return _run(generate_password_hash, password, get_hash_method())
+
+def verify_password(stored_hash, password):
+    """
+    Verifica una contraseña contra su hash, fuera del hilo de la petición.
+
+    Args:
+        stored_hash: Hash guardado
+        password: Contraseña en texto plano
+
+    Returns:
+        bool: True si la contraseña es correcta
+    """
+    return _run(check_password_hash, stored_hash, password)
+
+@lru_cache(maxsize=8)
+def _unknown_user_hash(method):
+    return generate_password_hash(secrets.token_hex(16), method=method)
+
+def verify_unknown_user(password):
+    """
+    Hace el mismo trabajo que verify_password para un usuario que no existe, así el
+    tiempo de respuesta del login no revela qué nombres de usuario existen.
+
+    Args:
+        password: Contraseña en texto plano
+
+    Returns:
+        bool: Siempre False
+    """
+    _run(check_password_hash, _unknown_user_hash(get_hash_method()), password)
+    return False
+
+def needs_rehash(stored_hash):
+    """
+    Indica si un hash fue generado con parámetros distintos a los configurados.
+
+    Args:
+        stored_hash: Hash guardado
+
+    Returns:
+        bool: True si conviene recalcular el hash con los parámetros actuales
+    """
+    return stored_hash.split('$', 1)[0] != _hash_prefix(get_hash_method())
@@ -0,0 +1,76 @@
+from src.models import Payment
+from werkzeug.exceptions import NotFound, BadRequest
+from src.utils.cache import ReferenceCache
+
+_payment_cache = ReferenceCache(
+    lambda: {payment.payment_id: payment.to_dict() for payment in Payment.query.order_by(Payment.payment_id)}
+)
+
+def get_payment_ref(payment_id):
+    """
+    Get a payment method from the in-process reference cache, without querying the database.
+    
+    Args:
+        payment_id (int): The ID of the payment method
+        
+    Returns:
+        dict: The payment method data
+        
+    Raises:
+        BadRequest: If payment_id is not an integer
+        NotFound: If payment method is not found
+    """
+    if not isinstance(payment_id, int):
+        raise BadRequest("Payment ID must be an integer")
+    
+    payment = _payment_cache.get(payment_id)
+    if not payment:
+        raise NotFound(f"Payment not found: {payment_id}")
+    return payment
+
+def invalidate_payment_cache():
+    """
+    Discard the cached payment methods. Must be called after any write to the payments table.
+    """
+    _payment_cache.invalidate()
+
+def validate_payment(payment_id):
+    """
+    Validate if a payment method exists.
+    
+    Args:
+        payment_id (int): The ID of the payment method to validate
+        
+    Returns:
+        Payment: The validated payment method instance
+        
+    Raises:
+        BadRequest: If payment_id is not an integer
+        NotFound: If payment method is not found
+    """
+    if not isinstance(payment_id, int):
+        raise BadRequest("Payment ID must be an integer")
+    
+    payment = Payment.query.get(payment_id)
+    if not payment:
+        raise NotFound(f"Payment not found: {payment_id}")
+    return payment
+
+def get_all_payment_refs():
+    """
+    Get the data of all payment methods from the in-process reference cache,
+    without querying the database.
+    
+    Returns:
+        list: Dictionaries with the data of every payment method, ordered by ID
+    """
+    return _payment_cache.all()
+
+def get_all_payments():
+    """
+    Get all payment methods.
+    
+    Returns:
+        list: List of all payment methods
+    """
+    return Payment.query.order_by(Payment.payment_id).all()
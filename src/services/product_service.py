@@ -1,18 +1,24 @@
 from src import db
-from src.models import Product
-from src.services.category_service import validate_category
+from src.models import Product, SaleDetail
+from src.services.category_service import get_category_ref
+from src.services.catalog_service import bump_catalog_version, get_catalog_version
+from src.services.report_service import invalidate_sales_reports
+from src.services.supplier_service import validate_supplier
+from src.utils.persistence import save, commit_or_conflict
 from werkzeug.exceptions import NotFound, Conflict, BadRequest
-from src.utils.validations import (
-    validate_string_field,
-    validate_numeric_field
-)
+from src.utils.pagination import paginate_by_key, DEFAULT_PAGE_SIZE
+from src.utils.fields import load_only_options
+from src.utils.streaming import STREAM_BATCH_SIZE
+from src.utils.search import PrefixIndex, DEFAULT_SEARCH_LIMIT
+from src.utils.validations import PRODUCT_SCHEMA
 
-def validate_product(product_id):
+def validate_product(product_id, fields=None):
     """
     Validate if a product exists.
     
     Args:
         product_id (int): The ID of the product to validate
+        fields (tuple, optional): Only load these fields (see src/utils/fields.py)
         
     Returns:
         Product: The validated product instance
@@ -24,62 +30,167 @@ def validate_product(product_id):
     if not isinstance(product_id, int):
         raise BadRequest("Product ID must be an integer")
     
-    product = Product.query.get(product_id)
+    product = Product.query.options(*load_only_options(Product, fields)).get(product_id)
     if not product:
         raise NotFound(f"Product not found: {product_id}")
     return product
 
-def validate_product_fields(**kwargs):
+def validate_product_fields(partial=False, **kwargs):
     """
-    Validate product fields.
+    Validate product fields against PRODUCT_SCHEMA.
     
     Args:
+        partial (bool, optional): Only validate the fields that are present (updates)
         **kwargs: Product fields to validate
         
     Returns:
         bool: True if all validations pass
         
     Raises:
-        BadRequest: If any validation fails
-        Conflict: If product name already exists
+        ValidationError: With every field that fails validation
+    """
+    PRODUCT_SCHEMA.validate(kwargs, partial)
+    return True
+
+def _product_conflicts(name):
+    return {Product.name: f"Product already exists: {name}"}
+
+def _suggestion(product_id, name, price, stock):
+    return {'id': product_id, 'name': name, 'price': price, 'stock': stock}
+
+def _load_suggestions():
+    rows = db.session.query(Product.product_id, Product.name, Product.price, Product.stock)
+    return [(row.product_id, row.name, _suggestion(*row)) for row in rows]
+
+# Índice de nombres para autocompletar; se actualiza en cada escritura de productos o stock
+# y se recarga cuando la versión del catálogo muestra escrituras de otros procesos
+_suggest_index = PrefixIndex(_load_suggestions, get_catalog_version)
+
+def _index_product(product, version):
+    _suggest_index.upsert(
+        product.product_id,
+        product.name,
+        _suggestion(product.product_id, product.name, product.price, product.stock)
+    )
+    _suggest_index.advance(version)
+
+def suggest_products(q, limit=DEFAULT_SEARCH_LIMIT):
     """
-    validate_string_field(kwargs.get('name'), 'Name')
-    validate_numeric_field(kwargs.get('price'), 'Price')
-    validate_numeric_field(kwargs.get('stock'), 'Stock')
+    Get products whose name, or any word of it, starts with the given text.
     
-    if 'name' in kwargs:
-        existing_product = Product.query.filter_by(name=kwargs['name']).first()
-        if existing_product:
-            raise Conflict(f"Product already exists: {kwargs['name']}")
+    Served from an in-memory prefix index. Each call only reads the catalog version;
+    the index is rebuilt when another process changed the catalog.
     
-    return True
+    Args:
+        q (str): Text typed by the user (case and accents are ignored)
+        limit (int, optional): Maximum number of suggestions
+    
+    Returns:
+        list: Dictionaries with id, name, price and stock
+    """
+    return _suggest_index.search(q, limit)
+
+def refresh_product_suggestions(product_ids, version):
+    """
+    Reload the price and stock of some products into the suggestion index.
+    Must be called after committing stock changes made outside this service.
+    
+    Args:
+        product_ids (iterable): IDs of the changed products
+        version (int): Catalog version returned by bump_catalog_version() for the change
+    """
+    if not _suggest_index.is_loaded():
+        return
+    rows = db.session.query(Product.product_id, Product.name, Product.price, Product.stock).filter(
+        Product.product_id.in_(list(product_ids))
+    )
+    for row in rows:
+        _suggest_index.upsert(row.product_id, row.name, _suggestion(*row))
+    _suggest_index.advance(version)
 
-def get_all_products():
+def apply_product_suggestions(products, version):
     """
-    Get all products.
+    Update the suggestion index with product data the caller already has, without
+    querying the database. Must be called after committing the change.
+    
+    Args:
+        products (iterable): Tuples (product_id, name, price, stock) with the new values
+        version (int): Catalog version returned by bump_catalog_version() for the change
+    """
+    for product_id, name, price, stock in products:
+        _suggest_index.upsert(product_id, name, _suggestion(product_id, name, price, stock))
+    _suggest_index.advance(version)
+
+def invalidate_product_suggestions():
+    """
+    Discard the suggestion index; it is rebuilt on the next suggestion request.
+    """
+    _suggest_index.invalidate()
+
+def get_all_products(limit=DEFAULT_PAGE_SIZE, after=None, fields=None):
+    """
+    Get a page of products ordered by ID.
+    
+    Args:
+        limit (int, optional): Maximum number of products to return
+        after (int, optional): Return products with an ID greater than this cursor
+        fields (tuple, optional): Only load these fields
     
     Returns:
-        list: List of all products
+        tuple: (list of products, next cursor or None)
     """
-    return Product.query.all()
+    query = Product.query.options(*load_only_options(Product, fields))
+    return paginate_by_key(query, Product.product_id, limit, after)
 
-def get_all_products_by_category(category_id):
-    category = validate_category(category_id)
-    return Product.query.filter_by(category_id=category.category_id).all()
+def get_all_products_by_category(category_id, limit=DEFAULT_PAGE_SIZE, after=None, fields=None):
+    """
+    Get a page of products of a category ordered by ID.
+    
+    Args:
+        category_id (int): The ID of the category
+        limit (int, optional): Maximum number of products to return
+        after (int, optional): Return products with an ID greater than this cursor
+        fields (tuple, optional): Only load these fields
+    
+    Returns:
+        tuple: (list of products, next cursor or None)
+    """
+    get_category_ref(category_id)
+    query = Product.query.options(*load_only_options(Product, fields)).filter_by(category_id=category_id)
+    return paginate_by_key(query, Product.product_id, limit, after)
 
-def get_product_by_id(product_id):
+def iter_all_products(category_id=None, batch_size=STREAM_BATCH_SIZE, fields=None):
+    """
+    Iterate over all products ordered by ID, reading them in batches.
+    
+    Args:
+        category_id (int, optional): Only iterate products of this category
+        batch_size (int, optional): Number of rows fetched from the database per batch
+        fields (tuple, optional): Only load these fields
+        
+    Returns:
+        Query: Query that yields products without loading the whole table in memory
+    """
+    query = Product.query.options(*load_only_options(Product, fields))
+    if category_id is not None:
+        get_category_ref(category_id)
+        query = query.filter_by(category_id=category_id)
+    return query.order_by(Product.product_id).yield_per(batch_size)
+
+def get_product_by_id(product_id, fields=None):
     """
     Get a product by its ID.
     
     Args:
         product_id (int): The ID of the product to get
+        fields (tuple, optional): Only load these fields
         
     Returns:
         Product: The requested product
     """
-    return validate_product(product_id)
+    return validate_product(product_id, fields)
 
-def create_product(name, price, stock, description=None):
+def create_product(name, price, stock, category_id, supplier_id):
     """
     Create a new product.
     
@@ -87,26 +198,36 @@ def create_product(name, price, stock, description=None):
         name (str): Product name
         price (float): Product price
         stock (int): Product stock quantity
-        description (str, optional): Product description. Defaults to None.
+        category_id (int): The ID of the product category
+        supplier_id (int): The ID of the product supplier
     
     Returns:
         Product: The created product instance
+        
+    Raises:
+        BadRequest: If any validation fails
+        NotFound: If the category or supplier is not found
+        Conflict: If product name already exists
     """
     validate_product_fields(
         name=name,
         price=price,
         stock=stock
     )
+    get_category_ref(category_id)
+    validate_supplier(supplier_id)
     
     product = Product(
         name=name,
         price=price,
         stock=stock,
-        description=description
+        category_id=category_id,
+        supplier_id=supplier_id
     )
     
-    db.session.add(product)
-    db.session.commit()
+    version = bump_catalog_version()
+    save(product, _product_conflicts(name))
+    _index_product(product, version)
     return product
 
 def update_product(product_id, **kwargs):
@@ -119,9 +240,12 @@ def update_product(product_id, **kwargs):
         
     Returns:
         Product: The updated product instance
+        
+    Raises:
+        Conflict: If the new product name already exists
     """
     product = validate_product(product_id)
-    validate_product_fields(**kwargs)
+    validate_product_fields(partial=True, **kwargs)
     
     if 'name' in kwargs:
         product.name = kwargs['name']
@@ -129,17 +253,22 @@ def update_product(product_id, **kwargs):
         product.price = kwargs['price']
     if 'stock' in kwargs:
         product.stock = kwargs['stock']
-    if 'description' in kwargs:
-        product.description = kwargs['description']
     
-    db.session.commit()
+    version = bump_catalog_version()
+    commit_or_conflict(_product_conflicts(kwargs.get('name')))
+    if 'name' in kwargs:
+        # The memoized sales reports carry the product name
+        invalidate_sales_reports()
+    _index_product(product, version)
     return product
 
 def update_stock(product_id, stock):
     product = validate_product(product_id)
-    validate_product_fields(stock=stock)
+    validate_product_fields(partial=True, stock=stock)
     product.stock = stock
+    version = bump_catalog_version()
     db.session.commit()
+    _index_product(product, version)
     return product
 
 def delete_product(product_id):
@@ -154,9 +283,16 @@ def delete_product(product_id):
     """
     product = validate_product(product_id)
     
-    if product.sale_details:
+    has_sales = db.session.query(
+        SaleDetail.query.filter_by(product_id=product.product_id).exists()
+    ).scalar()
+    if has_sales:
         raise Conflict(f"Cannot delete product with associated sales: {product.name}")
     
+    product_id = product.product_id
     db.session.delete(product)
+    version = bump_catalog_version()
     db.session.commit()
+    _suggest_index.remove(product_id)
+    _suggest_index.advance(version)
     return True
@@ -0,0 +1,254 @@
+import datetime
+from sqlalchemy import func, insert, delete, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from src import db
+from src.models import Sale, SaleDetail, Product, Category, DailySalesSummary
+from src.utils.cache import MemoCache
+from werkzeug.exceptions import BadRequest
+
+# Reportes de productos y categorías; se invalidan cada vez que se crea o cancela una venta
+# y cuando se renombra un producto o una categoría
+_sales_report_cache = MemoCache()
+
+def record_sale_in_summary(sale, sign=1):
+    """
+    Suma (o resta) una venta en el resumen diario, dentro de la transacción abierta.
+
+    No hace commit: quien registra o cancela la venta confirma ambas cosas juntas.
+
+    Args:
+        sale: Venta con date, payment_id, user_id y total
+        sign: 1 al crear la venta, -1 al cancelarla
+    """
+    table = DailySalesSummary.__table__
+    stmt = sqlite_insert(table).values(
+        day=sale.date.date(),
+        payment_id=sale.payment_id,
+        user_id=sale.user_id,
+        sales_count=sign,
+        revenue=sale.total * sign
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.day, table.c.payment_id, table.c.user_id],
+        set_={
+            'sales_count': table.c.sales_count + stmt.excluded.sales_count,
+            'revenue': table.c.revenue + stmt.excluded.revenue
+        }
+    )
+    db.session.execute(stmt)
+
+def rebuild_daily_sales_summary():
+    """
+    Reconstruye el resumen diario a partir de todas las ventas completadas.
+
+    Sirve para cargar el resumen en una base que ya tenía ventas o para corregirlo.
+    Se ejecuta como un solo INSERT ... SELECT dentro de una transacción.
+
+    Returns:
+        int: Cantidad de filas del resumen
+    """
+    day = func.date(Sale.date)
+    summary = (
+        select(
+            day,
+            Sale.payment_id,
+            Sale.user_id,
+            func.count(Sale.sale_id),
+            func.sum(Sale.total)
+        )
+        .where(Sale.status == 'completed')
+        .group_by(day, Sale.payment_id, Sale.user_id)
+    )
+    try:
+        db.session.execute(delete(DailySalesSummary))
+        db.session.execute(
+            insert(DailySalesSummary.__table__).from_select(
+                ['day', 'payment_id', 'user_id', 'sales_count', 'revenue'], summary
+            )
+        )
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return db.session.query(func.count()).select_from(DailySalesSummary).scalar()
+
+def _summary_query(columns, date_from=None, date_to=None):
+    """
+    Construye una consulta agregada sobre el resumen diario.
+
+    Args:
+        columns: Columnas de agrupación
+        date_from: Incluye días desde esta fecha (opcional)
+        date_to: Incluye días anteriores a esta fecha (opcional, exclusivo)
+
+    Returns:
+        Query: Consulta con sales_count y revenue sumados por las columnas pedidas
+    """
+    query = db.session.query(
+        *columns,
+        func.sum(DailySalesSummary.sales_count).label('sales_count'),
+        func.sum(DailySalesSummary.revenue).label('revenue')
+    )
+    if date_from is not None:
+        query = query.filter(DailySalesSummary.day >= date_from.date())
+    if date_to is not None:
+        # date_to es exclusivo; si trae hora, el día de date_to se incluye
+        if date_to.time() == datetime.time.min:
+            query = query.filter(DailySalesSummary.day < date_to.date())
+        else:
+            query = query.filter(DailySalesSummary.day <= date_to.date())
+    return query.group_by(*columns).order_by(*columns)
+
+def get_daily_sales(date_from=None, date_to=None):
+    """
+    Obtiene la cantidad de ventas y los ingresos por día.
+
+    Args:
+        date_from: Incluye días desde esta fecha (opcional)
+        date_to: Incluye días anteriores a esta fecha (opcional, exclusivo)
+
+    Returns:
+        list: Lista de {'day', 'sales_count', 'revenue'}
+    """
+    rows = _summary_query([DailySalesSummary.day], date_from, date_to)
+    return [
+        {'day': row.day, 'sales_count': row.sales_count, 'revenue': row.revenue}
+        for row in rows
+    ]
+
+def get_sales_by_payment(date_from=None, date_to=None):
+    """
+    Obtiene la cantidad de ventas y los ingresos por método de pago.
+
+    Args:
+        date_from: Incluye días desde esta fecha (opcional)
+        date_to: Incluye días anteriores a esta fecha (opcional, exclusivo)
+
+    Returns:
+        list: Lista de {'payment_id', 'sales_count', 'revenue'}
+    """
+    rows = _summary_query([DailySalesSummary.payment_id], date_from, date_to)
+    return [
+        {'payment_id': row.payment_id, 'sales_count': row.sales_count, 'revenue': row.revenue}
+        for row in rows
+    ]
+
+def get_sales_by_seller(date_from=None, date_to=None):
+    """
+    Obtiene la cantidad de ventas y los ingresos por vendedor.
+
+    Args:
+        date_from: Incluye días desde esta fecha (opcional)
+        date_to: Incluye días anteriores a esta fecha (opcional, exclusivo)
+
+    Returns:
+        list: Lista de {'user_id', 'sales_count', 'revenue'}
+    """
+    rows = _summary_query([DailySalesSummary.user_id], date_from, date_to)
+    return [
+        {'user_id': row.user_id, 'sales_count': row.sales_count, 'revenue': row.revenue}
+        for row in rows
+    ]
+
+def invalidate_sales_reports():
+    """
+    Descarta los reportes memorizados. Se debe llamar después de confirmar una venta o
+    cancelación y después de renombrar un producto o una categoría.
+    """
+    _sales_report_cache.invalidate()
+
+def _sale_details_query(columns, date_from=None, date_to=None):
+    """
+    Construye una consulta agregada sobre los detalles de ventas completadas.
+
+    Args:
+        columns: Columnas a seleccionar además de las sumas
+        date_from: Incluye ventas desde esta fecha (opcional)
+        date_to: Incluye ventas anteriores a esta fecha (opcional, exclusivo)
+
+    Returns:
+        Query: Consulta con units y revenue sumados
+    """
+    query = (
+        db.session.query(
+            *columns,
+            func.sum(SaleDetail.quantity).label('units'),
+            func.sum(SaleDetail.subtotal).label('revenue')
+        )
+        .select_from(SaleDetail)
+        .join(Sale, Sale.sale_id == SaleDetail.sale_id)
+        .join(Product, Product.product_id == SaleDetail.product_id)
+        .filter(Sale.status == 'completed')
+    )
+    if date_from is not None:
+        query = query.filter(Sale.date >= date_from)
+    if date_to is not None:
+        query = query.filter(Sale.date < date_to)
+    return query
+
+def get_top_products(date_from=None, date_to=None, limit=10, order_by='units'):
+    """
+    Obtiene los productos más vendidos en un rango de fechas.
+
+    Se calcula con un solo GROUP BY sobre sale_details y el resultado se memoriza
+    por (rango, límite, orden) hasta que entra una venta nueva.
+
+    Args:
+        date_from: Incluye ventas desde esta fecha (opcional)
+        date_to: Incluye ventas anteriores a esta fecha (opcional, exclusivo)
+        limit: Cantidad de productos a devolver
+        order_by: 'units' o 'revenue'
+
+    Returns:
+        list: Lista de {'product_id', 'name', 'units', 'revenue'}
+
+    Raises:
+        BadRequest: Si order_by no es válido
+    """
+    if order_by not in ('units', 'revenue'):
+        raise BadRequest("Order must be 'units' or 'revenue'")
+
+    def compute():
+        query = _sale_details_query([Product.product_id, Product.name], date_from, date_to)
+        rows = (
+            query.group_by(Product.product_id, Product.name)
+            .order_by(func.sum(SaleDetail.quantity if order_by == 'units' else SaleDetail.subtotal).desc(),
+                      Product.product_id)
+            .limit(limit)
+            .all()
+        )
+        return [
+            {'product_id': row.product_id, 'name': row.name, 'units': row.units, 'revenue': row.revenue}
+            for row in rows
+        ]
+
+    return _sales_report_cache.get_or_compute(('top_products', date_from, date_to, limit, order_by), compute)
+
+def get_revenue_by_category(date_from=None, date_to=None):
+    """
+    Obtiene las unidades vendidas y los ingresos por categoría en un rango de fechas.
+
+    Se calcula con un solo GROUP BY y el resultado se memoriza por rango hasta que
+    entra una venta nueva.
+
+    Args:
+        date_from: Incluye ventas desde esta fecha (opcional)
+        date_to: Incluye ventas anteriores a esta fecha (opcional, exclusivo)
+
+    Returns:
+        list: Lista de {'category_id', 'name', 'units', 'revenue'} ordenada por ingresos
+    """
+    def compute():
+        query = _sale_details_query([Category.category_id, Category.name], date_from, date_to)
+        rows = (
+            query.join(Category, Category.category_id == Product.category_id)
+            .group_by(Category.category_id, Category.name)
+            .order_by(func.sum(SaleDetail.subtotal).desc(), Category.category_id)
+            .all()
+        )
+        return [
+            {'category_id': row.category_id, 'name': row.name, 'units': row.units, 'revenue': row.revenue}
+            for row in rows
+        ]
+
+    return _sales_report_cache.get_or_compute(('category_revenue', date_from, date_to), compute)
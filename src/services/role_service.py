@@ -0,0 +1,44 @@
+from src.models import Role
+from werkzeug.exceptions import NotFound, BadRequest
+from src.utils.cache import ReferenceCache
+
+_role_cache = ReferenceCache(
+    lambda: {role.role_id: role.to_dict() for role in Role.query.all()}
+)
+
+def get_role_ref(role_id):
+    """
+    Obtiene un rol desde la caché de referencia del proceso, sin consultar la base de datos.
+    
+    Args:
+        role_id: ID del rol
+    
+    Returns:
+        dict: Datos del rol
+    
+    Raises:
+        BadRequest: Si el ID no es un entero
+        NotFound: Si el rol no existe
+    """
+    if not isinstance(role_id, int):
+        raise BadRequest('Role ID must be an integer')
+    
+    role = _role_cache.get(role_id)
+    if role is None:
+        raise NotFound('Role not found')
+    return role
+
+def get_all_roles():
+    """
+    Obtiene todos los roles desde la caché de referencia.
+    
+    Returns:
+        list: Lista con los datos de cada rol
+    """
+    return _role_cache.all()
+
+def invalidate_role_cache():
+    """
+    Descarta los roles en caché. Se debe llamar después de cualquier escritura en la tabla roles.
+    """
+    _role_cache.invalidate()
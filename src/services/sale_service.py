@@ -1,27 +1,206 @@
 import datetime
+from decimal import Decimal
+from sqlalchemy import bindparam, insert
+from sqlalchemy.orm import selectinload
+from src import db
 from src.models import Sale
 from src.models import Product
 from src.models import Client
 from src.models import User
 from src.models import SaleDetail
+from src.services.client_service import validate_client
+from src.services.user_service import validate_user
+from src.services.payment_service import get_payment_ref
+from src.services.catalog_service import bump_catalog_version, catalog_version_column
+from src.services.product_service import refresh_product_suggestions, apply_product_suggestions
+from src.services.report_service import record_sale_in_summary, invalidate_sales_reports
+from werkzeug.exceptions import NotFound, Conflict, BadRequest
+from src.utils.pagination import paginate_by_key, DEFAULT_PAGE_SIZE
 
-def create_sale():
+def _normalize_cart(items):
     """
-    Crea una nueva venta en el sistema.
+    Convierte el carrito en un diccionario {product_id: quantity}, sumando productos repetidos.
+    
+    Args:
+        items: Lista de diccionarios {'product_id', 'quantity'} o de tuplas (product_id, quantity)
+    
+    Returns:
+        dict: Cantidad total pedida por producto, en el orden en que aparecen
+    
+    Raises:
+        BadRequest: Si el carrito está vacío o alguna línea no es válida
+    """
+    if not items:
+        raise BadRequest("Sale must have at least one product")
+    
+    cart = {}
+    for item in items:
+        if isinstance(item, dict):
+            product_id, quantity = item.get('product_id'), item.get('quantity')
+        else:
+            try:
+                product_id, quantity = item
+            except (TypeError, ValueError):
+                raise BadRequest("Each sale item must have a product_id and a quantity")
+        if not isinstance(product_id, int) or isinstance(product_id, bool):
+            raise BadRequest("Product ID must be an integer")
+        if not isinstance(quantity, int) or isinstance(quantity, bool) or quantity <= 0:
+            raise BadRequest("Quantity must be a positive integer")
+        cart[product_id] = cart.get(product_id, 0) + quantity
+    return cart
+
+def _utcnow():
+    # Misma referencia horaria que CURRENT_TIMESTAMP de SQLite (UTC, sin zona)
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+# Descuenta el stock solo si alcanza; si no alcanza la fila no se modifica
+_decrement_stock = (
+    Product.__table__.update()
+    .where(Product.__table__.c.product_id == bindparam('p_id'))
+    .where(Product.__table__.c.stock >= bindparam('qty'))
+    .values(stock=Product.__table__.c.stock - bindparam('qty'))
+)
+
+_restock = (
+    Product.__table__.update()
+    .where(Product.__table__.c.product_id == bindparam('p_id'))
+    .values(stock=Product.__table__.c.stock + bindparam('qty'))
+)
+
+def create_sale(client_id, user_id, payment_id, items):
+    """
+    Crea una nueva venta en el sistema en una sola transacción.
+    
+    Los productos se validan con una sola consulta IN, el stock se descuenta con
+    UPDATE condicionados (stock >= cantidad) para que dos cajas no vendan el mismo
+    stock, y los detalles se insertan en bloque. Si algo falla no se guarda nada.
+    
+    Args:
+        client_id: ID del cliente
+        user_id: ID del usuario (vendedor)
+        payment_id: ID del método de pago
+        items: Carrito como lista de {'product_id', 'quantity'} o de tuplas (product_id, quantity)
     
     Returns:
         Sale: Venta creada
+    
+    Raises:
+        BadRequest: Si el carrito o algún ID no es válido
+        NotFound: Si el cliente, el usuario, el método de pago o algún producto no existe
+        Conflict: Si no hay stock suficiente para algún producto
     """
-    return
+    cart = _normalize_cart(items)
+    validate_client(client_id)
+    validate_user(user_id)
+    get_payment_ref(payment_id)
+    
+    # La versión del catálogo se lee en la misma consulta: si nadie más escribió hasta el
+    # commit, estas filas alcanzan para actualizar el índice de sugerencias
+    rows = db.session.query(
+        Product.product_id, Product.name, Product.price, Product.stock, catalog_version_column()
+    ).filter(
+        Product.product_id.in_(list(cart))
+    ).all()
+    products = {row.product_id: row for row in rows}
+    missing = [product_id for product_id in cart if product_id not in products]
+    if missing:
+        raise NotFound(f"Products not found: {', '.join(map(str, missing))}")
+    
+    details = []
+    total = Decimal('0')
+    for product_id, quantity in cart.items():
+        price = Decimal(products[product_id].price)
+        subtotal = price * quantity
+        total += subtotal
+        details.append({
+            'product_id': product_id,
+            'quantity': quantity,
+            'price': price,
+            'subtotal': subtotal
+        })
+    
+    try:
+        result = db.session.execute(
+            _decrement_stock,
+            [{'p_id': product_id, 'qty': quantity} for product_id, quantity in cart.items()]
+        )
+        if result.rowcount != len(cart):
+            short = [str(product_id) for product_id, quantity in cart.items()
+                     if products[product_id].stock < quantity]
+            raise Conflict(f"Insufficient stock for products: {', '.join(short) or 'unknown'}")
+        
+        sale = Sale(
+            date=_utcnow(),
+            client_id=client_id,
+            user_id=user_id,
+            payment_id=payment_id,
+            total=total
+        )
+        db.session.add(sale)
+        db.session.flush()
+        
+        for detail in details:
+            detail['sale_id'] = sale.sale_id
+        db.session.execute(insert(SaleDetail), details)
+        record_sale_in_summary(sale)
+        # La venta cambia el stock publicado en el catálogo
+        version = bump_catalog_version()
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    if rows[0].catalog_version == version - 1:
+        apply_product_suggestions(
+            ((product_id, products[product_id].name, products[product_id].price,
+              products[product_id].stock - quantity) for product_id, quantity in cart.items()),
+            version
+        )
+    invalidate_sales_reports()
+    return sale
 
-def get_all_sales():
+def _sales_query(client_id=None, date_from=None, date_to=None):
     """
-    Obtiene todas las ventas del sistema.
+    Construye la consulta de ventas con sus detalles precargados y los filtros pedidos.
+    
+    Los detalles se cargan con selectinload: una sola consulta adicional para toda la
+    página en lugar de una por venta.
+    
+    Args:
+        client_id: Filtra por cliente (opcional)
+        date_from: Incluye ventas desde esta fecha (opcional)
+        date_to: Incluye ventas anteriores a esta fecha (opcional, exclusivo)
     
     Returns:
-        List[Sale]: Lista de todas las ventas
+        Query: Consulta de ventas filtrada
     """
-    return
+    query = Sale.query.options(selectinload(Sale.details))
+    if client_id is not None:
+        query = query.filter(Sale.client_id == client_id)
+    if date_from is not None:
+        query = query.filter(Sale.date >= date_from)
+    if date_to is not None:
+        query = query.filter(Sale.date < date_to)
+    return query
+
+def get_all_sales(limit=DEFAULT_PAGE_SIZE, after=None, client_id=None, date_from=None, date_to=None):
+    """
+    Obtiene una página de ventas ordenadas por ID, con sus detalles.
+    
+    La cantidad de consultas es constante (ventas + detalles) sin importar cuántas
+    ventas tenga la página.
+    
+    Args:
+        limit: Cantidad máxima de ventas a devolver
+        after: Cursor; se devuelven ventas con ID mayor a este valor
+        client_id: Filtra por cliente (opcional)
+        date_from: Incluye ventas desde esta fecha (opcional)
+        date_to: Incluye ventas anteriores a esta fecha (opcional, exclusivo)
+    
+    Returns:
+        tuple: (lista de ventas, cursor siguiente o None)
+    """
+    query = _sales_query(client_id, date_from, date_to)
+    return paginate_by_key(query, Sale.sale_id, limit, after)
 
 def get_sale_by_id(sale_id):
     """
@@ -34,9 +213,59 @@ def get_sale_by_id(sale_id):
         Sale: Venta encontrada
     
     Raises:
+        BadRequest: Si el ID no es un entero
         NotFound: Si la venta no existe
     """
-    return
+    if not isinstance(sale_id, int):
+        raise BadRequest("Sale ID must be an integer")
+    
+    sale = Sale.query.options(selectinload(Sale.details)).filter_by(sale_id=sale_id).first()
+    if not sale:
+        raise NotFound(f"Sale not found: {sale_id}")
+    return sale
+
+def cancel_sale(sale_id):
+    """
+    Cancela una venta completada y devuelve su stock, en una sola transacción.
+    
+    El cambio de estado es un UPDATE condicionado (status = 'completed'), así que dos
+    cancelaciones simultáneas no devuelven el stock dos veces. El resumen diario se
+    descuenta en la misma transacción.
+    
+    Args:
+        sale_id: ID de la venta a cancelar
+    
+    Returns:
+        Sale: Venta cancelada
+    
+    Raises:
+        BadRequest: Si el ID no es un entero
+        NotFound: Si la venta no existe
+        Conflict: Si la venta no está completada
+    """
+    sale = get_sale_by_id(sale_id)
+    
+    try:
+        result = db.session.execute(
+            Sale.__table__.update()
+            .where(Sale.__table__.c.sale_id == sale.sale_id)
+            .where(Sale.__table__.c.status == 'completed')
+            .values(status='cancelled')
+        )
+        if result.rowcount != 1:
+            raise Conflict(f"Only completed sales can be cancelled: {sale.sale_id}")
+        
+        restocked = [{'p_id': detail.product_id, 'qty': detail.quantity} for detail in sale.details]
+        db.session.execute(_restock, restocked)
+        record_sale_in_summary(sale, sign=-1)
+        version = bump_catalog_version()
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    refresh_product_suggestions((item['p_id'] for item in restocked), version)
+    invalidate_sales_reports()
+    return sale
 
 def update_sale(sale_id, **kwargs):
     """
@@ -70,17 +299,22 @@ def delete_sale(sale_id):
     """
     return
 
-def get_sales_by_client(client_id):
+def get_sales_by_client(client_id, limit=DEFAULT_PAGE_SIZE, after=None, date_from=None, date_to=None):
     """
-    Obtiene todas las ventas de un cliente específico.
+    Obtiene una página de ventas de un cliente específico, con sus detalles.
     
     Args:
         client_id: ID del cliente
+        limit: Cantidad máxima de ventas a devolver
+        after: Cursor; se devuelven ventas con ID mayor a este valor
+        date_from: Incluye ventas desde esta fecha (opcional)
+        date_to: Incluye ventas anteriores a esta fecha (opcional, exclusivo)
     
     Returns:
-        List[Sale]: Lista de ventas del cliente
+        tuple: (lista de ventas del cliente, cursor siguiente o None)
     
     Raises:
         NotFound: Si el cliente no existe
     """
-    return
\ No newline at end of file
+    validate_client(client_id)
+    return get_all_sales(limit, after, client_id, date_from, date_to)
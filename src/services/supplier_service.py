@@ -1,38 +1,18 @@
 from src import db
 from src.models import Supplier
-from werkzeug.exceptions import NotFound, Conflict, BadRequest
-from src.utils.validations import (
-    validate_string_field,
-    validate_phone,
-    validate_email,
-    validate_address
-)
+from werkzeug.exceptions import NotFound, BadRequest
+from src.utils.pagination import paginate_by_key, DEFAULT_PAGE_SIZE
+from src.utils.fields import load_only_options
+from src.utils.persistence import save, commit_or_conflict
+from src.utils.validations import SUPPLIER_SCHEMA
 
-def validate_nit(nit):
-    """
-    Validate NIT format.
-    
-    Args:
-        nit (str): NIT to validate
-        
-    Raises:
-        BadRequest: If NIT format is invalid
-    """
-    if not nit or not nit.strip():
-        raise BadRequest("NIT cannot be empty")
-    if not isinstance(nit, str):
-        raise BadRequest("NIT must be a string")
-    if not (10 <= len(nit) <= 11):
-        raise BadRequest("NIT must have between 10 and 11 characters")
-    if not nit.isdigit():
-        raise BadRequest("NIT must contain only digits")
-
-def validate_supplier(supplier_id):
+def validate_supplier(supplier_id, fields=None):
     """
     Validate if a supplier exists.
     
     Args:
         supplier_id (int): The ID of the supplier to validate
+        fields (tuple, optional): Only load these fields (see src/utils/fields.py)
         
     Returns:
         Supplier: The validated supplier instance
@@ -44,63 +24,61 @@ def validate_supplier(supplier_id):
     if not isinstance(supplier_id, int):
         raise BadRequest("Supplier ID must be an integer")
     
-    supplier = Supplier.query.get(supplier_id)
+    supplier = Supplier.query.options(*load_only_options(Supplier, fields)).get(supplier_id)
     if not supplier:
         raise NotFound(f"Supplier not found: {supplier_id}")
     return supplier
 
-def validate_supplier_fields(**kwargs):
+def validate_supplier_fields(partial=False, **kwargs):
     """
-    Validate supplier fields.
+    Validate supplier fields against SUPPLIER_SCHEMA.
     
     Args:
+        partial (bool, optional): Only validate the fields that are present (updates)
         **kwargs: Supplier fields to validate
         
     Returns:
         bool: True if all validations pass
         
     Raises:
-        BadRequest: If any validation fails
-        Conflict: If supplier name or NIT already exists
+        ValidationError: With every field that fails validation
     """
-    validate_string_field(kwargs.get('name'), 'Name')
-    validate_phone(kwargs.get('phone'))
-    validate_email(kwargs.get('email'), required=True)
-    validate_address(kwargs.get('address'), required=True)
-    
-    if 'nit' in kwargs:
-        validate_nit(kwargs['nit'])
-        existing_supplier = Supplier.query.filter_by(nit=kwargs['nit']).first()
-        if existing_supplier:
-            raise Conflict(f"Supplier with NIT already exists: {kwargs['nit']}")
-    
-    if 'name' in kwargs:
-        existing_supplier = Supplier.query.filter_by(name=kwargs['name']).first()
-        if existing_supplier:
-            raise Conflict(f"Supplier already exists: {kwargs['name']}")
-    
+    SUPPLIER_SCHEMA.validate(kwargs, partial)
     return True
 
-def get_all_suppliers():
+def _supplier_conflicts(name, nit):
+    return {
+        Supplier.nit: f"Supplier with NIT already exists: {nit}",
+        Supplier.name: f"Supplier already exists: {name}"
+    }
+
+def get_all_suppliers(limit=DEFAULT_PAGE_SIZE, after=None, fields=None):
     """
-    Get all suppliers.
+    Get a page of suppliers ordered by ID.
+    
+    Args:
+        limit (int, optional): Maximum number of suppliers to return
+        after (int, optional): Return suppliers with an ID greater than this cursor
+        fields (tuple, optional): Only load these fields
     
     Returns:
-        list: List of all suppliers
+        tuple: (list of suppliers, next cursor or None)
     """
-    return Supplier.query.all()
+    query = Supplier.query.options(*load_only_options(Supplier, fields))
+    return paginate_by_key(query, Supplier.supplier_id, limit, after)
 
-def get_supplier_by_id(supplier_id):
+def get_supplier_by_id(supplier_id, fields=None):
     """
     Get a supplier by its ID.
     
     Args:
         supplier_id (int): The ID of the supplier to get
+        fields (tuple, optional): Only load these fields
         
     Returns:
         Supplier: The requested supplier
     """
-    return validate_supplier(supplier_id)
+    return validate_supplier(supplier_id, fields)
 
 def get_supplier_by_nit(nit):
     supplier = Supplier.query.filter_by(nit=nit).first()
@@ -138,9 +116,7 @@ def create_supplier(name, phone, nit, email, address):
         address=address
     )
     
-    db.session.add(supplier)
-    db.session.commit()
-    return supplier
+    return save(supplier, _supplier_conflicts(name, nit))
 
 def update_supplier(supplier_id, **kwargs):
     """
@@ -154,7 +130,7 @@ def update_supplier(supplier_id, **kwargs):
         Supplier: The updated supplier instance
     """
     supplier = validate_supplier(supplier_id)
-    validate_supplier_fields(**kwargs)
+    validate_supplier_fields(partial=True, **kwargs)
     
     if 'name' in kwargs:
         supplier.name = kwargs['name']
@@ -167,7 +143,7 @@ def update_supplier(supplier_id, **kwargs):
     if 'address' in kwargs:
         supplier.address = kwargs['address']
     
-    db.session.commit()
+    commit_or_conflict(_supplier_conflicts(kwargs.get('name'), kwargs.get('nit')))
     return supplier
 
 def delete_supplier(supplier_id):
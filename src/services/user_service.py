@@ -1,8 +1,19 @@
 from src import db
-from src.models import User, Role
-from src.utils.validations import validate_string_field, validate_email, validate_numeric_field, validate_password
-from werkzeug.exceptions import NotFound, Conflict, BadRequest
-from werkzeug.security import generate_password_hash, check_password_hash
+from sqlalchemy import or_, and_
+from src.models import User
+from src.utils.validations import USER_SCHEMA
+from werkzeug.exceptions import NotFound, BadRequest, Unauthorized, Conflict
+from src.services.password_service import hash_password, verify_password, verify_unknown_user, needs_rehash
+from src.services.auth_service import invalidate_user_session
+from src.utils.persistence import save, commit_or_conflict
+from src.utils.pagination import paginate_by_key, DEFAULT_PAGE_SIZE
+from src.services.role_service import get_role_ref
+
+USERNAME_MAX_LENGTH = User.__table__.c.username.type.length
+# Espacio que se reserva para el sufijo numérico (".999") cuando la base ya está tomada
+USERNAME_SUFFIX_ROOM = 4
+# Intentos de crear el usuario cuando otra petición toma el mismo nombre de usuario a la vez
+USERNAME_ATTEMPTS = 5
 
 def validate_user(user_id):
     """
@@ -20,26 +31,54 @@ def validate_user(user_id):
     """
     if not isinstance(user_id, int):
         raise BadRequest('User ID must be an integer')
-    user = User.query.filter_by(id=user_id).first()
+    user = User.query.get(user_id)
     if user is None:
         raise NotFound('User not found')
     return user
 
-def validate_user_fields(**kwargs):
+def validate_user_fields(partial=False, **kwargs):
     """
-    Valida todos los campos de un usuario.
+    Valida todos los campos de un usuario con USER_SCHEMA.
     
     Args:
+        partial: Si es True, solo se validan los campos presentes (actualizaciones)
         **kwargs: Diccionario con los campos a validar (name, last_name, email, password, role_id)
     
     Raises:
-        BadRequest: Si algún campo no cumple con las validaciones
+        ValidationError: Con todos los campos que no cumplen con las validaciones
+    """
+    USER_SCHEMA.validate(kwargs, partial)
+
+def allocate_username(name, last_name):
+    """
+    Genera un nombre de usuario libre con la forma nombre.apellido[.N].
+    
+    Con una sola consulta por rango sobre el índice único de username se obtienen
+    la base y todas sus variantes numeradas, y se usa el siguiente sufijo libre.
+    La base se recorta para que el resultado quepa en la columna: nombre.apellido hasta
+    USERNAME_MAX_LENGTH caracteres, y las variantes numeradas sobre una raíz más corta.
+    
+    Args:
+        name: Nombre del usuario
+        last_name: Apellido del usuario
+    
+    Returns:
+        str: Nombre de usuario disponible
     """
-    validate_string_field(kwargs.get('name'), 'Name')
-    validate_string_field(kwargs.get('last_name'), 'Last name')
-    validate_email(kwargs.get('email'), 'Email')
-    validate_numeric_field(kwargs.get('role_id'), 'Role')
-    validate_password(kwargs.get('password'))
+    base = f"{name.lower().replace(' ', '.')}.{last_name.lower().replace(' ', '.')}"[:USERNAME_MAX_LENGTH]
+    stem = base[:USERNAME_MAX_LENGTH - USERNAME_SUFFIX_ROOM].rstrip('.')
+    # '/' es el carácter siguiente a '.', así el rango cubre exactamente stem.*
+    taken = [
+        username for (username,) in db.session.query(User.username).filter(
+            or_(User.username == base, and_(User.username > f"{stem}.", User.username < f"{stem}/"))
+        )
+    ]
+    if base not in taken:
+        return base
+    
+    suffixes = [username[len(stem) + 1:] for username in taken if username.startswith(f"{stem}.")]
+    counter = max((int(suffix) for suffix in suffixes if suffix.isdigit()), default=0) + 1
+    return f"{stem}.{counter}"
 
 def create_user(name, last_name, email, password, role_id):
     """
@@ -56,37 +95,42 @@ def create_user(name, last_name, email, password, role_id):
         User: Usuario creado
     
     Raises:
-        Conflict: Si el email ya existe
+        Conflict: Si el email ya existe, o si el nombre de usuario sigue tomado después
+            de USERNAME_ATTEMPTS intentos
         NotFound: Si el rol no existe
         BadRequest: Si algún campo no cumple con las validaciones
     """
     validate_user_fields(name=name, last_name=last_name, email=email, password=password, role_id=role_id)
-    
-    if User.query.filter_by(email=email).first():
-        raise Conflict('Email already exists')
-    if Role.query.filter_by(id=role_id).first() is None:
-        raise NotFound('Role not found')
-    
-    username = f"{name.lower().replace(' ', '.')}.{last_name.lower().replace(' ', '.')}"
-    counter = 1
-    while User.query.filter_by(username=username).first():
-        username = f"{username}.{counter}"
-        counter += 1
-
-    hashed_password = generate_password_hash(password)
-    user = User(name=name, last_name=last_name, email=email, password=hashed_password, role_id=role_id, username=username)
-    db.session.add(user)
-    db.session.commit()
-    return user
-    
-def get_all_users():
+    get_role_ref(role_id)
+    
+    hashed_password = hash_password(password)
+    for attempt in range(USERNAME_ATTEMPTS):
+        username = allocate_username(name, last_name)
+        username_taken = f'Username already exists: {username}'
+        user = User(name=name, last_name=last_name, email=email, password=hashed_password, role_id=role_id, username=username)
+        try:
+            return save(user, {
+                User.email: 'Email already exists',
+                User.username: username_taken
+            })
+        except Conflict as e:
+            # Otra petición confirmó el mismo nombre de usuario entre la consulta y el
+            # INSERT: la próxima consulta ya lo ve y se usa el sufijo siguiente
+            if e.description != username_taken or attempt == USERNAME_ATTEMPTS - 1:
+                raise
+    
+def get_all_users(limit=DEFAULT_PAGE_SIZE, after=None):
     """
-    Obtiene todos los usuarios del sistema.
+    Obtiene una página de usuarios ordenados por ID.
+    
+    Args:
+        limit: Cantidad máxima de usuarios a devolver
+        after: Cursor; se devuelven usuarios con ID mayor a este valor
     
     Returns:
-        List[User]: Lista de todos los usuarios
+        tuple: (lista de usuarios, cursor siguiente o None)
     """
-    return User.query.all()
+    return paginate_by_key(User.query, User.user_id, limit, after)
 
 def get_user_by_id(user_id):
     """
@@ -136,9 +180,10 @@ def update_user(user_id, **kwargs):
     Raises:
         BadRequest: Si el ID no es un entero o algún campo no cumple con las validaciones
         NotFound: Si el usuario no existe
+        Conflict: Si el nuevo email ya existe
     """
     user = validate_user(user_id)
-    validate_user_fields(**kwargs) 
+    validate_user_fields(partial=True, **kwargs)
       
     if 'name' in kwargs:
         user.name = kwargs['name']
@@ -147,11 +192,13 @@ def update_user(user_id, **kwargs):
     if 'email' in kwargs:
         user.email = kwargs['email']
     if 'role_id' in kwargs:
+        get_role_ref(kwargs['role_id'])
         user.role_id = kwargs['role_id']
     if 'password' in kwargs:
-        user.password = generate_password_hash(kwargs['password'])
+        user.password = hash_password(kwargs['password'])
         
-    db.session.commit()
+    commit_or_conflict({User.email: 'Email already exists'})
+    invalidate_user_session(user.user_id)
     return user
 
 def delete_user(user_id):
@@ -171,6 +218,7 @@ def delete_user(user_id):
     user = validate_user(user_id)
     db.session.delete(user)
     db.session.commit()
+    invalidate_user_session(user_id)
     return True
 
 def get_users_by_role(role_id):
@@ -203,12 +251,21 @@ def authenticate_user(username, password):
         User: Usuario autenticado
     
     Raises:
-        BadRequest: Si las credenciales son inválidas
-        NotFound: Si el usuario no existe
+        Unauthorized: Si el usuario no existe o la contraseña es incorrecta; ambos casos
+            responden igual para no revelar qué usuarios existen
     """
-    user = get_user_by_username(username)
-    
-    if not user or not check_password_hash(user.password, password):
-        raise BadRequest('Invalid username or password')
+    try:
+        user = get_user_by_username(username)
+    except NotFound:
+        verify_unknown_user(password)
+        raise Unauthorized('Invalid username or password')
+    
+    if not verify_password(user.password, password):
+        raise Unauthorized('Invalid username or password')
+    
+    # Los hashes con parámetros anteriores se actualizan aprovechando que se conoce la contraseña
+    if needs_rehash(user.password):
+        user.password = hash_password(password)
+        db.session.commit()
     
     return user
@@ -0,0 +1,43 @@
+from functools import wraps
+from flask import g, jsonify, request
+from src.services.auth_service import resolve_token
+from werkzeug.exceptions import HTTPException, Unauthorized, Forbidden
+
+def get_bearer_token():
+    """
+    Lee el token del encabezado Authorization: Bearer <token>.
+    
+    Returns:
+        str: Token recibido
+    
+    Raises:
+        Unauthorized: Si el encabezado no existe o no tiene el formato esperado
+    """
+    header = request.headers.get('Authorization', '')
+    scheme, _, token = header.partition(' ')
+    if scheme.lower() != 'bearer' or not token.strip():
+        raise Unauthorized('Missing bearer token')
+    return token.strip()
+
+def token_required(*roles):
+    """
+    Decorador que exige un token válido y, opcionalmente, uno de los roles indicados.
+    
+    El usuario autenticado queda disponible en g.current_user.
+    
+    Args:
+        *roles: Nombres de rol permitidos; sin roles basta con estar autenticado
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            try:
+                user = resolve_token(get_bearer_token())
+                if roles and user.role not in roles:
+                    raise Forbidden('Insufficient permissions')
+            except HTTPException as e:
+                return jsonify({'error': str(e)}), e.code
+            g.current_user = user
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
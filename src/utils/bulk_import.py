@@ -0,0 +1,134 @@
+import csv
+import io
+import json
+from werkzeug.exceptions import UnsupportedMediaType
+
+CSV_MIMETYPES = ('text/csv', 'application/csv')
+NDJSON_MIMETYPES = ('application/x-ndjson', 'application/ndjson', 'application/jsonl')
+DEFAULT_IMPORT_BATCH_SIZE = 1000
+
+def iter_records(stream, mimetype):
+    """
+    Lee registros de un flujo CSV o NDJSON sin cargar el archivo completo en memoria.
+
+    Args:
+        stream: Flujo binario con los datos (por ejemplo request.stream)
+        mimetype: Tipo de contenido del flujo
+
+    Yields:
+        tuple: (número de fila, registro o None, mensaje de error o None)
+
+    Raises:
+        UnsupportedMediaType: Si el tipo de contenido no es CSV ni NDJSON
+    """
+    if mimetype in CSV_MIMETYPES:
+        text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+        reader = csv.DictReader(text)
+        row_number = 0
+        try:
+            for row_number, row in enumerate(reader, start=1):
+                # Los campos vacíos del CSV se tratan como ausentes
+                yield row_number, {key: value for key, value in row.items() if key and value != ''}, None
+        except (UnicodeDecodeError, csv.Error) as e:
+            # Una fila CSV puede ocupar varias líneas, así que no se puede seguir leyendo
+            # después de un error: se informa y se conservan los lotes ya insertados
+            message = "Invalid UTF-8" if isinstance(e, UnicodeDecodeError) else f"Invalid CSV: {e}"
+            yield row_number + 1, None, f"{message}; the rest of the file was not imported"
+    elif mimetype in NDJSON_MIMETYPES:
+        # Cada línea se decodifica por separado: una línea mal codificada no detiene el resto
+        if isinstance(stream, io.RawIOBase):
+            stream = io.BufferedReader(stream)
+        for row_number, line in enumerate(stream, start=1):
+            try:
+                line = line.decode('utf-8')
+            except UnicodeDecodeError:
+                yield row_number, None, "Invalid UTF-8"
+                continue
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                yield row_number, None, "Invalid JSON"
+                continue
+            if not isinstance(record, dict):
+                yield row_number, None, "Each line must be a JSON object"
+                continue
+            yield row_number, record, None
+    else:
+        raise UnsupportedMediaType("Content type must be text/csv or application/x-ndjson")
+
+def iter_batches(records, batch_size=DEFAULT_IMPORT_BATCH_SIZE):
+    """
+    Agrupa los registros en lotes de tamaño fijo.
+
+    Args:
+        records: Iterable de registros
+        batch_size: Cantidad de registros por lote
+
+    Yields:
+        list: Lote de registros
+    """
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def to_int(value):
+    """
+    Convierte un valor leído de CSV a entero; los valores de NDJSON se dejan igual.
+
+    Args:
+        value: Valor a convertir
+
+    Returns:
+        El entero convertido, o el valor original si no se puede convertir
+    """
+    if isinstance(value, str) and value.strip().lstrip('-').isdigit():
+        return int(value)
+    return value
+
+def to_number(value):
+    """
+    Convierte un valor leído de CSV a número; los valores de NDJSON se dejan igual.
+
+    Args:
+        value: Valor a convertir
+
+    Returns:
+        El número convertido, o el valor original si no se puede convertir
+    """
+    if isinstance(value, str):
+        try:
+            return float(value) if '.' in value else int(value)
+        except ValueError:
+            return value
+    return value
+
+class ImportReport:
+    """
+    Resultado de una importación: filas insertadas y errores por fila.
+    """
+
+    def __init__(self, max_errors=1000):
+        self.inserted = 0
+        self.failed = 0
+        self.errors = []
+        self.max_errors = max_errors
+
+    def add_error(self, row_number, message):
+        self.failed += 1
+        # Solo se guarda el detalle de los primeros errores para acotar el tamaño de la respuesta
+        if len(self.errors) < self.max_errors:
+            self.errors.append({'row': row_number, 'error': message})
+
+    def to_dict(self):
+        return {
+            'inserted': self.inserted,
+            'failed': self.failed,
+            'errors': self.errors
+        }
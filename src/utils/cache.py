@@ -0,0 +1,194 @@
+import threading
+import time
+from collections import OrderedDict
+from flask import current_app
+
+DEFAULT_REFERENCE_TTL = 300
+
+class ReferenceCache:
+    """
+    Caché en memoria del proceso para tablas pequeñas que casi nunca cambian
+    (categorías, roles, métodos de pago).
+
+    La primera consulta carga la tabla completa con una sola consulta y las siguientes
+    se resuelven sin tocar la base de datos. Los servicios que escriben en la tabla
+    llaman a invalidate(); el TTL solo cubre cambios hechos por otros procesos.
+    """
+
+    def __init__(self, loader, ttl_config_key='REFERENCE_CACHE_TTL'):
+        """
+        Args:
+            loader: Función sin argumentos que devuelve un diccionario {id: datos}
+            ttl_config_key: Clave de configuración con el TTL en segundos
+        """
+        self._loader = loader
+        self._ttl_config_key = ttl_config_key
+        self._lock = threading.Lock()
+        self._app = None
+        self._data = None
+        self._expires_at = 0.0
+
+    def _entries(self):
+        app = current_app._get_current_object()
+        data = self._data
+        if data is not None and self._app is app and time.monotonic() < self._expires_at:
+            return data
+        with self._lock:
+            if self._data is None or self._app is not app or time.monotonic() >= self._expires_at:
+                ttl = app.config.get(self._ttl_config_key, DEFAULT_REFERENCE_TTL)
+                self._data = self._loader()
+                self._app = app
+                self._expires_at = time.monotonic() + ttl
+            return self._data
+
+    def get(self, key):
+        """
+        Obtiene un elemento por su ID.
+
+        Args:
+            key: ID del elemento
+
+        Returns:
+            dict: Datos del elemento o None si no existe
+        """
+        return self._entries().get(key)
+
+    def all(self):
+        """
+        Obtiene todos los elementos de la tabla.
+
+        Returns:
+            list: Lista con los datos de cada elemento
+        """
+        return list(self._entries().values())
+
+    def invalidate(self):
+        """
+        Descarta los datos en caché; la próxima consulta los vuelve a cargar.
+        """
+        with self._lock:
+            self._data = None
+
+class MemoCache:
+    """
+    Memoriza resultados calculados por clave hasta que se invalidan.
+
+    Se usa para reportes costosos que se piden muchas veces con los mismos
+    parámetros y solo cambian cuando se registran datos nuevos.
+    """
+
+    def __init__(self, max_entries=256):
+        """
+        Args:
+            max_entries: Cantidad máxima de resultados guardados; al superarla se descarta el más antiguo
+        """
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._generation = 0
+
+    def get_or_compute(self, key, compute):
+        """
+        Devuelve el resultado guardado para key o lo calcula y lo guarda.
+
+        Si se invalida la caché mientras se calcula, el resultado se devuelve pero no
+        se guarda, para no conservar datos anteriores a la invalidación.
+
+        Args:
+            key: Clave del resultado (debe ser hashable)
+            compute: Función sin argumentos que calcula el resultado
+
+        Returns:
+            El resultado guardado o recién calculado
+        """
+        app = current_app._get_current_object()
+        entry_key = (id(app), key)
+        with self._lock:
+            if entry_key in self._entries:
+                return self._entries[entry_key]
+            generation = self._generation
+
+        result = compute()
+
+        with self._lock:
+            if generation == self._generation:
+                if len(self._entries) >= self._max_entries:
+                    self._entries.pop(next(iter(self._entries)))
+                self._entries[entry_key] = result
+        return result
+
+    def invalidate(self):
+        """
+        Descarta todos los resultados guardados.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+class LRUCache:
+    """
+    Caché con tamaño máximo (descarta el menos usado) y tiempo de vida por entrada.
+    """
+
+    def __init__(self, max_entries=1024, ttl=60):
+        """
+        Args:
+            max_entries: Cantidad máxima de entradas
+            ttl: Segundos que vive cada entrada
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        """
+        Obtiene una entrada vigente.
+
+        Args:
+            key: Clave de la entrada
+
+        Returns:
+            El valor guardado o None si no existe o venció
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """
+        Guarda una entrada, descartando la menos usada si se supera el tamaño máximo.
+
+        Args:
+            key: Clave de la entrada
+            value: Valor a guardar
+        """
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        """
+        Descarta una entrada si existe.
+
+        Args:
+            key: Clave de la entrada
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """
+        Descarta todas las entradas.
+        """
+        with self._lock:
+            self._entries.clear()
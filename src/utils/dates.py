@@ -0,0 +1,48 @@
+import datetime
+from flask import request
+from werkzeug.exceptions import BadRequest
+
+def parse_date(value, field_name):
+    """
+    Convierte un texto ISO (YYYY-MM-DD o YYYY-MM-DDTHH:MM:SS) en datetime.
+    
+    Args:
+        value: Texto a convertir
+        field_name: Nombre del campo para mensajes de error
+    
+    Returns:
+        datetime.datetime: Fecha convertida
+    
+    Raises:
+        BadRequest: Si el formato no es válido
+    """
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise BadRequest(f"{field_name} must be an ISO date (YYYY-MM-DD)")
+
+def get_date_range_args():
+    """
+    Lee el rango de fechas (?from=&to=) de la petición actual.
+    
+    Cuando 'to' es solo una fecha (sin hora) se incluye el día completo.
+    
+    Returns:
+        tuple: (date_from, date_to) como datetime o None; date_to es exclusivo
+    
+    Raises:
+        BadRequest: Si alguna fecha no es válida o el rango está invertido
+    """
+    date_from = request.args.get('from')
+    date_to = request.args.get('to')
+    
+    if date_from is not None:
+        date_from = parse_date(date_from, 'From')
+    if date_to is not None:
+        is_day = 'T' not in date_to and ' ' not in date_to
+        date_to = parse_date(date_to, 'To')
+        if is_day:
+            date_to += datetime.timedelta(days=1)
+    if date_from and date_to and date_from >= date_to:
+        raise BadRequest("From must be earlier than To")
+    return date_from, date_to
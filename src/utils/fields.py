@@ -0,0 +1,90 @@
+from functools import lru_cache
+from flask import request
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only
+from werkzeug.exceptions import BadRequest
+
+@lru_cache(maxsize=None)
+def field_attributes(model):
+    """
+    Obtiene los campos que se pueden pedir con ?fields= para un modelo.
+
+    El nombre público de la clave primaria es 'id', igual que en to_dict(); el resto
+    de los campos son las columnas del modelo con su mismo nombre.
+
+    Args:
+        model: Clase del modelo
+
+    Returns:
+        dict: {nombre del campo: nombre del atributo del modelo}
+    """
+    mapper = inspect(model)
+    primary_key = mapper.get_property_by_column(mapper.primary_key[0]).key
+    attributes = {'id': primary_key}
+    for column_property in mapper.column_attrs:
+        if column_property.key != primary_key:
+            attributes[column_property.key] = column_property.key
+    return attributes
+
+def get_fields_arg(model):
+    """
+    Lee el parámetro ?fields=id,name,... de la petición actual.
+
+    Args:
+        model: Clase del modelo que se va a devolver
+
+    Returns:
+        tuple: Campos pedidos en orden, o None si no se envió el parámetro
+
+    Raises:
+        BadRequest: Si algún campo no existe en el modelo
+    """
+    value = request.args.get('fields')
+    if value is None:
+        return None
+    fields = tuple(dict.fromkeys(field.strip() for field in value.split(',') if field.strip()))
+    if not fields:
+        raise BadRequest("Fields cannot be empty")
+    attributes = field_attributes(model)
+    unknown = [field for field in fields if field not in attributes]
+    if unknown:
+        raise BadRequest(f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(attributes)}")
+    return fields
+
+def load_only_options(model, fields):
+    """
+    Construye las opciones de consulta que cargan solo las columnas pedidas.
+
+    La clave primaria siempre se carga (la necesitan la sesión y el cursor de paginación).
+
+    Args:
+        model: Clase del modelo
+        fields: Campos pedidos, o None para cargar todas las columnas
+
+    Returns:
+        list: Opciones para query.options(); vacía si fields es None
+    """
+    if fields is None:
+        return []
+    attributes = field_attributes(model)
+    return [load_only(*(getattr(model, attributes[field]) for field in fields))]
+
+def serializer(model, fields):
+    """
+    Obtiene la función que convierte una instancia en diccionario.
+
+    Con fields se leen solo esos atributos, que son los que cargó load_only_options,
+    así la serialización no dispara consultas por columnas no cargadas.
+
+    Args:
+        model: Clase del modelo
+        fields: Campos pedidos, o None para usar to_dict()
+
+    Returns:
+        function: Función instancia -> dict
+    """
+    if fields is None:
+        return lambda instance: instance.to_dict()
+    attributes = field_attributes(model)
+    pairs = tuple((field, attributes[field]) for field in fields)
+    return lambda instance: {field: getattr(instance, attribute) for field, attribute in pairs}
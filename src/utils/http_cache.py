@@ -0,0 +1,40 @@
+from flask import Response, request
+
+def not_modified_response(etag, cache_control='no-cache'):
+    """
+    Devuelve una respuesta 304 si el cliente ya tiene la versión identificada por etag.
+    
+    Se debe llamar antes de consultar o serializar datos, para que las peticiones
+    condicionales no toquen la base de datos.
+    
+    Args:
+        etag: ETag de la versión actual del recurso
+        cache_control: Valor del encabezado Cache-Control
+    
+    Returns:
+        Response: Respuesta 304 o None si el cliente no tiene la versión actual
+    """
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    response = Response(status=304)
+    return add_cache_headers(response, etag, cache_control)
+
+def add_cache_headers(response, etag, cache_control='no-cache'):
+    """
+    Agrega ETag, Cache-Control y Vary a una respuesta.
+    
+    Con 'no-cache' los clientes pueden guardar la respuesta pero deben revalidarla
+    con If-None-Match en cada uso.
+    
+    Args:
+        response: Respuesta a modificar
+        etag: ETag de la versión actual del recurso
+        cache_control: Valor del encabezado Cache-Control
+    
+    Returns:
+        Response: La misma respuesta con los encabezados agregados
+    """
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = cache_control
+    response.vary.add('Accept')
+    return response
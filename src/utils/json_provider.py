@@ -0,0 +1,86 @@
+import datetime
+import json
+import uuid
+from decimal import Decimal
+from flask.json.provider import JSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional; sin él se usa el módulo json de la biblioteca estándar
+    orjson = None
+
+def _default(obj):
+    """
+    Convierte los tipos que el codificador no conoce.
+
+    Los Decimal (precios, totales) se escriben como número JSON, el mismo tipo que
+    aceptan los esquemas de entrada, así un cliente puede devolver el valor que leyó.
+    Los montos son Numeric(10, 2): con menos de 16 dígitos significativos un double
+    conserva el valor exacto y lo vuelve a leer igual. Las fechas se escriben en ISO 8601.
+    """
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class FastJSONProvider(JSONProvider):
+    """
+    Proveedor JSON de la aplicación: usa orjson si está instalado y si no el módulo json.
+
+    Los modelos pueden devolver Decimal y datetime en to_dict(); se codifican aquí de
+    forma directa (orjson codifica datetime y date en C) en lugar de convertirlos antes
+    a float o a texto.
+    """
+
+    mimetype = 'application/json'
+
+    def __init__(self, app, backend='auto'):
+        """
+        Args:
+            app: Aplicación Flask
+            backend: 'orjson', 'stdlib' o 'auto' (orjson si está disponible)
+        """
+        super().__init__(app)
+        if backend == 'auto':
+            backend = 'orjson' if orjson is not None else 'stdlib'
+        if backend == 'orjson' and orjson is None:
+            raise RuntimeError("JSON_PROVIDER is 'orjson' but orjson is not installed")
+        if backend not in ('orjson', 'stdlib'):
+            raise ValueError(f"Unknown JSON provider: {backend}")
+        self.backend = backend
+
+    def dumps_bytes(self, obj):
+        """
+        Serializa un objeto a JSON en bytes UTF-8, sin pasar por str.
+
+        Args:
+            obj: Objeto a serializar
+
+        Returns:
+            bytes: Documento JSON
+        """
+        if self.backend == 'orjson':
+            return orjson.dumps(obj, default=_default)
+        return json.dumps(obj, default=_default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def dumps(self, obj, **kwargs):
+        if self.backend == 'orjson' and not kwargs:
+            return orjson.dumps(obj, default=_default).decode('utf-8')
+        kwargs.setdefault('default', _default)
+        kwargs.setdefault('ensure_ascii', False)
+        kwargs.setdefault('separators', (',', ':'))
+        return json.dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if self.backend == 'orjson' and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj) + b'\n', mimetype=self.mimetype)
@@ -0,0 +1,181 @@
+import logging
+import sys
+import threading
+from contextlib import contextmanager
+from flask import request
+from sqlalchemy import event
+from werkzeug.exceptions import InternalServerError
+from src.utils.slow_queries import find_call_site
+
+logger = logging.getLogger(__name__)
+
+LAZY_LOAD_MODES = ('off', 'warn', 'raise')
+
+# Detector activo del hilo: el de la petición en curso o el de detect_lazy_loads()
+_current = threading.local()
+
+class LazyLoadError(InternalServerError):
+    """
+    Una relación se cargó de forma perezosa más veces que el umbral (patrón N+1).
+    """
+
+class LazyLoadTracker:
+    """
+    Cuenta las cargas perezosas que llegan a la base de datos, por relación.
+
+    Una carga perezosa que se resuelve con el identity map de la sesión no ejecuta SQL
+    y no se cuenta. Cuando una relación supera el umbral se informa la relación, la
+    línea que accedió al atributo y la función de servicio desde la que se llegó ahí.
+    """
+
+    def __init__(self, threshold, mode='raise'):
+        """
+        Args:
+            threshold: Cargas permitidas por relación; con 0 cualquier carga perezosa cuenta
+            mode: 'raise' lanza LazyLoadError al superar el umbral, 'warn' solo lo registra
+        """
+        self.threshold = threshold
+        self.mode = mode
+        self.counts = {}
+        self.sites = {}
+
+    def record(self, relationship, frame):
+        """
+        Registra una carga perezosa.
+
+        Args:
+            relationship: Nombre de la relación, por ejemplo 'Sale.details'
+            frame: Marco desde el que se busca el punto de la aplicación que la disparó
+
+        Raises:
+            LazyLoadError: En modo 'raise', si la relación superó el umbral
+        """
+        count = self.counts.get(relationship, 0) + 1
+        self.counts[relationship] = count
+        if count == 1:
+            site, service = find_call_site(frame)
+            self.sites[relationship] = (site or _first_outside_frame(frame), service)
+        if count == self.threshold + 1 and self.mode == 'raise':
+            raise LazyLoadError(self.describe(relationship))
+
+    def describe(self, relationship):
+        """
+        Describe una relación que superó el umbral.
+
+        Returns:
+            str: Mensaje con la relación, las cargas y el punto donde se disparó la primera
+        """
+        site, service = self.sites.get(relationship, (None, None))
+        location = site or 'unknown'
+        if service and service != site:
+            location += f' via {service}'
+        return (f"{relationship} was lazy-loaded {self.counts[relationship]} times "
+                f"(threshold {self.threshold}) at {location}; "
+                f"load it with selectinload()/joinedload() in the query")
+
+    def offenders(self):
+        """
+        Obtiene las relaciones que superaron el umbral.
+
+        Returns:
+            list: Mensajes de describe(), uno por relación
+        """
+        return [self.describe(relationship) for relationship, count in self.counts.items()
+                if count > self.threshold]
+
+    def report(self, context):
+        # En modo 'warn' las relaciones que superaron el umbral se registran al terminar
+        for message in self.offenders():
+            logger.warning("N+1 in %s: %s", context, message)
+
+def _first_outside_frame(frame):
+    # Fuera de la aplicación (una prueba, un script) el punto es el primer marco que no
+    # pertenece a SQLAlchemy
+    while frame is not None and frame.f_globals.get('__name__', '').startswith(('sqlalchemy', 'src.utils')):
+        frame = frame.f_back
+    if frame is None:
+        return None
+    code = frame.f_code
+    return f"{frame.f_globals.get('__name__')}.{getattr(code, 'co_qualname', code.co_name)}:{frame.f_lineno}"
+
+def _on_orm_execute(orm_execute_state):
+    tracker = getattr(_current, 'tracker', None)
+    # lazy_loaded_from solo existe para SELECT: en un UPDATE, un INSERT o un text()
+    # lanza InvalidRequestError
+    if tracker is None or not orm_execute_state.is_select or \
+            not orm_execute_state.is_relationship_load or orm_execute_state.lazy_loaded_from is None:
+        return
+    # El último elemento de la ruta del cargador es la relación, por ejemplo Sale.details
+    tracker.record(str(orm_execute_state.loader_strategy_path[-1]), sys._getframe(1))
+
+def _listen(session):
+    if not event.contains(session, 'do_orm_execute', _on_orm_execute):
+        event.listen(session, 'do_orm_execute', _on_orm_execute)
+
+@contextmanager
+def detect_lazy_loads(threshold=0, mode='raise'):
+    """
+    Detecta cargas perezosas dentro de un bloque, para pruebas y scripts.
+
+    Ejemplo::
+
+        with detect_lazy_loads(threshold=0):
+            sales = get_all_sales()
+
+    Args:
+        threshold: Cargas permitidas por relación
+        mode: 'raise' o 'warn'
+
+    Yields:
+        LazyLoadTracker: Detector del bloque, con counts por relación
+    """
+    from src import db
+
+    _listen(db.session)
+    previous = getattr(_current, 'tracker', None)
+    tracker = LazyLoadTracker(threshold, mode)
+    _current.tracker = tracker
+    try:
+        yield tracker
+    finally:
+        _current.tracker = previous
+    if mode == 'warn':
+        tracker.report('block')
+
+def init_lazy_load_detector(app, session):
+    """
+    Activa el detector de cargas perezosas por petición según LAZY_LOAD_MODE.
+
+    Con 'raise' la petición que supera LAZY_LOAD_THRESHOLD cargas de una misma relación
+    falla con LazyLoadError (500); con 'warn' se registra al terminar la petición.
+    Pensado para desarrollo y pruebas; en producción el modo es 'off'.
+
+    Args:
+        app: Aplicación Flask
+        session: Sesión de SQLAlchemy (db.session)
+
+    Returns:
+        bool: True si el detector quedó activo
+    """
+    mode = app.config['LAZY_LOAD_MODE']
+    if mode not in LAZY_LOAD_MODES:
+        raise ValueError(f"Invalid LAZY_LOAD_MODE: {mode}. Valid values: {', '.join(LAZY_LOAD_MODES)}")
+    if mode == 'off':
+        return False
+    threshold = app.config['LAZY_LOAD_THRESHOLD']
+    _listen(session)
+
+    @app.before_request
+    def start_lazy_load_detector():
+        _current.tracker = LazyLoadTracker(threshold, mode)
+
+    # teardown y no after_request: las respuestas en streaming siguen cargando filas
+    # después de after_request
+    @app.teardown_request
+    def finish_lazy_load_detector(exc):
+        tracker = getattr(_current, 'tracker', None)
+        _current.tracker = None
+        if tracker is not None and mode == 'warn':
+            tracker.report(f'{request.method} {request.path}')
+
+    return True
@@ -0,0 +1,314 @@
+import bisect
+import sqlite3
+import threading
+import time
+from flask import request
+from sqlalchemy import event
+
+# Límites superiores (segundos) de los buckets del histograma de latencia
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PROMETHEUS_MIMETYPE = 'text/plain; version=0.0.4; charset=utf-8'
+UNMATCHED_ENDPOINT = '<unmatched>'
+
+# Posiciones de los contadores dentro de cada serie, después de los buckets
+_SUM, _STATEMENTS, _SQL_SECONDS, _ROWS_FETCHED, _ROWS_WRITTEN, _BYTES = range(6)
+
+# Petición en curso del hilo: [inicio, sentencias, segundos SQL, filas leídas, filas escritas].
+# Los eventos de SQLAlchemy se ejecutan en el mismo hilo que la petición que los dispara.
+_current = threading.local()
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _current.sql_start = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    active = getattr(_current, 'request', None)
+    if active is None:
+        return
+    active[1] += 1
+    active[2] += time.perf_counter() - _current.sql_start
+    if context is not None and (context.isinsert or context.isupdate or context.isdelete) and cursor.rowcount > 0:
+        active[4] += cursor.rowcount
+
+def _count_fetched(rows):
+    active = getattr(_current, 'request', None)
+    if active is not None:
+        active[3] += rows
+
+class _CountingCursor(sqlite3.Cursor):
+    # SQLite no informa cuántas filas devuelve un SELECT (rowcount es -1); se cuentan
+    # en los fetch*, que es como SQLAlchemy lee los resultados. El costo es por llamada,
+    # no por fila, salvo en fetchone().
+
+    def fetchone(self):
+        row = super().fetchone()
+        if row is not None:
+            _count_fetched(1)
+        return row
+
+    def fetchmany(self, size=None):
+        rows = super().fetchmany() if size is None else super().fetchmany(size)
+        _count_fetched(len(rows))
+        return rows
+
+    def fetchall(self):
+        rows = super().fetchall()
+        _count_fetched(len(rows))
+        return rows
+
+class CountingConnection(sqlite3.Connection):
+    """
+    Conexión de sqlite3 cuyos cursores cuentan las filas leídas para las métricas.
+    """
+
+    def cursor(self, factory=_CountingCursor):
+        return super().cursor(factory)
+
+def _merge(target, shard):
+    series, statuses = target
+    shard_series, shard_statuses = shard
+    # list() copia el diccionario de una vez mientras su hilo puede seguir escribiendo
+    for key, values in list(shard_series.items()):
+        total = series.get(key)
+        if total is None:
+            series[key] = list(values)
+        else:
+            for index, value in enumerate(values):
+                total[index] += value
+    for key, count in list(shard_statuses.items()):
+        statuses[key] = statuses.get(key, 0) + count
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_bound(bound):
+    return '+Inf' if bound == float('inf') else repr(bound)
+
+class RequestMetrics:
+    """
+    Métricas por endpoint: histograma de latencia, peticiones por código de estado,
+    sentencias y tiempo de SQL, filas leídas y escritas y bytes de respuesta.
+
+    Cada hilo escribe solo en su propio fragmento (un diccionario de series), así que
+    registrar una petición no toma ningún bloqueo; el bloqueo solo se usa la primera vez
+    que un hilo registra su fragmento. La exposición suma los fragmentos de todos los hilos.
+
+    El servidor de desarrollo de werkzeug atiende cada petición en un hilo nuevo: los
+    fragmentos de los hilos que terminaron se suman a un total retirado y se descartan,
+    así su cantidad queda acotada por los hilos vivos.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        """
+        Args:
+            buckets: Límites superiores del histograma de latencia, en segundos
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._size = len(self.buckets) + 1  # El último bucket es +Inf
+        self._local = threading.local()
+        self._shards = {}  # {id del hilo: (hilo, fragmento)}
+        self._retired = ({}, {})
+        self._lock = threading.Lock()
+
+    def _shard(self):
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = ({}, {})  # (series por endpoint, peticiones por endpoint y estado)
+            with self._lock:
+                self._retire_dead_threads()
+                self._shards[threading.get_ident()] = (threading.current_thread(), shard)
+            self._local.shard = shard
+            return shard
+
+    def _retire_dead_threads(self):
+        # Se llama con el bloqueo tomado. Un hilo terminado ya no escribe en su fragmento;
+        # su id puede reutilizarse, por eso se retira antes de registrar el hilo nuevo
+        for ident, (thread, shard) in list(self._shards.items()):
+            if not thread.is_alive():
+                _merge(self._retired, shard)
+                del self._shards[ident]
+
+    def start(self):
+        """
+        Marca el inicio de una petición en el hilo actual.
+        """
+        _current.request = [time.perf_counter(), 0, 0.0, 0, 0]
+
+    def current(self):
+        """
+        Obtiene los contadores de la petición en curso del hilo actual.
+
+        Returns:
+            list: Contadores de la petición, o None si no hay ninguna en curso
+        """
+        return getattr(_current, 'request', None)
+
+    def finish(self, active, key, status, size):
+        """
+        Registra una petición terminada.
+
+        Args:
+            active: Contadores devueltos por current()
+            key: Tupla (blueprint, endpoint, método)
+            status: Código de estado HTTP
+            size: Bytes del cuerpo de la respuesta
+        """
+        if getattr(_current, 'request', None) is active:
+            _current.request = None
+        elapsed = time.perf_counter() - active[0]
+        series, statuses = self._shard()
+        values = series.get(key)
+        if values is None:
+            values = series[key] = [0] * self._size + [0.0, 0, 0.0, 0, 0, 0]
+        values[bisect.bisect_left(self.buckets, elapsed)] += 1
+        offset = self._size
+        values[offset + _SUM] += elapsed
+        values[offset + _STATEMENTS] += active[1]
+        values[offset + _SQL_SECONDS] += active[2]
+        values[offset + _ROWS_FETCHED] += active[3]
+        values[offset + _ROWS_WRITTEN] += active[4]
+        values[offset + _BYTES] += size
+        status_key = key + (status,)
+        statuses[status_key] = statuses.get(status_key, 0) + 1
+
+    def snapshot(self):
+        """
+        Suma los fragmentos de todos los hilos.
+
+        Returns:
+            tuple: ({clave: valores}, {clave + (estado,): peticiones})
+        """
+        totals = ({}, {})
+        with self._lock:
+            self._retire_dead_threads()
+            _merge(totals, self._retired)
+            shards = [shard for thread, shard in self._shards.values()]
+        for shard in shards:
+            _merge(totals, shard)
+        series, statuses = totals
+        return series, statuses
+
+    def render(self):
+        """
+        Genera la exposición en formato de texto de Prometheus.
+
+        Returns:
+            str: Métricas listas para /metrics
+        """
+        series, statuses = self.snapshot()
+        offset = self._size
+        lines = []
+
+        def labels(key, **extra):
+            blueprint, endpoint, method = key
+            pairs = [('blueprint', blueprint), ('endpoint', endpoint), ('method', method)]
+            pairs.extend(extra.items())
+            return ','.join(f'{name}="{_escape(value)}"' for name, value in pairs)
+
+        lines.append('# HELP fruteria_http_request_duration_seconds Request latency by endpoint.')
+        lines.append('# TYPE fruteria_http_request_duration_seconds histogram')
+        for key in sorted(series):
+            values = series[key]
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), values[:offset]):
+                cumulative += count
+                lines.append(f'fruteria_http_request_duration_seconds_bucket{{{labels(key, le=_format_bound(bound))}}} '
+                             f'{cumulative}')
+            lines.append(f'fruteria_http_request_duration_seconds_sum{{{labels(key)}}} {values[offset + _SUM]!r}')
+            lines.append(f'fruteria_http_request_duration_seconds_count{{{labels(key)}}} {cumulative}')
+
+        lines.append('# HELP fruteria_http_requests_total Requests by endpoint and status code.')
+        lines.append('# TYPE fruteria_http_requests_total counter')
+        for key in sorted(statuses):
+            lines.append(f'fruteria_http_requests_total{{{labels(key[:3], status=key[3])}}} {statuses[key]}')
+
+        counters = [
+            ('fruteria_db_statements_total', 'SQL statements executed while serving the endpoint.', _STATEMENTS),
+            ('fruteria_db_duration_seconds_total', 'Time spent executing SQL statements.', _SQL_SECONDS),
+            ('fruteria_db_rows_fetched_total', 'Rows fetched from query results.', _ROWS_FETCHED),
+            ('fruteria_db_rows_written_total', 'Rows inserted, updated or deleted.', _ROWS_WRITTEN),
+            ('fruteria_http_response_bytes_total', 'Response body bytes sent.', _BYTES),
+        ]
+        for name, help_text, position in counters:
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} counter')
+            for key in sorted(series):
+                value = series[key][offset + position]
+                lines.append(f'{name}{{{labels(key)}}} {value!r}')
+        return '\n'.join(lines) + '\n'
+
+def _request_key():
+    # Se resuelve el proxy una sola vez: cada acceso a través de request cuesta
+    current = request._get_current_object()
+    rule = current.url_rule
+    if rule is None:
+        return ('', UNMATCHED_ENDPOINT, current.method)
+    return (rule.endpoint.rpartition('.')[0], rule.endpoint, current.method)
+
+def _counted_body(metrics, active, key, status, body):
+    # Cuerpo en streaming: la petición se registra cuando termina de enviarse,
+    # incluido el SQL que se ejecuta mientras se generan las filas
+    size = 0
+    try:
+        for chunk in body:
+            size += len(chunk)
+            yield chunk
+    finally:
+        if hasattr(body, 'close'):
+            body.close()
+        metrics.finish(active, key, status, size)
+
+def init_metrics(app):
+    """
+    Activa las métricas por endpoint de la aplicación.
+
+    Registra los hooks before/after_request de Flask y hace que las conexiones de
+    SQLite cuenten las filas leídas. Debe llamarse antes de db.init_app(), que es
+    donde se crea el engine; después hay que llamar a instrument_engine().
+
+    Las respuestas en streaming se registran al terminar de enviarse, con el SQL que
+    se ejecutó durante el envío.
+
+    Args:
+        app: Aplicación Flask
+
+    Returns:
+        RequestMetrics: Métricas de la aplicación, también en app.extensions['metrics']
+    """
+    metrics = RequestMetrics()
+    app.extensions['metrics'] = metrics
+
+    if app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+        engine_options = app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {})
+        engine_options.setdefault('connect_args', {}).setdefault('factory', CountingConnection)
+
+    @app.before_request
+    def start_request_metrics():
+        metrics.start()
+
+    @app.after_request
+    def record_request_metrics(response):
+        active = metrics.current()
+        if active is None:
+            return response
+        key = _request_key()
+        size = response.headers.get('Content-Length')
+        if size is None and response.is_streamed:
+            response.response = _counted_body(metrics, active, key, response.status_code, response.response)
+        else:
+            metrics.finish(active, key, response.status_code, int(size or 0))
+        return response
+
+    return metrics
+
+def instrument_engine(engine):
+    """
+    Registra en el engine los eventos que cuentan las sentencias SQL, su duración y
+    las filas escritas de la petición en curso.
+
+    Args:
+        engine: Engine de SQLAlchemy
+    """
+    if not event.contains(engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
@@ -0,0 +1,79 @@
+from flask import request
+from werkzeug.exceptions import BadRequest
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+def get_pagination_args():
+    """
+    Lee los parámetros de paginación (?limit=&after=) de la petición actual.
+
+    Returns:
+        tuple: (limit, after) donde after es None si no se envió cursor
+
+    Raises:
+        BadRequest: Si limit o after no son enteros válidos
+    """
+    limit = request.args.get('limit', DEFAULT_PAGE_SIZE)
+    after = request.args.get('after')
+
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        raise BadRequest("Limit must be an integer")
+    if not (1 <= limit <= MAX_PAGE_SIZE):
+        raise BadRequest(f"Limit must be between 1 and {MAX_PAGE_SIZE}")
+
+    if after is not None:
+        try:
+            after = int(after)
+        except (TypeError, ValueError):
+            raise BadRequest("Cursor must be an integer")
+
+    return limit, after
+
+def paginate_by_key(query, key_column, limit=DEFAULT_PAGE_SIZE, after=None):
+    """
+    Pagina una consulta por cursor (keyset) usando una columna ordenable, normalmente la clave primaria.
+
+    En lugar de OFFSET, filtra por key_column > after, de modo que el costo de cada
+    página no depende de cuántas filas hay antes del cursor.
+
+    Args:
+        query: Consulta de SQLAlchemy a paginar
+        key_column: Columna por la que se ordena y se filtra el cursor
+        limit: Cantidad máxima de elementos por página
+        after: Último valor de key_column de la página anterior
+
+    Returns:
+        tuple: (items, next_cursor) donde next_cursor es None si no hay más páginas
+    """
+    if after is not None:
+        query = query.filter(key_column > after)
+    # Se pide un elemento extra para saber si existe una página siguiente
+    items = query.order_by(key_column).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = getattr(items[-1], key_column.key)
+    return items, next_cursor
+
+def page_response(items, next_cursor, serialize=None):
+    """
+    Construye el cuerpo de respuesta de una página.
+
+    Args:
+        items: Elementos de la página (modelos con to_dict)
+        next_cursor: Cursor para pedir la siguiente página
+        serialize: Función que convierte cada elemento en diccionario (por defecto to_dict)
+
+    Returns:
+        dict: Cuerpo con los datos y el cursor siguiente
+    """
+    if serialize is None:
+        serialize = lambda item: item.to_dict()
+    return {
+        'data': [serialize(item) for item in items],
+        'next_cursor': next_cursor
+    }
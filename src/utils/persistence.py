@@ -0,0 +1,70 @@
+from sqlalchemy.exc import IntegrityError
+from werkzeug.exceptions import Conflict
+from src import db
+
+def _unique_key(column):
+    return f"{column.table.name}.{column.name}"
+
+def _conflict_message(error, conflicts):
+    """
+    Busca el mensaje de conflicto que corresponde a la restricción que falló.
+    
+    SQLite informa las columnas de la restricción única ("UNIQUE constraint failed:
+    products.name"), por eso las restricciones se identifican por su columna.
+    
+    Args:
+        error: IntegrityError lanzado por la base de datos
+        conflicts: Diccionario {columna del modelo: mensaje}
+    
+    Returns:
+        str: Mensaje de conflicto o None si la restricción no está en conflicts
+    """
+    detail = str(error.orig)
+    if 'UNIQUE constraint failed:' not in detail:
+        return None
+    failed = {name.strip() for name in detail.split('UNIQUE constraint failed:', 1)[1].split(',')}
+    for column, message in conflicts.items():
+        if _unique_key(column) in failed:
+            return message
+    return None
+
+def commit_or_conflict(conflicts):
+    """
+    Confirma la transacción y convierte las violaciones de restricciones únicas en Conflict.
+    
+    Reemplaza el SELECT previo de "¿ya existe?": la base de datos valida la unicidad
+    en la misma sentencia de escritura, sin consultas extra y sin carreras entre peticiones.
+    
+    Args:
+        conflicts: Diccionario {columna del modelo: mensaje de Conflict}
+    
+    Raises:
+        Conflict: Si se viola una de las restricciones indicadas
+        IntegrityError: Si se viola otra restricción
+    """
+    try:
+        db.session.commit()
+    except IntegrityError as e:
+        db.session.rollback()
+        message = _conflict_message(e, conflicts)
+        if message:
+            raise Conflict(message)
+        raise
+
+def save(instance, conflicts):
+    """
+    Inserta un objeto nuevo en una sola sentencia, traduciendo duplicados a Conflict.
+    
+    Args:
+        instance: Objeto del modelo a guardar
+        conflicts: Diccionario {columna del modelo: mensaje de Conflict}
+    
+    Returns:
+        El objeto guardado
+    
+    Raises:
+        Conflict: Si se viola una de las restricciones indicadas
+    """
+    db.session.add(instance)
+    commit_or_conflict(conflicts)
+    return instance
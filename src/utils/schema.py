@@ -0,0 +1,188 @@
+import logging
+from sqlalchemy import func, inspect, select, text
+from src import db
+from src.models.client import CLIENT_SEARCH_TABLE, CLIENT_SEARCH_DDL
+
+logger = logging.getLogger(__name__)
+
+# Grupos de valores repetidos que se muestran cuando no se puede crear un índice único
+DUPLICATE_SAMPLE_SIZE = 10
+
+# Consultas de búsqueda que deben resolverse con un índice: (descripción, SQL, índice esperado)
+LOOKUP_PLANS = [
+    ('Products by category', 'SELECT * FROM products WHERE category_id = :value', 'ix_products_category_id'),
+    ('Products by supplier', 'SELECT * FROM products WHERE supplier_id = :value', 'ix_products_supplier_id'),
+    ('Sale details by product', 'SELECT * FROM sale_details WHERE product_id = :value', 'ix_sale_details_product_id'),
+    ('Sales by client', 'SELECT * FROM sales WHERE client_id = :value', 'ix_sales_client_id'),
+    ('Sales by user', 'SELECT * FROM sales WHERE user_id = :value', 'ix_sales_user_id'),
+    ('Sales by date range', 'SELECT * FROM sales WHERE date >= :value AND date < :value', 'ix_sales_date'),
+    ('Supplier by NIT', 'SELECT * FROM suppliers WHERE nit = :value', 'uq_suppliers_nit'),
+    ('Supplier by name', 'SELECT * FROM suppliers WHERE name = :value', 'uq_suppliers_name'),
+    ('Product by name', 'SELECT * FROM products WHERE name = :value', 'uq_products_name'),
+]
+
+# Índices de versiones anteriores reemplazados por otros (por ejemplo, por uno único)
+SUPERSEDED_INDEXES = {
+    'suppliers': ['ix_suppliers_nit', 'ix_suppliers_name'],
+}
+
+def find_duplicates(connection, index, limit=DUPLICATE_SAMPLE_SIZE):
+    """
+    Busca los valores repetidos que impiden crear un índice único.
+    
+    Los NULL no se cuentan: SQLite los admite repetidos en un índice único.
+    
+    Args:
+        connection: Conexión de SQLAlchemy
+        index: Índice único de la tabla
+        limit: Cantidad máxima de grupos repetidos a devolver
+    
+    Returns:
+        list: Tuplas (valores, ids de las filas que los comparten)
+    """
+    columns = list(index.columns)
+    primary_key = list(index.table.primary_key.columns)[0]
+    stmt = (
+        select(*columns, func.group_concat(primary_key))
+        .where(*[column.isnot(None) for column in columns])
+        .group_by(*columns)
+        .having(func.count() > 1)
+        .limit(limit)
+    )
+    return [(tuple(row[:-1]), row[-1]) for row in connection.execute(stmt)]
+
+def ensure_indexes(connection):
+    """
+    Crea los índices declarados en los modelos que todavía no existen en la base de datos.
+    
+    db.create_all() no agrega índices a tablas que ya existen; esta función permite
+    actualizar un Fruteria.db existente sin borrar los datos.
+    
+    Un índice único no se puede crear si la tabla ya tiene valores repetidos: en ese caso
+    se omite con un aviso en el log que nombra las filas en conflicto, y se conservan los
+    índices que iba a reemplazar. Después de corregir los duplicados hay que volver a
+    ejecutar la migración.
+    
+    Args:
+        connection: Conexión de SQLAlchemy
+    
+    Returns:
+        list: Nombres de los índices creados
+    """
+    inspector = inspect(connection)
+    created = []
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        skipped = False
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            if index.name in existing:
+                continue
+            duplicates = find_duplicates(connection, index) if index.unique else []
+            if duplicates:
+                logger.warning(
+                    "Unique index %s not created: %s has repeated %s values: %s. "
+                    "Fix the duplicates and run scripts/migrate_db.py again",
+                    index.name, table.name, ', '.join(column.name for column in index.columns),
+                    '; '.join(f"{', '.join(map(repr, values))} (ids {ids})" for values, ids in duplicates)
+                )
+                skipped = True
+                continue
+            index.create(bind=connection)
+            created.append(index.name)
+        if not skipped:
+            for name in SUPERSEDED_INDEXES.get(table.name, []):
+                if name in existing:
+                    connection.execute(text(f'DROP INDEX {name}'))
+    return created
+
+def ensure_client_search(connection):
+    """
+    Crea el índice de texto completo de clientes y sus triggers si todavía no existen.
+    
+    Si la tabla FTS se crea en una base que ya tenía clientes, se llena a partir de clients.
+    
+    Args:
+        connection: Conexión de SQLAlchemy
+    
+    Returns:
+        bool: True si el índice se creó en esta llamada
+    """
+    created = not inspect(connection).has_table(CLIENT_SEARCH_TABLE)
+    for statement in CLIENT_SEARCH_DDL:
+        connection.execute(text(statement))
+    if created:
+        connection.execute(text(f"INSERT INTO {CLIENT_SEARCH_TABLE}({CLIENT_SEARCH_TABLE}) VALUES ('rebuild')"))
+    return created
+
+def drop_client_search(connection):
+    """
+    Borra el índice de texto completo de clientes y sus triggers.
+    
+    Para cargas masivas: llenar el índice fila por fila desde los triggers es varias veces
+    más lento que crearlo después con upgrade_schema(), que lo llena en una sola pasada.
+    
+    Args:
+        connection: Conexión de SQLAlchemy
+    """
+    for trigger in ('clients_fts_insert', 'clients_fts_delete', 'clients_fts_update'):
+        connection.execute(text(f'DROP TRIGGER IF EXISTS {trigger}'))
+    connection.execute(text(f'DROP TABLE IF EXISTS {CLIENT_SEARCH_TABLE}'))
+
+def upgrade_schema(analyze=False):
+    """
+    Crea las tablas que faltan, los índices nuevos y el índice de búsqueda de clientes
+    sobre la base de datos configurada.
+    
+    ANALYZE recorre todas las tablas (minutos en una base de varios GB), así que solo se
+    ejecuta si se creó algún índice o si se pide con analyze=True.
+    
+    Debe llamarse dentro de un contexto de aplicación.
+    
+    Args:
+        analyze: Actualizar las estadísticas del planificador aunque no haya índices nuevos
+    
+    Returns:
+        list: Nombres de los índices creados
+    """
+    db.create_all()
+    with db.engine.begin() as connection:
+        created = ensure_indexes(connection)
+        if ensure_client_search(connection):
+            created.append(CLIENT_SEARCH_TABLE)
+        if created or analyze:
+            connection.execute(text('ANALYZE'))
+    return created
+
+def explain_query_plan(connection, sql, params=None):
+    """
+    Obtiene el plan de ejecución de SQLite para una consulta.
+    
+    Args:
+        connection: Conexión de SQLAlchemy
+        sql: Consulta a analizar
+        params: Parámetros de la consulta (opcional)
+    
+    Returns:
+        list: Líneas de detalle del plan (columna 'detail' de EXPLAIN QUERY PLAN)
+    """
+    rows = connection.execute(text(f'EXPLAIN QUERY PLAN {sql}'), params or {'value': None})
+    return [row[-1] for row in rows]
+
+def check_lookup_plans(connection):
+    """
+    Verifica con EXPLAIN QUERY PLAN que las búsquedas frecuentes usan su índice.
+    
+    Args:
+        connection: Conexión de SQLAlchemy
+    
+    Returns:
+        list: Tuplas (descripción, índice esperado, plan, usa el índice)
+    """
+    results = []
+    for description, sql, index_name in LOOKUP_PLANS:
+        plan = explain_query_plan(connection, sql)
+        uses_index = any(index_name in detail for detail in plan)
+        results.append((description, index_name, plan, uses_index))
+    return results
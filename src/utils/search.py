@@ -0,0 +1,228 @@
+import bisect
+import re
+import threading
+import time
+import unicodedata
+from flask import current_app, request
+from werkzeug.exceptions import BadRequest
+
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+MAX_SEARCH_TERMS = 8
+DEFAULT_INDEX_TTL = 300
+
+_TERM_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+def get_search_args():
+    """
+    Lee los parámetros de búsqueda (?q=&limit=) de la petición actual.
+
+    Returns:
+        tuple: (q, limit)
+
+    Raises:
+        BadRequest: Si falta q o limit no es un entero válido
+    """
+    q = request.args.get('q', '').strip()
+    if not q:
+        raise BadRequest("Query parameter 'q' is required")
+
+    limit = request.args.get('limit', DEFAULT_SEARCH_LIMIT)
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        raise BadRequest("Limit must be an integer")
+    if not (1 <= limit <= MAX_SEARCH_LIMIT):
+        raise BadRequest(f"Limit must be between 1 and {MAX_SEARCH_LIMIT}")
+
+    return q, limit
+
+def build_prefix_match(text, max_terms=MAX_SEARCH_TERMS):
+    """
+    Convierte el texto escrito por el usuario en una consulta MATCH de FTS5 por prefijo.
+
+    Cada palabra se cita y se busca como prefijo ("jua"* encuentra "Juan"), y todas
+    deben aparecer. Los signos de puntuación se descartan, así que el texto del usuario
+    nunca se interpreta como sintaxis de FTS5.
+
+    Args:
+        text: Texto de búsqueda
+        max_terms: Cantidad máxima de palabras que se usan
+
+    Returns:
+        str: Consulta MATCH, o None si el texto no tiene palabras
+    """
+    terms = _TERM_PATTERN.findall(text)[:max_terms]
+    if not terms:
+        return None
+    return ' '.join(f'"{term}"*' for term in terms)
+
+def normalize_text(text):
+    """
+    Normaliza un texto para compararlo sin distinguir mayúsculas ni tildes ("Limón" -> "limon").
+
+    Args:
+        text: Texto a normalizar
+
+    Returns:
+        str: Texto normalizado
+    """
+    decomposed = unicodedata.normalize('NFKD', text.casefold())
+    return ' '.join(''.join(char for char in decomposed if not unicodedata.combining(char)).split())
+
+class PrefixIndex:
+    """
+    Índice en memoria para autocompletar por prefijo.
+
+    Guarda una lista ordenada de claves normalizadas: una por cada palabra del nombre,
+    desde esa palabra hasta el final ("manzana roja" -> "manzana roja", "roja"), así
+    "roj" también encuentra "Manzana roja". Una búsqueda es una bisección más un
+    recorrido de a lo sumo unas pocas entradas por resultado, sin tocar la base de datos.
+
+    Se carga completo la primera vez que se usa en cada aplicación. Los servicios que
+    escriben llaman a upsert(), remove() o invalidate(). Con una función version, cada
+    búsqueda compara la versión compartida de los datos con la que tenía el índice al
+    cargarse y lo recarga si otro proceso escribió; sin ella, el TTL cubre esos cambios.
+    """
+
+    def __init__(self, loader, version=None, ttl_config_key='REFERENCE_CACHE_TTL'):
+        """
+        Args:
+            loader: Función sin argumentos que devuelve un iterable de (id, nombre, datos)
+            version: Función sin argumentos que devuelve la versión actual de los datos (opcional)
+            ttl_config_key: Clave de configuración con el TTL en segundos
+        """
+        self._loader = loader
+        self._version = version
+        self._ttl_config_key = ttl_config_key
+        self._lock = threading.Lock()
+        self._app = None
+        self._keys = None
+        self._entries = {}
+        self._expires_at = 0.0
+        self._loaded_version = None
+
+    @staticmethod
+    def _index_keys(item_id, name):
+        words = normalize_text(name).split(' ')
+        return [(' '.join(words[position:]), item_id) for position in range(len(words)) if words[position]]
+
+    def _is_current(self, app):
+        return self._keys is not None and self._app is app and time.monotonic() < self._expires_at
+
+    def _load(self, app, version=None):
+        keys = []
+        entries = {}
+        for item_id, name, data in self._loader():
+            entries[item_id] = (name, data)
+            keys.extend(self._index_keys(item_id, name))
+        keys.sort()
+        self._keys = keys
+        self._entries = entries
+        self._app = app
+        # Se lee antes que las filas: si alguien escribe entre medio, la próxima búsqueda recarga
+        self._loaded_version = version
+        self._expires_at = time.monotonic() + app.config.get(self._ttl_config_key, DEFAULT_INDEX_TTL)
+
+    def is_loaded(self):
+        """
+        Indica si el índice está cargado y vigente para la aplicación actual.
+
+        Returns:
+            bool: True si upsert() y remove() tendrán efecto
+        """
+        return self._is_current(current_app._get_current_object())
+
+    def search(self, prefix, limit=DEFAULT_SEARCH_LIMIT):
+        """
+        Busca los elementos cuyo nombre, o alguna de sus palabras, empieza por el prefijo.
+
+        Args:
+            prefix: Texto escrito por el usuario
+            limit: Cantidad máxima de resultados
+
+        Returns:
+            list: Datos de los elementos encontrados, en orden alfabético de la clave
+        """
+        app = current_app._get_current_object()
+        prefix = normalize_text(prefix)
+        version = self._version() if self._version is not None else None
+        with self._lock:
+            if not self._is_current(app) or version != self._loaded_version:
+                self._load(app, version)
+            keys = self._keys
+            results = []
+            seen = set()
+            position = bisect.bisect_left(keys, (prefix,))
+            while position < len(keys) and len(results) < limit:
+                key, item_id = keys[position]
+                if not key.startswith(prefix):
+                    break
+                if item_id not in seen:
+                    seen.add(item_id)
+                    results.append(self._entries[item_id][1])
+                position += 1
+            return results
+
+    def upsert(self, item_id, name, data):
+        """
+        Agrega o actualiza un elemento. Si el índice todavía no se cargó no hace nada.
+
+        Args:
+            item_id: ID del elemento
+            name: Nombre por el que se busca
+            data: Datos que se devuelven en los resultados
+        """
+        with self._lock:
+            if not self._is_current(current_app._get_current_object()):
+                return
+            previous = self._entries.get(item_id)
+            if previous is None or previous[0] != name:
+                if previous is not None:
+                    self._remove_keys(item_id, previous[0])
+                for key in self._index_keys(item_id, name):
+                    bisect.insort(self._keys, key)
+            self._entries[item_id] = (name, data)
+
+    def remove(self, item_id):
+        """
+        Quita un elemento del índice si existe.
+
+        Args:
+            item_id: ID del elemento
+        """
+        with self._lock:
+            if not self._is_current(current_app._get_current_object()):
+                return
+            previous = self._entries.pop(item_id, None)
+            if previous is not None:
+                self._remove_keys(item_id, previous[0])
+
+    def advance(self, version):
+        """
+        Marca el índice como vigente para una versión nueva después de aplicarle con
+        upsert() o remove() la escritura que la produjo.
+
+        Solo avanza si el índice estaba en la versión anterior; si se perdió cambios de
+        otros procesos sigue desactualizado y la próxima búsqueda lo recarga.
+
+        Args:
+            version: Versión de los datos después de la escritura
+        """
+        with self._lock:
+            if self._is_current(current_app._get_current_object()) and self._loaded_version == version - 1:
+                self._loaded_version = version
+
+    def _remove_keys(self, item_id, name):
+        for key in self._index_keys(item_id, name):
+            position = bisect.bisect_left(self._keys, key)
+            if position < len(self._keys) and self._keys[position] == key:
+                del self._keys[position]
+
+    def invalidate(self):
+        """
+        Descarta el índice; la próxima búsqueda lo vuelve a cargar.
+        """
+        with self._lock:
+            self._keys = None
+            self._entries = {}
@@ -0,0 +1,273 @@
+import logging
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from flask import has_request_context, request
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+_SERVICES_DIR = os.path.join(_SRC_DIR, 'services') + os.sep
+_UTILS_DIR = os.path.join(_SRC_DIR, 'utils') + os.sep
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PARAMETER_LIST = re.compile(r'\(\s*\?(?:\s*,\s*\?)+\s*\)')
+_SPACE = re.compile(r'\s+')
+_EXPLAINABLE = ('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE')
+
+def normalize_sql(statement):
+    """
+    Normaliza una sentencia para agrupar las que solo cambian en sus valores.
+
+    Los literales pasan a ser ?, las listas de parámetros de un IN (que cambian de
+    largo según la cantidad de ids) quedan como (?, ...) y los espacios se colapsan.
+
+    Args:
+        statement: Sentencia SQL
+
+    Returns:
+        str: Sentencia normalizada
+    """
+    statement = _STRING.sub('?', statement)
+    statement = _NUMBER.sub('?', statement)
+    statement = _PARAMETER_LIST.sub('(?, ...)', statement)
+    return _SPACE.sub(' ', statement).strip()
+
+def _value_shape(value):
+    if value is None:
+        return 'None'
+    if isinstance(value, (str, bytes)):
+        return f'{type(value).__name__}[{len(value)}]'
+    return type(value).__name__
+
+def parameter_shape(parameters, executemany=False):
+    """
+    Describe los parámetros de una sentencia sin mostrar sus valores.
+
+    Args:
+        parameters: Parámetros enviados al cursor (secuencia o diccionario)
+        executemany: Si la sentencia se ejecutó con executemany
+
+    Returns:
+        str: Por ejemplo '(str[8], int*2)' o '500 x (int, str[8])'
+    """
+    if executemany:
+        if not parameters:
+            return '0 x ()'
+        return f'{len(parameters)} x {parameter_shape(parameters[0])}'
+    if not parameters:
+        return '()'
+    if isinstance(parameters, dict):
+        return '{' + ', '.join(f'{key}: {_value_shape(value)}' for key, value in parameters.items()) + '}'
+    # Los tipos repetidos seguidos se agrupan: (int*20) para los ids de un IN
+    shapes = []
+    for shape in map(_value_shape, parameters):
+        if shapes and shapes[-1][0] == shape:
+            shapes[-1][1] += 1
+        else:
+            shapes.append([shape, 1])
+    return '(' + ', '.join(shape if count == 1 else f'{shape}*{count}' for shape, count in shapes) + ')'
+
+def _describe_frame(frame):
+    # co_qualname (Python 3.11+) nombra también las funciones internas: search_clients.<locals>.<dictcomp>
+    code = frame.f_code
+    return f"{frame.f_globals.get('__name__')}.{getattr(code, 'co_qualname', code.co_name)}:{frame.f_lineno}"
+
+def find_call_site(frame):
+    """
+    Sube por la pila hasta el código de la aplicación (fuera de src/utils).
+
+    Args:
+        frame: Marco desde el que se empieza a subir
+
+    Returns:
+        tuple: (primer marco de la aplicación, primera función de servicio), cada uno
+            como 'modulo.funcion:línea' o None si no aparece en la pila
+    """
+    first = None
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_SRC_DIR) and not filename.startswith(_UTILS_DIR):
+            description = _describe_frame(frame)
+            if first is None:
+                first = description
+            if filename.startswith(_SERVICES_DIR):
+                return first, description
+        frame = frame.f_back
+    return first, None
+
+def find_caller(frame):
+    """
+    Busca en la pila la función de servicio que ejecutó la sentencia.
+
+    Si la sentencia no viene de un servicio se devuelve el primer marco del código de la
+    aplicación fuera de src/utils (por ejemplo, una ruta).
+
+    Args:
+        frame: Marco desde el que se empieza a subir
+
+    Returns:
+        str: 'modulo.funcion:línea', o None si la sentencia no viene de la aplicación
+    """
+    first, service = find_call_site(frame)
+    return service or first
+
+def explain(dbapi_connection, statement, parameters, executemany=False):
+    """
+    Obtiene el plan de SQLite de una sentencia ya ejecutada.
+
+    Se usa un cursor propio sobre la misma conexión DBAPI, así que no pasa por los
+    eventos de SQLAlchemy ni altera el resultado del cursor original.
+
+    Returns:
+        list: Líneas de detalle del plan
+    """
+    if executemany:
+        parameters = parameters[0] if parameters else ()
+    cursor = dbapi_connection.cursor(sqlite3.Cursor)
+    try:
+        cursor.execute(f'EXPLAIN QUERY PLAN {statement}', parameters or ())
+        return [row[-1] for row in cursor.fetchall()]
+    except sqlite3.Error as e:
+        return [f'unavailable: {e}']
+    finally:
+        cursor.close()
+
+def is_full_scan(plan):
+    """
+    Indica si el plan recorre alguna tabla completa (SCAN sin índice).
+    """
+    return any(detail.startswith('SCAN ') and 'INDEX' not in detail for detail in plan)
+
+class SlowQueryLog:
+    """
+    Registro de las sentencias que superan el umbral configurado.
+
+    Cada sentencia lenta se agrupa por su SQL normalizado. La primera vez se escribe en
+    el log con la forma de sus parámetros, la función que la ejecutó y su plan de
+    ejecución; las repeticiones solo suman al grupo y se vuelven a mencionar cuando el
+    conteo llega a 10, 100, 1000... El costo para las sentencias rápidas es una resta y
+    una comparación.
+    """
+
+    def __init__(self, threshold, explain_plans=True):
+        """
+        Args:
+            threshold: Umbral en segundos
+            explain_plans: Si se captura EXPLAIN QUERY PLAN (solo SQLite)
+        """
+        self.threshold = threshold
+        self.explain_plans = explain_plans
+        self._local = threading.local()
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self._local.start = time.perf_counter()
+
+    def after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - self._local.start
+        if elapsed >= self.threshold:
+            self.record(conn, cursor, statement, parameters, executemany, elapsed, sys._getframe(1))
+
+    def record(self, conn, cursor, statement, parameters, executemany, elapsed, frame):
+        """
+        Registra una sentencia lenta.
+
+        Args:
+            conn: Conexión de SQLAlchemy
+            cursor: Cursor DBAPI con el que se ejecutó
+            statement: Sentencia SQL
+            parameters: Parámetros de la sentencia
+            executemany: Si se ejecutó con executemany
+            elapsed: Duración en segundos
+            frame: Marco desde el que se busca la función que la ejecutó
+        """
+        key = normalize_sql(statement)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry['count'] += 1
+                entry['total_seconds'] += elapsed
+                entry['max_seconds'] = max(entry['max_seconds'], elapsed)
+                count = entry['count']
+                if count >= 10 and str(count).strip('0') == '1':
+                    logger.warning("Slow query seen %d times (max %.1f ms, total %.1f ms, first from %s): %s",
+                                   count, entry['max_seconds'] * 1000, entry['total_seconds'] * 1000,
+                                   entry['caller'], key)
+                return
+
+        plan = []
+        if self.explain_plans and conn.dialect.name == 'sqlite' and \
+                statement.lstrip()[:6].upper().startswith(_EXPLAINABLE):
+            plan = explain(cursor.connection, statement, parameters, executemany)
+        entry = {
+            'sql': key,
+            'count': 1,
+            'total_seconds': elapsed,
+            'max_seconds': elapsed,
+            'caller': find_caller(frame),
+            'endpoint': request.endpoint if has_request_context() else None,
+            'parameters': parameter_shape(parameters, executemany),
+            'plan': plan,
+            'full_scan': is_full_scan(plan),
+        }
+        with self._lock:
+            if key in self._entries:
+                # Otro hilo registró la misma sentencia mientras se obtenía el plan
+                existing = self._entries[key]
+                existing['count'] += 1
+                existing['total_seconds'] += elapsed
+                existing['max_seconds'] = max(existing['max_seconds'], elapsed)
+                return
+            self._entries[key] = entry
+        logger.warning(
+            "Slow query (%.1f ms) from %s%s%s\n  SQL: %s\n  Parameters: %s\n  Plan: %s",
+            elapsed * 1000, entry['caller'], f" [{entry['endpoint']}]" if entry['endpoint'] else '',
+            ' FULL SCAN' if entry['full_scan'] else '', key, entry['parameters'], ' | '.join(plan) or '-'
+        )
+
+    def entries(self):
+        """
+        Obtiene las sentencias lentas registradas, de mayor a menor tiempo total.
+
+        Returns:
+            list: Diccionarios con sql, count, total_seconds, max_seconds, caller,
+                endpoint, parameters, plan y full_scan
+        """
+        with self._lock:
+            entries = [dict(entry) for entry in self._entries.values()]
+        return sorted(entries, key=lambda entry: entry['total_seconds'], reverse=True)
+
+    def reset(self):
+        """
+        Olvida las sentencias registradas.
+        """
+        with self._lock:
+            self._entries.clear()
+
+def init_slow_query_log(app, engine):
+    """
+    Activa el registro de sentencias lentas si SLOW_QUERY_THRESHOLD_MS es mayor que 0.
+
+    Args:
+        app: Aplicación Flask
+        engine: Engine de SQLAlchemy de la aplicación
+
+    Returns:
+        SlowQueryLog: Registro de la aplicación (también en app.extensions['slow_queries']),
+            o None si está desactivado
+    """
+    threshold_ms = app.config['SLOW_QUERY_THRESHOLD_MS']
+    if not threshold_ms or threshold_ms <= 0:
+        return None
+    slow_queries = SlowQueryLog(threshold_ms / 1000, app.config['SLOW_QUERY_EXPLAIN'])
+    event.listen(engine, 'before_cursor_execute', slow_queries.before_cursor_execute)
+    event.listen(engine, 'after_cursor_execute', slow_queries.after_cursor_execute)
+    app.extensions['slow_queries'] = slow_queries
+    return slow_queries
@@ -0,0 +1,65 @@
+from flask import Response, current_app, request, stream_with_context
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+JSON_MIMETYPE = 'application/json'
+STREAM_BATCH_SIZE = 500
+
+def wants_stream():
+    """
+    Indica si la petición actual pidió una respuesta en streaming.
+
+    Se activa con ?stream=1 o con el encabezado Accept: application/x-ndjson.
+
+    Returns:
+        bool: True si se debe responder en streaming
+    """
+    if request.args.get('stream', '').lower() in ('1', 'true', 'yes'):
+        return True
+    return wants_ndjson()
+
+def wants_ndjson():
+    """
+    Indica si el cliente prefiere NDJSON (una fila JSON por línea) sobre un arreglo JSON.
+
+    Returns:
+        bool: True si el Accept de la petición prefiere application/x-ndjson
+    """
+    return request.accept_mimetypes.best_match([JSON_MIMETYPE, NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+def _ndjson_rows(rows, serialize):
+    dumps = current_app.json.dumps_bytes
+    for row in rows:
+        yield dumps(serialize(row)) + b'\n'
+
+def _json_array_rows(rows, serialize):
+    dumps = current_app.json.dumps_bytes
+    yield b'['
+    separator = b''
+    for row in rows:
+        yield separator + dumps(serialize(row))
+        separator = b','
+    yield b']'
+
+def stream_response(rows, serialize=lambda row: row.to_dict()):
+    """
+    Construye una respuesta que escribe las filas a medida que se leen de la base de datos.
+
+    La memoria usada no depende del tamaño de la colección: cada fila se serializa y se
+    envía antes de leer la siguiente. El formato es NDJSON si el cliente lo pide en Accept
+    y un arreglo JSON en cualquier otro caso.
+
+    Args:
+        rows: Iterable de filas, normalmente una consulta con yield_per
+        serialize: Función que convierte cada fila en un diccionario
+
+    Returns:
+        Response: Respuesta en streaming
+    """
+    if wants_ndjson():
+        body, mimetype = _ndjson_rows(rows, serialize), NDJSON_MIMETYPE
+    else:
+        body, mimetype = _json_array_rows(rows, serialize), JSON_MIMETYPE
+    # stream_with_context mantiene viva la sesión de base de datos mientras se itera
+    response = Response(stream_with_context(body), mimetype=mimetype)
+    response.vary.add('Accept')
+    return response
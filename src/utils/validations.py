@@ -177,4 +177,284 @@ def validate_password(password, required=True):
             raise BadRequest("Password must contain at least one uppercase letter")
         if not any(char.islower() for char in password):
             raise BadRequest("Password must contain at least one lowercase letter")
-    return True
\ No newline at end of file
+    return True
+
+# --- Esquemas compilados ---------------------------------------------------------
+#
+# Las funciones validate_* de arriba validan un campo por vez y lanzan en el primer
+# error. Un Schema declara todas las reglas de una entidad y las compila una sola vez
+# en una función de Python generada, con los nombres, mensajes y límites escritos como
+# constantes; validar un registro es una sola llamada que devuelve todos los errores.
+
+class ValidationError(BadRequest):
+    """
+    Error de validación con el detalle de todos los campos inválidos.
+    """
+
+    def __init__(self, errors):
+        """
+        Args:
+            errors: Diccionario {campo: mensaje}
+        """
+        self.errors = errors
+        super().__init__('; '.join(errors.values()))
+
+class Field:
+    """
+    Reglas de un campo presente: lista de (condición, mensaje) que se evalúan en orden
+    sobre la variable value; la primera condición verdadera es el error del campo.
+    """
+    __slots__ = ('rules', 'required', 'missing')
+
+    def __init__(self, rules, required, missing):
+        """
+        Args:
+            rules: Lista de (expresión de Python sobre value, mensaje de error)
+            required: Si el campo es requerido
+            missing: Mensaje cuando el campo requerido falta o está vacío
+        """
+        self.rules = rules
+        self.required = required
+        self.missing = missing
+
+def text_field(label, max_length=50, required=True):
+    """
+    Campo de texto (equivale a validate_string_field).
+    
+    Args:
+        label: Nombre del campo para mensajes de error
+        max_length: Longitud máxima permitida
+        required: Si el campo es requerido
+    
+    Returns:
+        Field: Reglas del campo
+    """
+    empty = f"{label} cannot be empty"
+    rules = [('value.__class__ is not str', f"{label} must be a string")]
+    if required:
+        rules.append(('value.isspace()', empty))
+    rules.append((f'len(value) > {int(max_length)}', f"{label} must have less than {max_length} characters"))
+    return Field(rules, required, empty)
+
+def digits_field(label, min_length=1, max_length=10, required=True):
+    """
+    Campo de texto formado solo por dígitos (teléfono, número de identidad, NIT).
+    
+    Args:
+        label: Nombre del campo para mensajes de error
+        min_length: Cantidad mínima de dígitos
+        max_length: Cantidad máxima de dígitos
+        required: Si el campo es requerido
+    
+    Returns:
+        Field: Reglas del campo
+    """
+    empty = f"{label} cannot be empty"
+    if min_length > 1:
+        bad_length = f"{label} must have between {min_length} and {max_length} digits"
+    else:
+        bad_length = f"{label} must have less than {max_length} digits"
+    rules = [('value.__class__ is not str', f"{label} must be a string")]
+    if required:
+        rules.append(('value.isspace()', empty))
+    rules.append(('not value.isdigit()', f"{label} must contain only digits"))
+    rules.append((f'not ({int(min_length)} <= len(value) <= {int(max_length)})', bad_length))
+    return Field(rules, required, empty)
+
+def email_field(label='Email', max_length=50, required=True):
+    """
+    Campo de correo electrónico (equivale a validate_email).
+    
+    Args:
+        label: Nombre del campo para mensajes de error
+        max_length: Longitud máxima permitida
+        required: Si el campo es requerido
+    
+    Returns:
+        Field: Reglas del campo
+    """
+    empty = f"{label} cannot be empty"
+    rules = [('value.__class__ is not str', f"{label} must be a string")]
+    if required:
+        rules.append(('value.isspace()', empty))
+    rules.append(("'@' not in value", "Invalid email format"))
+    rules.append((f'len(value) > {int(max_length)}', f"{label} must have less than {max_length} characters"))
+    return Field(rules, required, empty)
+
+def number_field(label, min_value=0, integer=False, required=True):
+    """
+    Campo numérico (equivale a validate_numeric_field). Los booleanos no se aceptan.
+    
+    Args:
+        label: Nombre del campo para mensajes de error
+        min_value: Valor mínimo permitido
+        integer: Si solo se aceptan enteros
+        required: Si el campo es requerido
+    
+    Returns:
+        Field: Reglas del campo
+    """
+    if integer:
+        type_rule = ('value.__class__ is not int', f"{label} must be an integer")
+    else:
+        type_rule = ('value.__class__ is not int and value.__class__ is not float', f"{label} must be a number")
+    rules = [
+        type_rule,
+        (f'value < {min_value!r}', f"{label} must be greater than or equal to {min_value}")
+    ]
+    return Field(rules, required, f"{label} is required")
+
+def password_field(required=True):
+    """
+    Campo de contraseña (equivale a validate_password).
+    
+    Args:
+        required: Si el campo es requerido
+    
+    Returns:
+        Field: Reglas del campo
+    """
+    rules = [('value.__class__ is not str', "Password must be a string")]
+    if required:
+        rules.append(('value.isspace()', "Password cannot be empty"))
+    rules += [
+        ('len(value) < 8', "Password must have at least 8 characters"),
+        ('not any(char.isdigit() for char in value)', "Password must contain at least one number"),
+        ('not any(char.isalpha() for char in value)', "Password must contain at least one letter"),
+        ('not any(char.isupper() for char in value)', "Password must contain at least one uppercase letter"),
+        ('not any(char.islower() for char in value)', "Password must contain at least one lowercase letter"),
+    ]
+    return Field(rules, required, "Password cannot be empty")
+
+def _compile_source(fields):
+    """
+    Genera el código de la función de validación de un esquema.
+    
+    Args:
+        fields: Diccionario {campo: Field}
+    
+    Returns:
+        str: Código de una función errors(record, partial=False) -> dict
+    """
+    lines = [
+        'def errors(record, partial=False):',
+        '    found = {}',
+        '    get = record.get',
+    ]
+    for name, field in fields.items():
+        key = repr(name)
+        lines.append(f'    value = get({key})')
+        lines.append("    if value is None or value == '':")
+        if field.required:
+            lines.append(f'        if not partial or {key} in record:')
+            lines.append(f'            found[{key}] = {field.missing!r}')
+        else:
+            lines.append('        pass')
+        for condition, message in field.rules:
+            lines.append(f'    elif {condition}:')
+            lines.append(f'        found[{key}] = {message!r}')
+    lines.append('    return found')
+    return '\n'.join(lines)
+
+class Schema:
+    """
+    Reglas de validación de una entidad, compiladas una sola vez en una función.
+    
+    Ejemplo:
+        CLIENT_SCHEMA = Schema(name=text_field('Name'), phone=digits_field('Phone'))
+        CLIENT_SCHEMA.validate(data)
+    """
+
+    def __init__(self, **fields):
+        """
+        Args:
+            **fields: Reglas por nombre de campo, en el orden en que se informan los errores
+        """
+        self.fields = fields
+        self.source = _compile_source(fields)
+        namespace = {}
+        exec(compile(self.source, f'<schema {", ".join(fields)}>', 'exec'), namespace)
+        self._errors = namespace['errors']
+
+    def errors(self, record, partial=False):
+        """
+        Valida un registro y devuelve todos sus errores.
+        
+        Args:
+            record: Diccionario con los datos; las claves que no están en el esquema se ignoran
+            partial: Si es True, los campos ausentes no se consideran faltantes (actualizaciones parciales)
+        
+        Returns:
+            dict: {campo: mensaje}, vacío si el registro es válido
+        """
+        return self._errors(record, partial)
+
+    def validate(self, record, partial=False):
+        """
+        Valida un registro.
+        
+        Args:
+            record: Diccionario con los datos
+            partial: Si es True, solo se validan los campos presentes
+        
+        Returns:
+            dict: El mismo registro
+        
+        Raises:
+            ValidationError: Con todos los campos inválidos
+        """
+        errors = self._errors(record, partial)
+        if errors:
+            raise ValidationError(errors)
+        return record
+
+    def validate_many(self, records, partial=False):
+        """
+        Valida una lista de registros en una sola llamada.
+        
+        Args:
+            records: Iterable de diccionarios
+            partial: Si es True, solo se validan los campos presentes
+        
+        Returns:
+            dict: {posición del registro: {campo: mensaje}} solo para los registros inválidos
+        """
+        errors_of = self._errors
+        invalid = {}
+        for position, record in enumerate(records):
+            errors = errors_of(record, partial)
+            if errors:
+                invalid[position] = errors
+        return invalid
+
+
+CLIENT_SCHEMA = Schema(
+    name=text_field('Name'),
+    last_name=text_field('Last name'),
+    identity_card=digits_field('Identity card', min_length=8, max_length=11),
+    phone=digits_field('Phone'),
+    email=email_field(required=False),
+    address=text_field('Address', max_length=100, required=False)
+)
+
+PRODUCT_SCHEMA = Schema(
+    name=text_field('Name'),
+    price=number_field('Price'),
+    stock=number_field('Stock', integer=True)
+)
+
+SUPPLIER_SCHEMA = Schema(
+    name=text_field('Name'),
+    phone=digits_field('Phone'),
+    nit=digits_field('NIT', min_length=10, max_length=11),
+    email=email_field(),
+    address=text_field('Address', max_length=100)
+)
+
+USER_SCHEMA = Schema(
+    name=text_field('Name'),
+    last_name=text_field('Last name'),
+    email=email_field(),
+    role_id=number_field('Role', min_value=1, integer=True),
+    password=password_field()
+)
@@ -0,0 +1,88 @@
+from decimal import Decimal
+from types import SimpleNamespace
+import pytest
+from werkzeug.security import generate_password_hash
+from src import create_app, db
+from src.models import Category, Client, Payment, Product, Role, Supplier, User
+
+PASSWORD = 'Fruteria2024'
+
+@pytest.fixture
+def app_config():
+    """
+    Configuración adicional de la aplicación; un módulo de pruebas la redefine para
+    cambiarla (por ejemplo, LAZY_LOAD_MODE).
+    """
+    return {}
+
+@pytest.fixture
+def app(tmp_path, app_config):
+    """
+    Aplicación sobre un Fruteria.db temporal con las tablas creadas con create_all().
+    
+    Las pruebas corren dentro del contexto de la aplicación, así pueden usar los
+    servicios y db.session directamente.
+    """
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'Fruteria.db'}",
+        'SECRET_KEY': 'test-secret-key',
+        'SLOW_QUERY_THRESHOLD_MS': 0,
+        # Hash rápido: las pruebas no miden el costo del hashing
+        'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:1000',
+        **app_config,
+    })
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture
+def store(app):
+    """
+    Datos mínimos para vender: roles, medios de pago, una categoría, un proveedor,
+    dos productos, un cliente y un vendedor (usuario 'vendedor', contraseña PASSWORD).
+    
+    Returns:
+        SimpleNamespace: IDs de los registros creados
+    """
+    seller_role = Role(name='seller', description='Vendedor')
+    cash = Payment(name='Efectivo', description='Pago en efectivo')
+    category = Category(name='Frutas')
+    supplier = Supplier(name='Proveedor A', phone='3001234567', email='ventas@proveedora.com',
+                        address='Calle 1 #2-3', nit='9001234567')
+    db.session.add_all([Role(name='admin', description='Administrador'), seller_role, cash, category, supplier])
+    db.session.flush()
+    apple = Product(name='Manzana roja', price=Decimal('1.50'), stock=10,
+                    category_id=category.category_id, supplier_id=supplier.supplier_id)
+    pear = Product(name='Pera', price=Decimal('2.25'), stock=5,
+                   category_id=category.category_id, supplier_id=supplier.supplier_id)
+    client = Client(name='Ana', last_name='Gómez', identity_card='1020304050', phone='3001234567')
+    seller = User(username='vendedor', password=generate_password_hash(PASSWORD, method=app.config['PASSWORD_HASH_METHOD']),
+                  name='Luis', last_name='Pérez', email='luis@fruteria.com', role_id=seller_role.role_id)
+    db.session.add_all([apple, pear, client, seller])
+    db.session.commit()
+    return SimpleNamespace(
+        payment_id=cash.payment_id,
+        category_id=category.category_id,
+        supplier_id=supplier.supplier_id,
+        apple_id=apple.product_id,
+        pear_id=pear.product_id,
+        client_id=client.client_id,
+        user_id=seller.user_id,
+    )
+
+def checkout(client, store, items):
+    """
+    Registra una venta por la API con el cliente y el vendedor de store.
+    """
+    return client.post('/fruteria/v1/sales', json={
+        'client_id': store.client_id,
+        'user_id': store.user_id,
+        'payment_id': store.payment_id,
+        'items': items,
+    })
@@ -0,0 +1,45 @@
+from src.services.user_service import update_user, delete_user
+from conftest import PASSWORD
+
+def login(client, username, password):
+    return client.post('/fruteria/v1/auth/login', json={'username': username, 'password': password})
+
+def me(client, token):
+    return client.get('/fruteria/v1/auth/me', headers={'Authorization': f'Bearer {token}'})
+
+def test_login_issues_a_token_for_the_user(client, store):
+    response = login(client, 'vendedor', PASSWORD)
+    assert response.status_code == 200
+    token = response.get_json()['token']
+
+    response = me(client, token)
+    assert response.status_code == 200
+    assert response.get_json() == {'user_id': store.user_id, 'username': 'vendedor', 'role': 'seller', 'is_active': True}
+
+def test_unknown_user_and_wrong_password_get_the_same_401(client, store):
+    unknown = login(client, 'nadie', PASSWORD)
+    wrong = login(client, 'vendedor', 'otra-clave')
+
+    assert unknown.status_code == wrong.status_code == 401
+    assert unknown.get_json() == wrong.get_json()
+
+def test_expired_or_tampered_tokens_are_rejected(app, client, store):
+    token = login(client, 'vendedor', PASSWORD).get_json()['token']
+
+    assert me(client, token[:-2] + 'xx').status_code == 401
+    assert me(client, 'no-es-un-token').status_code == 401
+
+    app.config['AUTH_TOKEN_MAX_AGE'] = -1
+    response = me(client, token)
+    assert response.status_code == 401
+    assert 'expired' in response.get_json()['error']
+
+def test_cached_session_follows_user_changes(client, store):
+    token = login(client, 'vendedor', PASSWORD).get_json()['token']
+    assert me(client, token).get_json()['role'] == 'seller'
+
+    update_user(store.user_id, role_id=1)
+    assert me(client, token).get_json()['role'] == 'admin'
+
+    delete_user(store.user_id)
+    assert me(client, token).status_code == 401
@@ -0,0 +1,52 @@
+from conftest import checkout
+
+PRODUCTS = '/fruteria/v1/products'
+
+def revalidate(client, url, etag):
+    return client.get(url, headers={'If-None-Match': etag})
+
+def test_unchanged_catalog_answers_304(client, store):
+    response = client.get(PRODUCTS)
+    etag = response.headers['ETag']
+    assert response.status_code == 200
+    assert response.headers['Cache-Control'] == 'no-cache'
+
+    response = revalidate(client, PRODUCTS, etag)
+    assert response.status_code == 304
+    assert response.data == b''
+    assert response.headers['ETag'] == etag
+
+def test_product_write_changes_the_etag(client, store):
+    etag = client.get(PRODUCTS).headers['ETag']
+
+    assert client.patch(f'{PRODUCTS}/{store.pear_id}', json={'price': 2.5}).status_code == 200
+
+    response = revalidate(client, PRODUCTS, etag)
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert revalidate(client, PRODUCTS, response.headers['ETag']).status_code == 304
+
+def test_sale_changes_the_etag(client, store):
+    etag = client.get(PRODUCTS).headers['ETag']
+
+    assert checkout(client, store, [{'product_id': store.apple_id, 'quantity': 1}]).status_code == 201
+
+    assert revalidate(client, PRODUCTS, etag).status_code == 200
+
+def test_failed_sale_keeps_the_etag(client, store):
+    etag = client.get(PRODUCTS).headers['ETag']
+
+    assert checkout(client, store, [{'product_id': store.pear_id, 'quantity': 50}]).status_code == 409
+
+    assert revalidate(client, PRODUCTS, etag).status_code == 304
+
+def test_category_listing_revalidates_and_checks_the_category(client, store):
+    url = f'{PRODUCTS}/category/{store.category_id}'
+    etag = client.get(url).headers['ETag']
+    assert revalidate(client, url, etag).status_code == 304
+    # Una categoría inexistente es 404 aunque el ETag coincida
+    assert revalidate(client, f'{PRODUCTS}/category/9999', etag).status_code == 404
+
+    assert client.put(f'/fruteria/v1/categories/{store.category_id}', json={'name': 'Frutas frescas'}).status_code == 200
+
+    assert revalidate(client, url, etag).status_code == 200
@@ -0,0 +1,12 @@
+from src import db
+from src.models import Client
+
+def test_search_works_on_a_database_built_with_create_all(client):
+    # El fixture no llama a upgrade_schema(): create_all() también crea el índice de búsqueda
+    db.session.add(Client(name='Ana María', last_name='Gómez', identity_card='1020304050',
+                          phone='3001234567', email='ana@example.com'))
+    db.session.commit()
+
+    response = client.get('/fruteria/v1/clients/search?q=gom')
+    assert response.status_code == 200
+    assert [found['identity_card'] for found in response.get_json()['data']] == ['1020304050']
@@ -0,0 +1,52 @@
+from src.services.catalog_service import get_catalog_etag
+
+def product_rows(store, count, start=0):
+    lines = ['name,price,stock,category_id,supplier_id']
+    lines += [f'Producto {number},1.25,10,{store.category_id},{store.supplier_id}' for number in range(start, start + count)]
+    return ('\n'.join(lines) + '\n').encode()
+
+def import_csv(client, body):
+    return client.post('/fruteria/v1/products/import', data=body, content_type='text/csv')
+
+def test_invalid_utf8_keeps_committed_batches_and_refreshes_catalog(app, client, store):
+    app.config['IMPORT_BATCH_SIZE'] = 100
+    etag = get_catalog_etag()
+    assert client.get('/fruteria/v1/products/suggest?q=producto').get_json()['data'] == []
+
+    response = import_csv(client, product_rows(store, 2000) + b'Producto \xff,1.00,1,1,1\n')
+
+    assert response.status_code == 200
+    report = response.get_json()
+    # El texto se decodifica por bloques: se insertan las filas leídas antes del bloque inválido
+    assert 1000 <= report['inserted'] < 2000
+    assert report['failed'] == 1
+    assert 'Invalid UTF-8' in report['errors'][0]['error']
+    # Los lotes confirmados cambian el catálogo aunque el archivo no se haya leído completo
+    assert client.get('/fruteria/v1/products', headers={'If-None-Match': f'"{etag}"'}).status_code == 200
+    assert client.get('/fruteria/v1/products/suggest?q=producto').get_json()['data'] != []
+
+def test_ndjson_skips_a_badly_encoded_line(client, store):
+    body = (
+        b'{"name": "Mango", "price": 2.5, "stock": 4, "category_id": 1, "supplier_id": 1}\n'
+        b'{"name": "Mango \xff", "price": 2.5, "stock": 4, "category_id": 1, "supplier_id": 1}\n'
+        b'{"name": "Papaya", "price": 3, "stock": 2, "category_id": 1, "supplier_id": 1}\n'
+    )
+    response = client.post('/fruteria/v1/products/import', data=body, content_type='application/x-ndjson')
+    report = response.get_json()
+    assert report['inserted'] == 2
+    assert report['errors'] == [{'row': 2, 'error': 'Invalid UTF-8'}]
+
+def test_client_import_reports_schema_errors_by_row(client):
+    body = (
+        'name,last_name,identity_card,phone,email\n'
+        'Ana,Gómez,1020304050,3001234567,ana@example.com\n'
+        'Luis,Pérez,12,sin telefono,luis@example.com\n'
+        'Sofía,Ruiz,1020304051,3007654321,\n'
+        ',Díaz,1020304052,3000000000,sin-arroba\n'
+    ).encode()
+    response = client.post('/fruteria/v1/clients/import', data=body, content_type='text/csv')
+    report = response.get_json()
+    assert report['inserted'] == 2
+    assert [error['row'] for error in report['errors']] == [2, 4]
+    assert 'Phone must contain only digits' in report['errors'][0]['error']
+    assert report['errors'][1]['error'] == 'Name cannot be empty; Invalid email format'
@@ -0,0 +1,23 @@
+import pytest
+from decimal import Decimal
+from src.utils.json_provider import orjson
+
+BACKENDS = ['stdlib'] + (['orjson'] if orjson is not None else [])
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_money_round_trips_as_a_json_number(app, client, store, backend):
+    app.json.backend = backend
+    product = client.get(f'/fruteria/v1/products/{store.pear_id}').get_json()
+    assert product['price'] == 2.25
+
+    response = client.patch(f'/fruteria/v1/products/{store.pear_id}', json={'price': product['price']})
+
+    assert response.status_code == 200
+    assert response.get_json()['price'] == product['price']
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_decimal_is_encoded_with_its_exact_value(app, backend):
+    app.json.backend = backend
+    total = app.json.loads(app.json.dumps({'total': Decimal('12345678.90')}))['total']
+    assert isinstance(total, float)
+    assert Decimal(repr(total)) == Decimal('12345678.90')
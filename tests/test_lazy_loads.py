@@ -0,0 +1,25 @@
+import pytest
+from src import db
+from src.models import Sale
+from src.utils.lazy_loads import LazyLoadError, detect_lazy_loads
+from conftest import checkout
+
+@pytest.fixture
+def app_config():
+    return {'LAZY_LOAD_MODE': 'raise'}
+
+def test_detector_lets_writes_and_text_queries_through(client, store):
+    # El checkout ejecuta un UPDATE condicionado y un INSERT en bloque; la búsqueda, un text()
+    response = checkout(client, store, [{'product_id': store.apple_id, 'quantity': 2}])
+    assert response.status_code == 201
+    assert client.get('/fruteria/v1/clients/search?q=gom').status_code == 200
+
+def test_detector_names_the_relationship_of_an_n_plus_one_loop(client, store):
+    for _ in range(2):
+        assert checkout(client, store, [{'product_id': store.pear_id, 'quantity': 1}]).status_code == 201
+    db.session.expunge_all()
+
+    with pytest.raises(LazyLoadError, match=r'Sale\.details'):
+        with detect_lazy_loads(threshold=0):
+            for sale in Sale.query.all():
+                sale.details
@@ -0,0 +1,10 @@
+import pytest
+from src import db
+from src.utils.schema import LOOKUP_PLANS, explain_query_plan, upgrade_schema
+
+@pytest.mark.parametrize('description, sql, index_name', LOOKUP_PLANS, ids=[plan[0] for plan in LOOKUP_PLANS])
+def test_lookup_uses_index(app, description, sql, index_name):
+    upgrade_schema(analyze=True)
+    with db.engine.connect() as connection:
+        plan = explain_query_plan(connection, sql)
+    assert any(index_name in detail for detail in plan), f"{description} does not use {index_name}: {plan}"
@@ -0,0 +1,21 @@
+import threading
+from src.utils.metrics import RequestMetrics, _BYTES
+
+KEY = ('product', 'product.get_products', 'GET')
+
+def record_request(metrics):
+    metrics.start()
+    metrics.finish(metrics.current(), KEY, 200, 10)
+
+def test_shards_of_finished_threads_are_retired():
+    metrics = RequestMetrics()
+    # Como el servidor de werkzeug: un hilo nuevo por petición
+    for _ in range(200):
+        thread = threading.Thread(target=record_request, args=(metrics,))
+        thread.start()
+        thread.join()
+
+    series, statuses = metrics.snapshot()
+    assert len(metrics._shards) <= 1
+    assert statuses[KEY + (200,)] == 200
+    assert series[KEY][metrics._size + _BYTES] == 2000
@@ -0,0 +1,19 @@
+from src import db
+from src.models import Payment
+from src.services.payment_service import get_all_payments, get_all_payment_refs, get_payment_ref, invalidate_payment_cache
+
+def test_get_all_payments_returns_models(store):
+    payments = get_all_payments()
+    assert all(isinstance(payment, Payment) for payment in payments)
+    assert [payment.name for payment in payments] == ['Efectivo']
+
+def test_payment_refs_come_from_the_cache_until_invalidated(store):
+    assert get_all_payment_refs() == [{'id': store.payment_id, 'name': 'Efectivo', 'description': 'Pago en efectivo'}]
+
+    db.session.add(Payment(name='Tarjeta', description='Tarjeta débito o crédito'))
+    db.session.commit()
+    assert [payment['name'] for payment in get_all_payment_refs()] == ['Efectivo']
+
+    invalidate_payment_cache()
+    assert [payment['name'] for payment in get_all_payment_refs()] == ['Efectivo', 'Tarjeta']
+    assert get_payment_ref(store.payment_id)['name'] == 'Efectivo'
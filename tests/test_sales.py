@@ -0,0 +1,65 @@
+from decimal import Decimal
+from src import db
+from src.models import DailySalesSummary, Product, Sale
+from conftest import checkout
+
+def stock(*product_ids):
+    db.session.expire_all()
+    return [db.session.get(Product, product_id).stock for product_id in product_ids]
+
+def test_checkout_merges_repeated_products(client, store):
+    response = checkout(client, store, [
+        {'product_id': store.apple_id, 'quantity': 2},
+        {'product_id': store.pear_id, 'quantity': 1},
+        {'product_id': store.apple_id, 'quantity': 3},
+    ])
+
+    assert response.status_code == 201
+    sale = response.get_json()
+    assert sorted((detail['product_id'], detail['quantity']) for detail in sale['details']) == [
+        (store.apple_id, 5), (store.pear_id, 1)
+    ]
+    assert Decimal(str(sale['total'])) == Decimal('9.75')
+    assert stock(store.apple_id, store.pear_id) == [5, 4]
+
+def test_oversell_is_rejected_without_touching_any_stock(client, store):
+    response = checkout(client, store, [
+        {'product_id': store.apple_id, 'quantity': 2},
+        {'product_id': store.pear_id, 'quantity': 6},
+    ])
+
+    assert response.status_code == 409
+    assert str(store.pear_id) in response.get_json()['error']
+    # La manzana sí tenía stock: su descuento también se deshace
+    assert stock(store.apple_id, store.pear_id) == [10, 5]
+    assert Sale.query.count() == 0
+
+def test_missing_product_rolls_back_the_sale(client, store):
+    response = checkout(client, store, [
+        {'product_id': store.apple_id, 'quantity': 2},
+        {'product_id': 9999, 'quantity': 1},
+    ])
+
+    assert response.status_code == 404
+    assert '9999' in response.get_json()['error']
+    assert stock(store.apple_id) == [10]
+    assert Sale.query.count() == 0
+
+def test_cancel_restocks_and_reverses_the_daily_summary(client, store):
+    sale = checkout(client, store, [
+        {'product_id': store.apple_id, 'quantity': 4},
+        {'product_id': store.pear_id, 'quantity': 2},
+    ]).get_json()
+    summary = DailySalesSummary.query.one()
+    assert (summary.sales_count, summary.revenue) == (1, Decimal('10.50'))
+
+    response = client.post(f"/fruteria/v1/sales/{sale['id']}/cancel")
+
+    assert response.status_code == 200
+    assert response.get_json()['status'] == 'cancelled'
+    assert stock(store.apple_id, store.pear_id) == [10, 5]
+    summary = DailySalesSummary.query.one()
+    assert (summary.sales_count, summary.revenue) == (0, Decimal('0'))
+    # Una venta cancelada no se vuelve a cancelar ni repone stock otra vez
+    assert client.post(f"/fruteria/v1/sales/{sale['id']}/cancel").status_code == 409
+    assert stock(store.apple_id, store.pear_id) == [10, 5]
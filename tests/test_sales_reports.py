@@ -0,0 +1,36 @@
+from conftest import checkout
+
+TOP_PRODUCTS = '/fruteria/v1/reports/products/top'
+
+def top_products(client, **args):
+    response = client.get(TOP_PRODUCTS, query_string=args)
+    assert response.status_code == 200
+    return [(row['name'], row['units']) for row in response.get_json()]
+
+def test_top_products_are_recomputed_after_a_sale(client, store):
+    checkout(client, store, [{'product_id': store.pear_id, 'quantity': 3}])
+    assert top_products(client) == [('Pera', 3)]
+
+    checkout(client, store, [{'product_id': store.apple_id, 'quantity': 4}])
+    assert top_products(client) == [('Manzana roja', 4), ('Pera', 3)]
+    # 3 peras suman 6.75 y 4 manzanas 6.00
+    assert top_products(client, by='revenue') == [('Pera', 3), ('Manzana roja', 4)]
+
+def test_reports_follow_a_product_or_category_rename(client, store):
+    checkout(client, store, [{'product_id': store.apple_id, 'quantity': 1}])
+    assert top_products(client) == [('Manzana roja', 1)]
+    assert client.get('/fruteria/v1/reports/categories/revenue').get_json()[0]['name'] == 'Frutas'
+
+    client.patch(f'/fruteria/v1/products/{store.apple_id}', json={'name': 'Manzana verde'})
+    client.put(f'/fruteria/v1/categories/{store.category_id}', json={'name': 'Frutas frescas'})
+
+    assert top_products(client) == [('Manzana verde', 1)]
+    assert client.get('/fruteria/v1/reports/categories/revenue').get_json()[0]['name'] == 'Frutas frescas'
+
+def test_a_cancelled_sale_leaves_the_reports(client, store):
+    sale = checkout(client, store, [{'product_id': store.pear_id, 'quantity': 2}]).get_json()
+    assert top_products(client) == [('Pera', 2)]
+
+    client.post(f"/fruteria/v1/sales/{sale['id']}/cancel")
+
+    assert top_products(client) == []
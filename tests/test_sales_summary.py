@@ -0,0 +1,40 @@
+from decimal import Decimal
+from src import db
+from src.models import DailySalesSummary
+from src.services.report_service import rebuild_daily_sales_summary
+from conftest import checkout
+
+def summary_rows():
+    db.session.expire_all()
+    return [
+        (row.day, row.payment_id, row.user_id, row.sales_count, row.revenue)
+        for row in DailySalesSummary.query.order_by(DailySalesSummary.day)
+    ]
+
+def test_sales_of_the_same_day_update_one_summary_row(client, store):
+    checkout(client, store, [{'product_id': store.apple_id, 'quantity': 2}])
+    checkout(client, store, [{'product_id': store.pear_id, 'quantity': 1}])
+
+    [(day, payment_id, user_id, sales_count, revenue)] = summary_rows()
+    assert (payment_id, user_id, sales_count, revenue) == (store.payment_id, store.user_id, 2, Decimal('5.25'))
+
+    response = client.get('/fruteria/v1/reports/sales/daily')
+    assert response.status_code == 200
+    [report] = response.get_json()
+    assert (report['sales_count'], report['revenue']) == (2, 5.25)
+
+def test_rebuild_matches_the_incremental_summary(client, store):
+    sales = [
+        checkout(client, store, [{'product_id': store.apple_id, 'quantity': quantity}]).get_json()
+        for quantity in (1, 2, 3)
+    ]
+    client.post(f"/fruteria/v1/sales/{sales[1]['id']}/cancel")
+    incremental = summary_rows()
+
+    db.session.query(DailySalesSummary).delete()
+    db.session.commit()
+    assert rebuild_daily_sales_summary() == 1
+
+    # Solo cuentan las ventas completadas: la cancelada no entra en la reconstrucción
+    assert summary_rows() == incremental
+    assert incremental[0][3:] == (2, Decimal('6.00'))
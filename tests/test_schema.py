@@ -0,0 +1,23 @@
+from sqlalchemy import inspect, text
+from src import db
+from src.utils.schema import upgrade_schema
+
+def test_upgrade_schema_skips_unique_index_with_duplicates(app, caplog):
+    with db.engine.begin() as connection:
+        # Base de una versión anterior: sin el índice único y con nombres repetidos
+        connection.execute(text('DROP INDEX uq_suppliers_name'))
+        connection.execute(text('CREATE INDEX ix_suppliers_name ON suppliers (name)'))
+        connection.execute(text(
+            "INSERT INTO suppliers (name, phone, email, address, nit) VALUES "
+            "('Proveedor A', '1', 'a@a.com', 'Calle 1', '9000000001'), "
+            "('Proveedor A', '2', 'b@b.com', 'Calle 2', '9000000002')"
+        ))
+
+    created = upgrade_schema()
+
+    indexes = {index['name'] for index in inspect(db.engine).get_indexes('suppliers')}
+    assert 'uq_suppliers_name' not in created
+    assert 'uq_suppliers_name' not in indexes
+    # El índice anterior se conserva mientras no se pueda crear el que lo reemplaza
+    assert 'ix_suppliers_name' in indexes
+    assert "'Proveedor A' (ids 1,2)" in caplog.text
@@ -0,0 +1,43 @@
+from sqlalchemy import create_engine, event, text
+from src import db
+from conftest import checkout
+
+def suggest(client, q):
+    response = client.get(f'/fruteria/v1/products/suggest?q={q}')
+    assert response.status_code == 200
+    return response.get_json()['data']
+
+def test_suggest_shows_the_stock_left_after_a_sale_without_reloading(client, store):
+    assert suggest(client, 'pera')[0]['stock'] == 5
+
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(db.engine, 'before_cursor_execute', listener)
+    try:
+        assert checkout(client, store, [{'product_id': store.pear_id, 'quantity': 2}]).status_code == 201
+        assert suggest(client, 'pera')[0]['stock'] == 3
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', listener)
+    # Solo la consulta de la venta lee productos: el índice se actualiza con esas filas
+    assert len([statement for statement in statements if 'FROM products' in statement]) == 1
+
+def test_suggest_follows_a_rename(client, store):
+    assert suggest(client, 'manz')[0]['name'] == 'Manzana roja'
+
+    response = client.patch(f'/fruteria/v1/products/{store.apple_id}', json={'name': 'Manzana verde'})
+    assert response.status_code == 200
+
+    assert [item['name'] for item in suggest(client, 'verde')] == ['Manzana verde']
+    assert suggest(client, 'roja') == []
+
+def test_suggest_sees_writes_from_another_process(app, client, store):
+    assert suggest(client, 'pera')[0]['stock'] == 5
+
+    # Otro proceso: su propia conexión, que cambia el stock y la versión del catálogo
+    other = create_engine(app.config['SQLALCHEMY_DATABASE_URI'])
+    with other.begin() as connection:
+        connection.execute(text('UPDATE products SET stock = 1 WHERE product_id = :id'), {'id': store.pear_id})
+        connection.execute(text('UPDATE catalog_version SET version = version + 1'))
+    other.dispose()
+
+    assert suggest(client, 'pera')[0]['stock'] == 1
@@ -0,0 +1,27 @@
+import pytest
+from src.models import Supplier
+
+SUPPLIER = {
+    'name': 'Proveedor A',
+    'phone': '3001234567',
+    'nit': '9001234567',
+    'email': 'ventas@proveedora.com',
+    'address': 'Calle 1 #2-3',
+}
+
+@pytest.mark.parametrize('nit', [None, '', '   '])
+def test_create_supplier_requires_nit(client, nit):
+    response = client.post('/fruteria/v1/suppliers', json={**SUPPLIER, 'nit': nit})
+    assert response.status_code == 400
+    assert Supplier.query.count() == 0
+
+def test_update_supplier_without_nit_keeps_it(client):
+    supplier_id = client.post('/fruteria/v1/suppliers', json=SUPPLIER).get_json()['id']
+    response = client.patch(f'/fruteria/v1/suppliers/{supplier_id}', json={'phone': '3007654321'})
+    assert response.status_code == 200
+    assert response.get_json()['nit'] == SUPPLIER['nit']
+
+def test_update_supplier_rejects_null_nit(client):
+    supplier_id = client.post('/fruteria/v1/suppliers', json=SUPPLIER).get_json()['id']
+    response = client.patch(f'/fruteria/v1/suppliers/{supplier_id}', json={'nit': None})
+    assert response.status_code == 400
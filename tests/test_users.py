@@ -0,0 +1,45 @@
+from sqlalchemy import create_engine
+from src.models import User
+from src.services import user_service
+from src.services.user_service import create_user, USERNAME_MAX_LENGTH
+from conftest import PASSWORD
+
+def new_user(store, email):
+    return create_user('Ana', 'Gómez', email, PASSWORD, 1)
+
+def test_usernames_get_the_next_suffix(store):
+    assert new_user(store, 'ana1@fruteria.com').username == 'ana.gómez'
+    assert new_user(store, 'ana2@fruteria.com').username == 'ana.gómez.1'
+    assert new_user(store, 'ana3@fruteria.com').username == 'ana.gómez.2'
+
+def test_long_names_fit_the_username_column(store):
+    names = ('María Fernanda', 'Rodríguez Castellanos')
+    first = create_user(*names, 'mf1@fruteria.com', PASSWORD, 1)
+    second = create_user(*names, 'mf2@fruteria.com', PASSWORD, 1)
+    assert len(first.username) == USERNAME_MAX_LENGTH
+    assert len(second.username) <= USERNAME_MAX_LENGTH
+    assert second.username.endswith('.1')
+    assert create_user(*names, 'mf3@fruteria.com', PASSWORD, 1).username.endswith('.2')
+
+def test_a_concurrent_create_with_the_same_username_retries(app, store, monkeypatch):
+    allocate = user_service.allocate_username
+    calls = []
+
+    def allocate_and_lose_the_race(name, last_name):
+        username = allocate(name, last_name)
+        if not calls:
+            # Otro proceso confirma el mismo nombre de usuario antes que esta petición
+            other = create_engine(app.config['SQLALCHEMY_DATABASE_URI'])
+            with other.begin() as connection:
+                connection.execute(User.__table__.insert().values(
+                    username=username, password='x', name='Ana', last_name='Gómez',
+                    email='otra@fruteria.com', role_id=1
+                ))
+            other.dispose()
+        calls.append(username)
+        return username
+
+    monkeypatch.setattr(user_service, 'allocate_username', allocate_and_lose_the_race)
+    user = new_user(store, 'ana@fruteria.com')
+    assert calls == ['ana.gómez', 'ana.gómez.1']
+    assert user.username == 'ana.gómez.1'